@@ -0,0 +1,86 @@
+"""create table outbox (transactional outbox events)
+
+Revision ID: 3b7e91c4d2a5
+Revises: 8c2d4e6f1a3b
+Create Date: 2026-10-19 11:02:17.503114
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e91c4d2a5"
+down_revision: str | None = "8c2d4e6f1a3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox",
+        sa.Column(
+            "id",
+            sa.BigInteger(),
+            autoincrement=True,
+            nullable=False,
+            comment="이벤트 ID",
+        ),
+        sa.Column(
+            "event_type",
+            sa.String(length=100),
+            nullable=False,
+            comment="이벤트 종류 (예: treatment.created)",
+        ),
+        sa.Column(
+            "aggregate_type",
+            sa.String(length=50),
+            nullable=False,
+            comment="도메인 (treatment, phonebook, shop)",
+        ),
+        sa.Column(
+            "aggregate_id",
+            sa.Integer(),
+            nullable=False,
+            comment="도메인 객체 ID",
+        ),
+        sa.Column("shop_id", sa.Integer(), nullable=True, comment="샵 ID"),
+        sa.Column("payload", sa.JSON(), nullable=False, comment="이벤트 데이터"),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="발행 시도 횟수",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="생성일시",
+        ),
+        sa.Column(
+            "published_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="발행일시 (NULL이면 미발행)",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        comment="트랜잭션 아웃박스 (쓰기 부수효과 이벤트) 테이블",
+    )
+    op.create_index(
+        "idx_outbox_published_id",
+        "outbox",
+        ["published_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_outbox_published_id", table_name="outbox")
+    op.drop_table("outbox")
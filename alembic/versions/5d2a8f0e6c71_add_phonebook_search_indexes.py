@@ -0,0 +1,53 @@
+"""add phonebook phone_digits column and ngram fulltext index
+
+Revision ID: 5d2a8f0e6c71
+Revises: 3b7e91c4d2a5
+Create Date: 2026-10-19 11:48:05.271930
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2a8f0e6c71"
+down_revision: str | None = "3b7e91c4d2a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "phonebook",
+        sa.Column(
+            "phone_digits",
+            sa.String(length=20),
+            sa.Computed("REPLACE(phone_number, '-', '')", persisted=True),
+            comment="숫자만 남긴 전화번호 (검색용, 자동 생성)",
+        ),
+    )
+    op.create_index(
+        "idx_shop_deleted_digits",
+        "phonebook",
+        ["shop_id", "deleted_at", "phone_digits"],
+        unique=False,
+    )
+    op.create_index(
+        "ftx_phonebook_name_group_memo",
+        "phonebook",
+        ["name", "group_name", "memo"],
+        unique=False,
+        mysql_prefix="FULLTEXT",
+        mysql_with_parser="ngram",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ftx_phonebook_name_group_memo", table_name="phonebook")
+    op.drop_index("idx_shop_deleted_digits", table_name="phonebook")
+    op.drop_column("phonebook", "phone_digits")
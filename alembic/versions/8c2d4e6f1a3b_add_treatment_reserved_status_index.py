@@ -0,0 +1,32 @@
+"""add treatment (reserved_at, status) index for reservation reminders
+
+Revision ID: 8c2d4e6f1a3b
+Revises: 1e1480804309
+Create Date: 2026-10-19 10:12:41.118204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2d4e6f1a3b"
+down_revision: str | None = "1e1480804309"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_treatment_reserved_status",
+        "treatment",
+        ["reserved_at", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_treatment_reserved_status", table_name="treatment")
@@ -0,0 +1,57 @@
+"""add phonebook live_marker column and unique (shop_id, phone_digits, live_marker)
+
+Revision ID: a4c6e2b9f817
+Revises: 5d2a8f0e6c71
+Create Date: 2026-10-19 13:41:52.640217
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4c6e2b9f817"
+down_revision: str | None = "5d2a8f0e6c71"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 중복(하이픈 유무만 다른 번호 포함)은 가장 먼저 등록된 행만 남기고 소프트 삭제
+    op.execute(
+        """
+        UPDATE phonebook AS p
+        JOIN phonebook AS keep
+          ON keep.shop_id = p.shop_id
+         AND keep.phone_digits = p.phone_digits
+         AND keep.deleted_at IS NULL
+         AND keep.id < p.id
+        SET p.deleted_at = UTC_TIMESTAMP()
+        WHERE p.deleted_at IS NULL
+        """,
+    )
+    op.add_column(
+        "phonebook",
+        sa.Column(
+            "live_marker",
+            sa.SmallInteger(),
+            sa.Computed("IF(deleted_at IS NULL, 1, NULL)", persisted=True),
+            comment="미삭제 행 표시 (1 또는 NULL, 유일 인덱스용 자동 생성)",
+        ),
+    )
+    op.create_index(
+        "uq_phonebook_shop_digits_live",
+        "phonebook",
+        ["shop_id", "phone_digits", "live_marker"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_phonebook_shop_digits_live", table_name="phonebook")
+    op.drop_column("phonebook", "live_marker")
@@ -0,0 +1,32 @@
+"""add treatment (shop_id, phonebook_id, reserved_at) index for customer timeline
+
+Revision ID: c7f1d3a9e254
+Revises: a4c6e2b9f817
+Create Date: 2026-10-19 14:02:37.512946
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7f1d3a9e254"
+down_revision: str | None = "a4c6e2b9f817"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_treatment_shop_phonebook_reserved",
+        "treatment",
+        ["shop_id", "phonebook_id", "reserved_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_treatment_shop_phonebook_reserved", table_name="treatment")
@@ -0,0 +1,54 @@
+"""add phonebook / treatment_menu list sort indexes
+
+Revision ID: e2b8c4f6a913
+Revises: c7f1d3a9e254
+Create Date: 2026-10-19 14:41:09.836152
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b8c4f6a913"
+down_revision: str | None = "c7f1d3a9e254"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_shop_deleted_id",
+        "phonebook",
+        ["shop_id", "deleted_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_shop_deleted_group_name",
+        "phonebook",
+        ["shop_id", "deleted_at", "group_name", "name"],
+        unique=False,
+    )
+    # (shop_id, deleted_at, group_name)은 위 인덱스의 앞부분이라 중복
+    op.drop_index("idx_shop_deleted_group", table_name="phonebook")
+    op.create_index(
+        "idx_treatment_menu_shop_deleted_id",
+        "treatment_menu",
+        ["shop_id", "deleted_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_treatment_menu_shop_deleted_id", table_name="treatment_menu")
+    op.create_index(
+        "idx_shop_deleted_group",
+        "phonebook",
+        ["shop_id", "deleted_at", "group_name"],
+        unique=False,
+    )
+    op.drop_index("idx_shop_deleted_group_name", table_name="phonebook")
+    op.drop_index("idx_shop_deleted_id", table_name="phonebook")
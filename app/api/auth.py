@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
@@ -9,6 +10,7 @@ from app.docs.common_responses import COMMON_ERROR_RESPONSES
 from app.schemas.auth import LoginResponse
 from app.services.auth_service import (
     authenticate_user_service,
+    check_login_rate_limit_service,
     generate_tokens,
     logout_user,
     refresh_access_token,
@@ -29,14 +31,25 @@ router = APIRouter(prefix="/auth", tags=["인증"])
         status.HTTP_401_UNAUTHORIZED: COMMON_ERROR_RESPONSES[
             status.HTTP_401_UNAUTHORIZED
         ],
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": (
+                "IP/이메일별 로그인 시도 한도 초과 또는 비밀번호 검증 대기열 포화 "
+                "(Retry-After 참고)"
+            ),
+        },
     },
 )
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ) -> JSONResponse:
-    user = authenticate_user_service(db, form_data.username, form_data.password)
-    access_token, refresh_token = generate_tokens(user)
+    # 프록시 뒤에서는 uvicorn --proxy-headers 가 신뢰된 프록시(FORWARDED_ALLOW_IPS)의
+    # X-Forwarded-For 로 실제 클라이언트 IP를 채워 준다
+    client_ip = request.client.host if request.client else "unknown"
+    await check_login_rate_limit_service(client_ip, form_data.username)
+    user = await authenticate_user_service(db, form_data.username, form_data.password)
+    access_token, refresh_token = await run_in_threadpool(generate_tokens, user)
 
     response_data = LoginResponse(
         access_token=access_token,
@@ -89,7 +102,10 @@ def refresh_token_handler(
 @router.post(
     "/logout",
     summary="사용자 로그아웃",
-    description="로그아웃 시 쿠키 제거 및 레디스에서 리프레시 토큰 삭제",
+    description=(
+        "로그아웃 시 쿠키 제거 및 이 기기의 리프레시 토큰 세션만 폐기 "
+        "(다른 기기 로그인 유지)"
+    ),
     status_code=status.HTTP_200_OK,
 )
 def logout(request: Request) -> JSONResponse:
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
@@ -7,22 +8,35 @@ from app.dependencies.shop import get_current_shop
 from app.docs.common_responses import COMMON_ERROR_RESPONSES
 from app.models.shop import Shop
 from app.schemas.phonebook import (
+    DuplicateCheckBatchRequest,
+    DuplicateCheckBatchResponse,
     DuplicateCheckResponse,
     PhonebookCreate,
     PhonebookFilter,
     PhonebookGroupedByGroupnameResponse,
+    PhonebookImportResponse,
+    PhonebookMergeRequest,
+    PhonebookMergeResponse,
     PhonebookResponse,
+    PhonebookSuggestItem,
     PhonebookUpdate,
 )
+from app.schemas.treatment import CustomerTimelineResponse
+from app.services.phonebook_import_service import import_phonebook_service
 from app.services.phonebook_service import (
     check_duplicate_phone_number_service,
+    check_duplicate_phone_numbers_service,
     create_phonebook_service,
     delete_phonebook_service,
+    get_customer_timeline_service,
     get_grouped_by_groupname_service,
     get_phonebook_list_service,
     get_phonebook_service,
+    merge_phonebooks_service,
+    stream_grouped_by_groupname_service,
     update_phonebook_service,
 )
+from app.services.phonebook_suggest_service import suggest_phonebook_service
 
 router = APIRouter(prefix="/phonebooks", tags=["전화번호부"])
 
@@ -52,19 +66,23 @@ def list_phonebook(
     "/groups",
     response_model=list[PhonebookGroupedByGroupnameResponse],
     summary="전화번호부 그룹 목록 조회",
-    description="전화번호부 그룹 목록을 조회합니다.",
+    description=(
+        "전화번호부 그룹 목록을 조회합니다. "
+        "`with_items=true`이면 그룹명 순으로 항목을 포함해 스트리밍 응답합니다."
+    ),
     status_code=status.HTTP_200_OK,
 )
 def list_groups_by_group_name(
     db: Session = Depends(get_db),
     current_shop: Shop = Depends(get_current_shop),
     with_items: bool = Query(False, description="전화번호부 항목 포함 여부"),
-) -> list[PhonebookGroupedByGroupnameResponse]:
-    return get_grouped_by_groupname_service(
-        db,
-        with_items=with_items,
-        current_shop=current_shop,
-    )
+) -> list[PhonebookGroupedByGroupnameResponse] | StreamingResponse:
+    if with_items:
+        return StreamingResponse(
+            stream_grouped_by_groupname_service(current_shop.id),
+            media_type="application/json",
+        )
+    return get_grouped_by_groupname_service(db, current_shop=current_shop)
 
 
 # 이미 전화번호부에 등록된 번호인지 확인
@@ -83,6 +101,47 @@ def check_duplicate_phone_number(
     return check_duplicate_phone_number_service(db, current_shop, phone_number)
 
 
+# 고객 자동완성 (예약 폼)
+@router.get(
+    "/suggest",
+    response_model=list[PhonebookSuggestItem],
+    summary="전화번호부 자동완성",
+    description=(
+        "이름 앞글자, 성을 뺀 이름, 초성(예: `ㄱㅁㅅ`), "
+        "전화번호 앞자리(0으로 시작) 또는 뒷자리로 고객을 찾습니다. "
+        "페이지네이션/COUNT 없이 id, 이름, 전화번호만 반환합니다."
+    ),
+    status_code=status.HTTP_200_OK,
+)
+def suggest_phonebook(
+    q: str = Query(..., min_length=1, max_length=50, description="검색어"),
+    limit: int = Query(10, ge=1, le=20, description="최대 결과 수"),
+    db: Session = Depends(get_db),
+    current_shop: Shop = Depends(get_current_shop),
+) -> list[PhonebookSuggestItem]:
+    return suggest_phonebook_service(db, current_shop, q, limit)
+
+
+# 여러 번호를 한 번에 중복 확인 (주소록 동기화)
+@router.post(
+    "/check-duplicates",
+    status_code=status.HTTP_200_OK,
+    response_model=DuplicateCheckBatchResponse,
+    summary="전화번호부 중복 일괄 확인",
+    description=(
+        "최대 1000개의 전화번호를 한 번에 확인합니다. "
+        "요청한 번호 그대로를 키로, "
+        "이미 등록된 전화번호부 ID(없으면 null)를 반환합니다."
+    ),
+)
+def check_duplicate_phone_numbers(
+    data: DuplicateCheckBatchRequest,
+    db: Session = Depends(get_db),
+    current_shop: Shop = Depends(get_current_shop),
+) -> DuplicateCheckBatchResponse:
+    return check_duplicate_phone_numbers_service(db, current_shop, data)
+
+
 # 전화번호부 상세 조회
 @router.get(
     "/{phonebook_id}",
@@ -102,6 +161,37 @@ def read_phonebook_handler(
     return get_phonebook_service(db, current_shop, phonebook_id)
 
 
+# 고객 타임라인 (예약 이력 + 누적 집계)
+@router.get(
+    "/{phonebook_id}/timeline",
+    response_model=CustomerTimelineResponse,
+    summary="고객 타임라인 조회",
+    description=(
+        "고객의 예약을 최신순으로 조회합니다. "
+        "다음 페이지는 응답의 `next_cursor`를 `cursor`로 전달합니다. "
+        "첫 페이지에는 누적 예약수, 노쇼, 결제/외상 금액 등 고객 집계가 포함됩니다."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_404_NOT_FOUND: COMMON_ERROR_RESPONSES[status.HTTP_404_NOT_FOUND],
+    },
+)
+def read_customer_timeline_handler(
+    phonebook_id: int,
+    cursor: str | None = Query(None, description="다음 페이지 커서"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    db: Session = Depends(get_db),
+    current_shop: Shop = Depends(get_current_shop),
+) -> CustomerTimelineResponse:
+    return get_customer_timeline_service(
+        db,
+        phonebook_id,
+        current_shop,
+        cursor=cursor,
+        limit=limit,
+    )
+
+
 # 전화번호부 생성
 @router.post(
     "",
@@ -121,6 +211,56 @@ def create_phonebook_handler(
     return create_phonebook_service(db, phonebook, current_shop)
 
 
+# 전화번호부 가져오기 (CSV/vCard)
+@router.post(
+    "/import",
+    response_model=PhonebookImportResponse,
+    summary="전화번호부 가져오기",
+    description=(
+        "CSV 또는 vCard(.vcf) 파일의 연락처를 한 번에 등록합니다.\n\n"
+        "- CSV 헤더: 이름(이름/성명/name), 전화번호(전화번호/휴대폰/연락처/phone), "
+        "그룹(그룹/그룹명/group, 선택), 메모(메모/비고/memo, 선택)\n"
+        "- 인코딩: UTF-8 또는 CP949(엑셀 기본)\n"
+        "- 이미 등록된 번호와 파일 내 중복 번호는 건너뛰고 행별 결과로 알려줍니다."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: COMMON_ERROR_RESPONSES[
+            status.HTTP_400_BAD_REQUEST
+        ],
+    },
+)
+def import_phonebook_handler(
+    file: UploadFile = File(..., description="CSV 또는 vCard 파일"),
+    db: Session = Depends(get_db),
+    current_shop: Shop = Depends(get_current_shop),
+) -> PhonebookImportResponse:
+    return import_phonebook_service(db, current_shop, file.file, file.filename)
+
+
+# 중복 전화번호부 병합
+@router.post(
+    "/{phonebook_id}/merge",
+    response_model=PhonebookMergeResponse,
+    summary="전화번호부 병합",
+    description=(
+        "source_ids의 전화번호부를 이 전화번호부로 병합합니다. "
+        "병합 대상의 예약은 이 고객으로 옮겨지고, 병합 대상은 삭제됩니다."
+    ),
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_404_NOT_FOUND: COMMON_ERROR_RESPONSES[status.HTTP_404_NOT_FOUND],
+    },
+)
+def merge_phonebooks_handler(
+    phonebook_id: int,
+    data: PhonebookMergeRequest,
+    db: Session = Depends(get_db),
+    current_shop: Shop = Depends(get_current_shop),
+) -> PhonebookMergeResponse:
+    return merge_phonebooks_service(db, phonebook_id, data, current_shop)
+
+
 # 전화번호부 수정
 @router.put(
     "/{phonebook_id}",
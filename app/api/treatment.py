@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
@@ -13,6 +14,7 @@ from app.schemas.treatment import (
     TreatmentSimpleResponse,
     TreatmentUpdate,
 )
+from app.services.schedule_service import stream_schedule_events_service
 from app.services.treatment_service import (
     get_treatment_list_service,
     upsert_treatment_service,
@@ -40,6 +42,35 @@ def list_treatments_api(
     )
 
 
+@router.get(
+    "/stream",
+    summary="실시간 예약 보드 (SSE)",
+    description=(
+        "선택된 샵의 예약 생성/수정/상태 변경을 Server-Sent Events로 전달합니다.\n\n"
+        "- `ready`: 연결 직후 1회 → 이때 목록을 한 번 조회\n"
+        "- `treatment.created`: 새 예약 (보드 표시 필드 전체)\n"
+        "- `treatment.updated` / `treatment.status_changed`: `id` + 변경된 필드만\n"
+        "- `resync`: 이벤트 유실 가능성 → 목록 재조회\n"
+        "- `: ping` 주석 프레임: 하트비트"
+    ),
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stream_treatments_api(
+    request: Request,
+    current_shop: Shop = Depends(get_current_shop),
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_schedule_events_service(request, current_shop),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # nginx 프록시 버퍼링 해제 (이벤트 즉시 전달)
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "",
     response_model=TreatmentSimpleResponse,
@@ -51,11 +51,11 @@ def read_user_handler(
         status.HTTP_409_CONFLICT: COMMON_ERROR_RESPONSES[status.HTTP_409_CONFLICT],
     },
 )
-def create_user_handler(
+async def create_user_handler(
     user: UserCreate,
     db: Session = Depends(get_db),
 ) -> UserResponse:
-    return create_user_service(db, user)
+    return await create_user_service(db, user)
 
 
 @router.put(
@@ -12,3 +12,86 @@ REFRESH_TOKEN_EXPIRE_SECONDS = int(os.getenv("REFRESH_TOKEN_EXPIRE_SECONDS"))
 APP_ENV = os.getenv("APP_ENV", "local")
 SENTRY_DSN = os.getenv("SENTRY_DSN")
 FERNET_KEY = os.getenv("FERNET_KEY")
+
+# 예약 리마인더 설정
+RESERVATION_REMINDER_MINUTES = int(os.getenv("RESERVATION_REMINDER_MINUTES", "30"))
+RESERVATION_REMINDER_BATCH_SIZE = int(
+    os.getenv("RESERVATION_REMINDER_BATCH_SIZE", "500"),
+)
+
+# 푸시 전송 설정 (firebase | fake)
+PUSH_TRANSPORT = os.getenv("PUSH_TRANSPORT", "firebase")
+FAKE_PUSH_LATENCY_MS = float(os.getenv("FAKE_PUSH_LATENCY_MS", "0"))
+FAKE_PUSH_FAILURE_RATE = float(os.getenv("FAKE_PUSH_FAILURE_RATE", "0"))
+FAKE_PUSH_INVALID_RATE = float(os.getenv("FAKE_PUSH_INVALID_RATE", "0"))
+
+# 트랜잭션 아웃박스 릴레이 설정
+OUTBOX_RELAY_BATCH_SIZE = int(os.getenv("OUTBOX_RELAY_BATCH_SIZE", "200"))
+OUTBOX_RELAY_MAX_BATCHES = int(os.getenv("OUTBOX_RELAY_MAX_BATCHES", "10"))
+OUTBOX_RETENTION_DAYS = int(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+
+# 실시간 예약 보드(SSE) 설정
+SCHEDULE_STREAM_HEARTBEAT_SECONDS = float(
+    os.getenv("SCHEDULE_STREAM_HEARTBEAT_SECONDS", "15"),
+)
+SCHEDULE_STREAM_QUEUE_SIZE = int(os.getenv("SCHEDULE_STREAM_QUEUE_SIZE", "100"))
+
+# 전화번호부 자동완성 인덱스 설정 (프로세스당 캐시 샵 수 / 최대 유지 시간)
+PHONEBOOK_SUGGEST_MAX_SHOPS = int(os.getenv("PHONEBOOK_SUGGEST_MAX_SHOPS", "200"))
+PHONEBOOK_SUGGEST_MAX_AGE_SECONDS = int(
+    os.getenv("PHONEBOOK_SUGGEST_MAX_AGE_SECONDS", "600"),
+)
+
+# 전화번호부 가져오기(CSV/vCard) 설정
+PHONEBOOK_IMPORT_BATCH_SIZE = int(os.getenv("PHONEBOOK_IMPORT_BATCH_SIZE", "500"))
+PHONEBOOK_IMPORT_MAX_ROWS = int(os.getenv("PHONEBOOK_IMPORT_MAX_ROWS", "20000"))
+
+# 예약 고객 ↔ 전화번호부 연결 백필 배치 크기 (고객 전화번호 수)
+CUSTOMER_BACKFILL_BATCH_SIZE = int(os.getenv("CUSTOMER_BACKFILL_BATCH_SIZE", "500"))
+
+# 사용자 정보 워커 로컬 캐시 (Redis 앞단, pub/sub으로 무효화)
+USER_LOCAL_CACHE_TTL_SECONDS = float(os.getenv("USER_LOCAL_CACHE_TTL_SECONDS", "60"))
+USER_LOCAL_CACHE_MAX_SIZE = int(os.getenv("USER_LOCAL_CACHE_MAX_SIZE", "10000"))
+
+# 샵 정보 워커 로컬 캐시 (get_current_shop, pub/sub으로 무효화)
+SHOP_LOCAL_CACHE_TTL_SECONDS = float(os.getenv("SHOP_LOCAL_CACHE_TTL_SECONDS", "300"))
+SHOP_LOCAL_CACHE_MAX_SIZE = int(os.getenv("SHOP_LOCAL_CACHE_MAX_SIZE", "5000"))
+
+# 비밀번호 해시(bcrypt) 전용 스레드 풀 (동시 실행 수 / 실행+대기 최대 수 / 경고(ms))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+PASSWORD_HASH_QUEUE_WARN_MS = float(os.getenv("PASSWORD_HASH_QUEUE_WARN_MS", "500"))
+
+# JWT 검증 완료 토큰 워커 로컬 캐시 크기 (0이면 사용 안 함)
+JWT_CACHE_MAX_SIZE = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
+
+# 사용자당 리프레시 토큰 패밀리(로그인 기기) 최대 개수 (초과 시 만료가 이른 것부터 제거)
+REFRESH_TOKEN_MAX_FAMILIES = int(os.getenv("REFRESH_TOKEN_MAX_FAMILIES", "10"))
+# 교체 직후 직전 리프레시 토큰을 허용하는 시간(초) (동시 갱신 요청/탭 대비)
+REFRESH_TOKEN_REUSE_GRACE_SECONDS = int(
+    os.getenv("REFRESH_TOKEN_REUSE_GRACE_SECONDS", "30"),
+)
+
+# 로그인 시도 제한 (슬라이딩 윈도우(초) / 윈도우당 IP별·이메일별 최대 시도 수)
+LOGIN_RATE_WINDOW_SECONDS = int(os.getenv("LOGIN_RATE_WINDOW_SECONDS", "300"))
+LOGIN_RATE_LIMIT_PER_IP = int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", "100"))
+LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", "10"))
+
+# 샵별 API 요청 제한 (토큰 버킷: 순간 최대 요청 수 / 분당 충전 수, 요청 분류별)
+SHOP_RATE_DEFAULT_BURST = int(os.getenv("SHOP_RATE_DEFAULT_BURST", "300"))
+SHOP_RATE_DEFAULT_PER_MINUTE = float(os.getenv("SHOP_RATE_DEFAULT_PER_MINUTE", "600"))
+SHOP_RATE_SEARCH_BURST = int(os.getenv("SHOP_RATE_SEARCH_BURST", "120"))
+SHOP_RATE_SEARCH_PER_MINUTE = float(os.getenv("SHOP_RATE_SEARCH_PER_MINUTE", "300"))
+SHOP_RATE_DASHBOARD_REFRESH_BURST = int(
+    os.getenv("SHOP_RATE_DASHBOARD_REFRESH_BURST", "3"),
+)
+SHOP_RATE_DASHBOARD_REFRESH_PER_MINUTE = float(
+    os.getenv("SHOP_RATE_DASHBOARD_REFRESH_PER_MINUTE", "6"),
+)
+SHOP_RATE_BULK_BURST = int(os.getenv("SHOP_RATE_BULK_BURST", "3"))
+SHOP_RATE_BULK_PER_MINUTE = float(os.getenv("SHOP_RATE_BULK_PER_MINUTE", "0.2"))
+
+# 대시보드 force_refresh 최소 간격 (캐시가 이 시간(초)보다 어리면 무시)
+DASHBOARD_FORCE_REFRESH_MIN_AGE_SECONDS = int(
+    os.getenv("DASHBOARD_FORCE_REFRESH_MIN_AGE_SECONDS", "30"),
+)
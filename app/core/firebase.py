@@ -1,9 +1,12 @@
 import logging
 import os
-from typing import Any
+import threading
+from typing import TYPE_CHECKING
 
-import firebase_admin
-from firebase_admin import credentials, messaging
+from app.core.push import MulticastResult, PushResult
+
+if TYPE_CHECKING:
+    from firebase_admin import App
 
 logger = logging.getLogger(__name__)
 
@@ -13,94 +16,126 @@ SERVICE_ACCOUNT_KEY_PATH = os.getenv(
     "firebase-service-account.json",
 )
 
-# Firebase 초기화
-try:
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(SERVICE_ACCOUNT_KEY_PATH)
-        firebase_admin.initialize_app(cred)
-        logger.info("Firebase Admin SDK initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize Firebase Admin SDK: {e}")
-
-
-def send_fcm_message(
-    token: str,
-    title: str,
-    body: str,
-    data: dict[str, str] | None = None,
-) -> dict[str, Any]:
-    """FCM 메시지를 전송합니다.
+_app: "App | None" = None
+_app_lock = threading.Lock()
 
-    Args:
-        token: FCM 디바이스 토큰
-        title: 푸시 알림 제목
-        body: 푸시 알림 내용
-        data: 추가 데이터 (선택사항)
 
-    Returns:
-        dict: 메시지 전송 결과
-
-    Raises:
-        Exception: 메시지 전송 실패 시
+def get_firebase_app() -> "App":
+    """Firebase Admin 앱을 반환 (최초 호출 시 SDK import 및 초기화).
 
+    import 시점에 초기화하면 푸시를 보내지 않는 API 워커/Celery 프로세스까지
+    Google SDK 로딩 비용을 치르므로, 실제 전송 직전에 한 번만 초기화한다.
     """
-    try:
+    global _app  # noqa: PLW0603
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                import firebase_admin
+                from firebase_admin import credentials
+
+                try:
+                    _app = firebase_admin.get_app()
+                except ValueError:
+                    cred = credentials.Certificate(SERVICE_ACCOUNT_KEY_PATH)
+                    _app = firebase_admin.initialize_app(cred)
+                    logger.info("Firebase Admin SDK initialized successfully")
+    return _app
+
+
+class FirebasePushTransport:
+    """Firebase Admin SDK(FCM)로 푸시를 전송하는 전송기."""
+
+    def send(
+        self,
+        token: str,
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> PushResult:
+        """단일 디바이스에 FCM 메시지를 전송합니다.
+
+        Args:
+            token: FCM 디바이스 토큰
+            title: 푸시 알림 제목
+            body: 푸시 알림 내용
+            data: 추가 데이터 (선택사항)
+
+        Returns:
+            PushResult: 전송 결과 (실패 시 error 코드 포함)
+
+        """
+        from firebase_admin import exceptions, messaging
+
+        app = get_firebase_app()
         message = messaging.Message(
-            notification=messaging.Notification(
-                title=title,
-                body=body,
-            ),
+            notification=messaging.Notification(title=title, body=body),
             data=data or {},
             token=token,
         )
-        response = messaging.send(message)
-        logger.info(f"FCM message sent successfully: {response}")
-        return {"success": True, "message_id": response}
-    except Exception as e:
-        logger.error(f"Failed to send FCM message: {e}")
-        raise
-
-
-def send_fcm_multicast(
-    tokens: list[str],
-    title: str,
-    body: str,
-    data: dict[str, str] | None = None,
-) -> dict[str, Any]:
-    """여러 디바이스에 FCM 메시지를 전송합니다.
-
-    Args:
-        tokens: FCM 디바이스 토큰 리스트
-        title: 푸시 알림 제목
-        body: 푸시 알림 내용
-        data: 추가 데이터 (선택사항)
-
-    Returns:
-        dict: 메시지 전송 결과
-
-    Raises:
-        Exception: 메시지 전송 실패 시
-
-    """
-    try:
+        try:
+            message_id = messaging.send(message, app=app)
+        except exceptions.FirebaseError as e:
+            logger.warning("Failed to send FCM message: %s", e)
+            return PushResult(token=token, success=False, error=_error_code(e))
+
+        logger.info("FCM message sent successfully: %s", message_id)
+        return PushResult(token=token, success=True, message_id=message_id)
+
+    def send_multicast(
+        self,
+        tokens: list[str],
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> MulticastResult:
+        """여러 디바이스에 FCM 메시지를 전송합니다 (최대 500개).
+
+        Args:
+            tokens: FCM 디바이스 토큰 리스트
+            title: 푸시 알림 제목
+            body: 푸시 알림 내용
+            data: 추가 데이터 (선택사항)
+
+        Returns:
+            MulticastResult: 토큰별 전송 결과
+
+        Raises:
+            FirebaseError: 요청 자체가 실패한 경우
+            ValueError, OSError: 서비스 계정 키로 초기화할 수 없는 경우
+
+        """
+        from firebase_admin import messaging
+
+        app = get_firebase_app()
         message = messaging.MulticastMessage(
-            notification=messaging.Notification(
-                title=title,
-                body=body,
-            ),
+            notification=messaging.Notification(title=title, body=body),
             data=data or {},
             tokens=tokens,
         )
-        response = messaging.send_multicast(message)
+        response = messaging.send_each_for_multicast(message, app=app)
         logger.info(
-            f"FCM multicast sent: {response.success_count} successful, "
-            f"{response.failure_count} failed",
+            "FCM multicast sent: %s successful, %s failed",
+            response.success_count,
+            response.failure_count,
+        )
+        return MulticastResult(
+            responses=[
+                PushResult(
+                    token=token,
+                    success=resp.success,
+                    message_id=resp.message_id,
+                    error=None if resp.success else _error_code(resp.exception),
+                )
+                for token, resp in zip(tokens, response.responses, strict=True)
+            ],
         )
-        return {
-            "success": True,
-            "success_count": response.success_count,
-            "failure_count": response.failure_count,
-        }
-    except Exception as e:
-        logger.error(f"Failed to send FCM multicast: {e}")
-        raise
+
+
+def _error_code(exc: Exception | None) -> str:
+    """FCM 에러를 전송기 공통 에러 코드로 변환."""
+    from firebase_admin import messaging
+
+    if isinstance(exc, messaging.UnregisteredError | messaging.SenderIdMismatchError):
+        return "UNREGISTERED"
+    code = getattr(exc, "code", None)
+    return str(code).upper() if code else "UNKNOWN"
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TypeVar
+
+from app.core.config import (
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_QUEUE_WARN_MS,
+    PASSWORD_HASH_WORKERS,
+)
+from app.core.security import hash_password, verify_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# 해시 풀 포화 시 재시도 안내 (Retry-After, 초) - 해시 1건이 수백 ms라 금방 빈다
+BUSY_RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHasherBusyError(Exception):
+    """대기 중인 해시 작업이 한도(max_pending)를 넘어 새 작업을 받을 수 없음."""
+
+
+@dataclass
+class PasswordHasherStats:
+    """해시 풀 누적 지표 (프로세스 단위)."""
+
+    submitted: int = 0
+    rejected: int = 0
+    completed: int = 0
+    pending: int = 0
+    queue_ms_total: float = 0.0
+    queue_ms_max: float = 0.0
+    run_ms_total: float = 0.0
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증 전용 스레드 풀.
+
+    bcrypt는 계산 중 GIL을 놓으므로 스레드로도 여러 코어를 쓴다.
+    API 스레드풀 대신 이 풀에서 실행해 로그인 폭주가 일반 요청을 굶기지 않게 하고,
+    실행+대기 작업이 max_pending을 넘으면 줄 세우지 않고 바로 거절한다.
+
+    Args:
+        max_workers: 동시에 실행할 해시 작업 수
+        max_pending: 실행 중 + 대기 중인 작업 최대 수
+        queue_warn_ms: 대기 시간이 이 값을 넘으면 경고 로그
+
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        queue_warn_ms: float = 0.0,
+    ) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="password-hash",
+        )
+        self._slots = threading.BoundedSemaphore(max(max_pending, max_workers))
+        self._queue_warn_ms = queue_warn_ms
+        self._lock = threading.Lock()
+        self._stats = PasswordHasherStats()
+
+    async def run(self, func: Callable[..., T], *args: object) -> T:
+        """func(*args)를 풀에서 실행하고 결과를 기다린다.
+
+        Raises:
+            PasswordHasherBusyError: 대기 작업이 한도를 넘은 경우
+
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats.rejected += 1
+            raise PasswordHasherBusyError
+
+        with self._lock:
+            self._stats.submitted += 1
+            self._stats.pending += 1
+        try:
+            submitted_at = time.perf_counter()
+            future = self._executor.submit(self._timed, func, submitted_at, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        # 요청이 취소돼도 작업이 끝날 때 슬롯을 반납
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return asdict(self._stats)
+
+    def _timed(self, func: Callable[..., T], submitted_at: float, *args: object) -> T:
+        started_at = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            queue_ms = (started_at - submitted_at) * 1000
+            run_ms = (time.perf_counter() - started_at) * 1000
+            with self._lock:
+                self._stats.completed += 1
+                self._stats.queue_ms_total += queue_ms
+                self._stats.queue_ms_max = max(self._stats.queue_ms_max, queue_ms)
+                self._stats.run_ms_total += run_ms
+                pending = self._stats.pending
+            if self._queue_warn_ms and queue_ms >= self._queue_warn_ms:
+                logger.warning(
+                    "Password hash queued %.0fms (run=%.0fms, pending=%s)",
+                    queue_ms,
+                    run_ms,
+                    pending,
+                )
+
+    def _release(self, _future: Future | None) -> None:
+        with self._lock:
+            self._stats.pending -= 1
+        self._slots.release()
+
+
+_hasher: PasswordHasher | None = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """설정값으로 만든 해시 풀을 반환 (프로세스당 1개, 최초 사용 시 생성)."""
+    global _hasher  # noqa: PLW0603
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                _hasher = PasswordHasher(
+                    max_workers=PASSWORD_HASH_WORKERS,
+                    max_pending=PASSWORD_HASH_MAX_PENDING,
+                    queue_warn_ms=PASSWORD_HASH_QUEUE_WARN_MS,
+                )
+    return _hasher
+
+
+async def hash_password_async(password: str) -> str:
+    return await get_password_hasher().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await get_password_hasher().run(
+        verify_password,
+        plain_password,
+        hashed_password,
+    )
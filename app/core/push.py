@@ -0,0 +1,181 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.core.config import (
+    FAKE_PUSH_FAILURE_RATE,
+    FAKE_PUSH_INVALID_RATE,
+    FAKE_PUSH_LATENCY_MS,
+    PUSH_TRANSPORT,
+)
+
+logger = logging.getLogger(__name__)
+
+# FCM 멀티캐스트 1회당 최대 토큰 수
+FCM_MULTICAST_LIMIT = 500
+
+# 재시도해도 의미 없는(= 비활성화 대상) 토큰 에러 코드
+PRUNABLE_ERRORS = frozenset({"UNREGISTERED", "INVALID_ARGUMENT"})
+
+
+@dataclass
+class PushResult:
+    """토큰 1개에 대한 전송 결과."""
+
+    token: str
+    success: bool
+    message_id: str | None = None
+    error: str | None = None
+
+    @property
+    def should_prune(self) -> bool:
+        return not self.success and self.error in PRUNABLE_ERRORS
+
+
+@dataclass
+class MulticastResult:
+    """멀티캐스트 1회 전송 결과."""
+
+    responses: list[PushResult] = field(default_factory=list)
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for r in self.responses if r.success)
+
+    @property
+    def failure_count(self) -> int:
+        return len(self.responses) - self.success_count
+
+    @property
+    def prunable_tokens(self) -> list[str]:
+        return [r.token for r in self.responses if r.should_prune]
+
+
+class PushTransport(Protocol):
+    """푸시 전송 방식 인터페이스 (FCM, 로컬 Fake 등)."""
+
+    def send(
+        self,
+        token: str,
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> PushResult: ...
+
+    def send_multicast(
+        self,
+        tokens: list[str],
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> MulticastResult: ...
+
+
+class FakePushTransport:
+    """FCM을 흉내 내는 로컬 전송기 (부하 테스트/개발용).
+
+    Args:
+        latency_ms: 호출 1회당 지연 시간 (밀리초)
+        failure_rate: 일시적 실패(UNAVAILABLE) 비율 (0.0 ~ 1.0)
+        invalid_rate: 만료 토큰(UNREGISTERED) 비율 (0.0 ~ 1.0)
+        seed: 재현 가능한 결과를 위한 난수 시드
+
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        invalid_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.invalid_rate = invalid_rate
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.tokens_sent = 0
+
+    def send(
+        self,
+        token: str,
+        title: str,
+        body: str,
+        data: dict[str, str] | None = None,
+    ) -> PushResult:
+        return self.send_multicast([token], title, body, data).responses[0]
+
+    def send_multicast(
+        self,
+        tokens: list[str],
+        title: str,  # noqa: ARG002
+        body: str,  # noqa: ARG002
+        data: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> MulticastResult:
+        if len(tokens) > FCM_MULTICAST_LIMIT:
+            message = f"멀티캐스트 토큰은 최대 {FCM_MULTICAST_LIMIT}개입니다."
+            raise ValueError(message)
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        with self._lock:
+            self.calls += 1
+            self.tokens_sent += len(tokens)
+            responses = [self._result_for(token) for token in tokens]
+        return MulticastResult(responses=responses)
+
+    def _result_for(self, token: str) -> PushResult:
+        roll = self._random.random()
+        if roll < self.invalid_rate:
+            return PushResult(token=token, success=False, error="UNREGISTERED")
+        if roll < self.invalid_rate + self.failure_rate:
+            return PushResult(token=token, success=False, error="UNAVAILABLE")
+        return PushResult(
+            token=token,
+            success=True,
+            message_id=f"fake/{self.tokens_sent}/{token[:8]}",
+        )
+
+
+_transport: PushTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_push_transport() -> PushTransport:
+    """설정(PUSH_TRANSPORT)에 맞는 전송기를 반환 (프로세스당 1개)."""
+    global _transport  # noqa: PLW0603
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = _create_push_transport(PUSH_TRANSPORT)
+    return _transport
+
+
+def set_push_transport(transport: PushTransport | None) -> None:
+    """전송기 교체 (벤치마크/테스트용). None이면 설정값으로 다시 생성."""
+    global _transport  # noqa: PLW0603
+    with _transport_lock:
+        _transport = transport
+
+
+def _create_push_transport(name: str) -> PushTransport:
+    if name == "fake":
+        logger.info("Using fake push transport")
+        return FakePushTransport(
+            latency_ms=FAKE_PUSH_LATENCY_MS,
+            failure_rate=FAKE_PUSH_FAILURE_RATE,
+            invalid_rate=FAKE_PUSH_INVALID_RATE,
+        )
+    if name == "firebase":
+        # fake 사용 시 Google SDK를 불러오지 않도록 지연 import
+        from app.core.firebase import FirebasePushTransport
+
+        return FirebasePushTransport()
+
+    message = f"Unknown PUSH_TRANSPORT: {name}"
+    raise ValueError(message)
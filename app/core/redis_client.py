@@ -1,8 +1,16 @@
 import redis
+import redis.asyncio
 
 from app.core.config import APP_ENV
 
-if APP_ENV == "debug":
-    redis_client = redis.Redis(host="localhost", port=6379, db=0, decode_responses=True)
-else:
-    redis_client = redis.Redis(host="redis", port=6379, db=0, decode_responses=True)
+REDIS_HOST = "localhost" if APP_ENV == "debug" else "redis"
+
+redis_client = redis.Redis(host=REDIS_HOST, port=6379, db=0, decode_responses=True)
+
+# SSE 등 async 엔드포인트 전용 (이벤트 루프를 막지 않음)
+async_redis_client = redis.asyncio.Redis(
+    host=REDIS_HOST,
+    port=6379,
+    db=0,
+    decode_responses=True,
+)
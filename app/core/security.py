@@ -1,3 +1,7 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 
 from cryptography.fernet import Fernet
@@ -5,7 +9,12 @@ from jose import jwt
 from jose.exceptions import ExpiredSignatureError, JWTError
 from passlib.context import CryptContext
 
-from app.core.config import ALGORITHM, FERNET_KEY, SECRET_KEY
+from app.core.config import (
+    ALGORITHM,
+    FERNET_KEY,
+    JWT_CACHE_MAX_SIZE,
+    SECRET_KEY,
+)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -40,15 +49,63 @@ def create_jwt_token(data: dict, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
+class _VerifiedTokenCache:
+    """서명 검증을 통과한 토큰의 payload를 exp까지 보관하는 프로세스 로컬 LRU.
+
+    키는 토큰 원문의 SHA-256 digest (토큰 원문은 메모리에 남기지 않음).
+    같은 바이트열이 이미 검증됐을 때만 적중하므로 서명 검증을 건너뛰어도 안전하다.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: bytes) -> dict | None:
+        with self._lock:
+            entry = self._data.get(digest)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._data[digest]
+                return None
+            self._data.move_to_end(digest)
+            return dict(payload)
+
+    def set(self, digest: bytes, payload: dict) -> None:
+        exp = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(exp, int | float):
+            return
+        with self._lock:
+            self._data[digest] = (float(exp), dict(payload))
+            self._data.move_to_end(digest)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_verified_tokens = _VerifiedTokenCache(JWT_CACHE_MAX_SIZE)
+
+
 def decode_jwt_token(token: str) -> dict:
+    """JWT를 검증하고 payload를 반환 (최근 검증한 토큰은 exp까지 캐시 사용)."""
+    digest = hashlib.sha256(token.encode()).digest()
+    if (payload := _verified_tokens.get(digest)) is not None:
+        return payload
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except ExpiredSignatureError as e:
         raise TokenDecodeError(e) from e
     except JWTError as e:
         raise TokenDecodeError(e) from e
     except Exception as e:
         raise TokenDecodeError(e) from e
+    _verified_tokens.set(digest, payload)
+    return payload
 
 
 def encrypt_token(token: str) -> str:
@@ -32,6 +32,29 @@ def get_device_tokens_by_shop(
     return query.all()
 
 
+def get_active_tokens_by_shop_ids(
+    db: Session,
+    shop_ids: list[int],
+) -> dict[int, list[str]]:
+    """여러 샵의 활성 FCM 토큰을 한 번에 조회 (shop_id -> 토큰 목록)."""
+    if not shop_ids:
+        return {}
+
+    rows = (
+        db.query(DevicePushToken.shop_id, DevicePushToken.token)
+        .filter(
+            DevicePushToken.shop_id.in_(shop_ids),
+            DevicePushToken.is_active.is_(True),
+        )
+        .all()
+    )
+
+    tokens_by_shop: dict[int, list[str]] = {}
+    for shop_id, token in rows:
+        tokens_by_shop.setdefault(shop_id, []).append(token)
+    return tokens_by_shop
+
+
 def create_device_token(
     db: Session,
     device_token_data: dict,
@@ -72,6 +95,17 @@ def deactivate_device_token(
     return device_token
 
 
+def deactivate_device_tokens_by_token(db: Session, tokens: list[str]) -> int:
+    """FCM 토큰 문자열 목록으로 일괄 비활성화 (만료 토큰 정리용)."""
+    if not tokens:
+        return 0
+    return (
+        db.query(DevicePushToken)
+        .filter(DevicePushToken.token.in_(tokens))
+        .update({DevicePushToken.is_active: False}, synchronize_session=False)
+    )
+
+
 def get_or_create_device_token(
     db: Session,
     user_id: int | None,
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.enum.outbox_event import OutboxEventType
+from app.models.outbox import OutboxEvent
+
+
+def add_outbox_event(
+    db: Session,
+    event_type: OutboxEventType,
+    aggregate_id: int,
+    payload: dict,
+    shop_id: int | None = None,
+) -> OutboxEvent:
+    """아웃박스 이벤트 추가 (commit 하지 않음 → 호출한 쪽 트랜잭션에 포함)."""
+    event = OutboxEvent(
+        event_type=event_type.value,
+        aggregate_type=event_type.aggregate_type,
+        aggregate_id=aggregate_id,
+        shop_id=shop_id,
+        payload=payload,
+    )
+    db.add(event)
+    return event
+
+
+def get_unpublished_outbox_events(db: Session, limit: int) -> list[OutboxEvent]:
+    """미발행 이벤트를 id 순으로 잠금 조회 (다른 릴레이가 잡은 행은 건너뜀)."""
+    return (
+        db.query(OutboxEvent)
+        .filter(OutboxEvent.published_at.is_(None))
+        .order_by(OutboxEvent.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+
+def mark_outbox_events_published(
+    db: Session,
+    event_ids: list[int],
+    published_at: datetime,
+) -> None:
+    """이벤트 발행 완료 처리."""
+    if not event_ids:
+        return
+    db.query(OutboxEvent).filter(OutboxEvent.id.in_(event_ids)).update(
+        {
+            OutboxEvent.published_at: published_at,
+            OutboxEvent.attempts: OutboxEvent.attempts + 1,
+        },
+        synchronize_session=False,
+    )
+
+
+def increase_outbox_event_attempts(db: Session, event_ids: list[int]) -> None:
+    """발행 실패한 이벤트의 시도 횟수 증가."""
+    if not event_ids:
+        return
+    db.query(OutboxEvent).filter(OutboxEvent.id.in_(event_ids)).update(
+        {OutboxEvent.attempts: OutboxEvent.attempts + 1},
+        synchronize_session=False,
+    )
+
+
+def delete_published_outbox_events(db: Session, before: datetime) -> int:
+    """오래된 발행 완료 이벤트 정리."""
+    return (
+        db.query(OutboxEvent)
+        .filter(
+            OutboxEvent.published_at.is_not(None),
+            OutboxEvent.published_at < before,
+        )
+        .delete(synchronize_session=False)
+    )
@@ -1,40 +1,119 @@
+import re
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import and_, func, or_
+from sqlalchemy import ColumnElement, Row, func, insert, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models.phonebook import Phonebook
+from app.enum.phonebook import PhonebookSearchMode, PhonebookSort
+from app.models.phonebook import PHONEBOOK_PHONE_UNIQUE_INDEX, Phonebook
 from app.schemas.phonebook import PhonebookCreate, PhonebookUpdate
 
+# MySQL ngram_token_size 기본값
+NGRAM_TOKEN_SIZE = 2
+FULLTEXT_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+# 정렬 기준별 ORDER BY (id까지 포함해 페이지 경계가 항상 같도록 고정)
+# 각각 idx_shop_deleted_id / idx_shop_deleted_name / idx_shop_deleted_group_name 순서
+PHONEBOOK_SORT_ORDER = {
+    PhonebookSort.RECENT: (Phonebook.id.desc(),),
+    PhonebookSort.NAME: (Phonebook.name, Phonebook.id),
+    PhonebookSort.GROUP: (Phonebook.group_name, Phonebook.name, Phonebook.id),
+}
+
 
 # 전화번호부 리스트 조회
 def get_phonebooks_by_user(
-    db: Session, shop_id: int, search: str | None = None,
+    db: Session,
+    shop_id: int,
+    search: str | None = None,
+    search_mode: PhonebookSearchMode = PhonebookSearchMode.BASIC,
+    sort: PhonebookSort = PhonebookSort.RECENT,
 ) -> Page[Phonebook]:
     query = db.query(Phonebook).filter(
         Phonebook.shop_id == shop_id,
         Phonebook.deleted_at.is_(None),
     )
 
-    if search:
-        keyword = f"%{search}%"
-        search_filter = or_(
-            Phonebook.name.ilike(keyword),
-            Phonebook.phone_number.ilike(keyword),
-            Phonebook.group_name.ilike(keyword),
-            Phonebook.memo.ilike(keyword),
+    digit_tokens, text_tokens = _split_search_tokens(search)
+    for digits in digit_tokens:
+        query = query.filter(_phone_digits_condition(digits))
+
+    # n-gram 토큰(2글자)보다 짧은 단어는 전문 검색으로 찾을 수 없어 접두 검색
+    short_tokens = [t for t in text_tokens if len(t) < NGRAM_TOKEN_SIZE]
+    for token in short_tokens:
+        prefix = f"{_escape_like(token)}%"
+        query = query.filter(
+            or_(Phonebook.name.like(prefix), Phonebook.group_name.like(prefix)),
         )
-        query = query.filter(and_(search_filter, Phonebook.deleted_at.is_(None)))
-    else:
-        query = query.filter(Phonebook.deleted_at.is_(None))
 
-    query.order_by(Phonebook.id.desc())
+    fulltext_tokens = [t for t in text_tokens if len(t) >= NGRAM_TOKEN_SIZE]
+    score = None
+    if fulltext_tokens:
+        score = _fulltext_match(fulltext_tokens)
+        query = query.filter(score)
+
+    if search_mode == PhonebookSearchMode.RANKED and text_tokens:
+        keyword = " ".join(text_tokens)
+        order_by = [
+            (Phonebook.name == keyword).desc(),
+            Phonebook.name.like(f"{_escape_like(keyword)}%").desc(),
+        ]
+        if score is not None:
+            order_by.append(score.desc())
+        query = query.order_by(*order_by, Phonebook.id.desc())
+    else:
+        query = query.order_by(*PHONEBOOK_SORT_ORDER[sort])
 
     return paginate(query)
 
 
+def _split_search_tokens(search: str | None) -> tuple[list[str], list[str]]:
+    """검색어를 전화번호(숫자) 토큰과 문자 토큰으로 분리."""
+    digit_tokens: list[str] = []
+    text_tokens: list[str] = []
+    for token in (search or "").split():
+        digits = token.replace("-", "")
+        if digits.isdigit():
+            digit_tokens.append(digits)
+        else:
+            # 전문 검색 연산자로 해석되는 문자 제거
+            cleaned = FULLTEXT_OPERATORS.sub("", token)
+            if cleaned:
+                text_tokens.append(cleaned)
+    return digit_tokens, text_tokens
+
+
+def _phone_digits_condition(digits: str) -> ColumnElement[bool]:
+    """0으로 시작하면 번호 앞자리 검색(인덱스 범위), 아니면 뒷자리 등 부분 검색.
+
+    부분 검색도 (shop_id, deleted_at, phone_digits) 인덱스만 훑으므로
+    메모 등 본문 컬럼을 읽지 않는다.
+    """
+    if digits.startswith("0"):
+        return Phonebook.phone_digits.like(f"{digits}%")
+    return Phonebook.phone_digits.like(f"%{digits}%")
+
+
+def _fulltext_match(tokens: list[str]) -> ColumnElement[float]:
+    """FULLTEXT(ngram) 인덱스 검색 (모든 단어를 구문으로 포함해야 일치)."""
+    against = " ".join(f'+"{token}"' for token in tokens)
+    return match(
+        Phonebook.name,
+        Phonebook.group_name,
+        Phonebook.memo,
+        against=against,
+    ).in_boolean_mode()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 # 전화번호부 상세 조회
 def get_phonebook_by_id(
     db: Session, phonebook_id: int, shop_id: int,
@@ -51,6 +130,25 @@ def get_phonebook_by_id(
     return phonebook
 
 
+# 전화번호부 여러 건 조회 (병합 대상)
+def get_phonebooks_by_ids(
+    db: Session,
+    phonebook_ids: list[int],
+    shop_id: int,
+) -> list[Phonebook]:
+    if not phonebook_ids:
+        return []
+    return (
+        db.query(Phonebook)
+        .filter(
+            Phonebook.id.in_(phonebook_ids),
+            Phonebook.shop_id == shop_id,
+            Phonebook.deleted_at.is_(None),
+        )
+        .all()
+    )
+
+
 # 전화번호부 생성
 def create_phonebook(db: Session, data: PhonebookCreate, shop_id: int) -> Phonebook:
     item = Phonebook(**data.model_dump(), shop_id=shop_id)
@@ -68,20 +166,46 @@ def update_phonebook(
     return phonebook
 
 
-# 전화번호부 중복 체크
+# 전화번호부 중복 체크 (유일 인덱스 (shop_id, phone_digits, live_marker) 일치 조회)
 def get_phonebook_by_phone_number(
     db: Session, phone_number: str, shop_id: int,
 ) -> Phonebook | None:
-    phonebook = (
+    return (
         db.query(Phonebook)
         .filter(
-            Phonebook.phone_number == phone_number,
             Phonebook.shop_id == shop_id,
-            Phonebook.deleted_at.is_(None),
+            Phonebook.phone_digits == to_phone_digits(phone_number),
+            Phonebook.live_marker == 1,
         )
         .first()
     )
-    return phonebook
+
+
+# 전화번호 여러 개 중복 체크 (유일 인덱스 IN 조회 1회) → {숫자만 남긴 번호: ID}
+def get_phonebook_ids_by_phone_numbers(
+    db: Session,
+    phone_numbers: list[str],
+    shop_id: int,
+) -> dict[str, int]:
+    if not phone_numbers:
+        return {}
+    digits = {to_phone_digits(phone_number) for phone_number in phone_numbers}
+    rows = db.query(Phonebook.phone_digits, Phonebook.id).filter(
+        Phonebook.shop_id == shop_id,
+        Phonebook.phone_digits.in_(digits),
+        Phonebook.live_marker == 1,
+    )
+    return dict(rows.all())
+
+
+def to_phone_digits(phone_number: str) -> str:
+    """phone_digits 생성 컬럼과 같은 규칙으로 변환 (하이픈 제거)."""
+    return phone_number.replace("-", "")
+
+
+def is_duplicate_phone_error(error: IntegrityError) -> bool:
+    """샵 내 전화번호 유일 인덱스 위반인지 확인."""
+    return PHONEBOOK_PHONE_UNIQUE_INDEX in str(error.orig)
 
 
 # 전화번호부 삭제
@@ -104,13 +228,61 @@ def get_group_counts_by_groupname(db: Session, shop_id: int) -> dict[str, int]:
     )
 
 
-# 전화번호부 가게별 전체 조회
-def get_all_phonebooks_by_shop(db: Session, shop_id: int) -> list[Phonebook]:
+# 전화번호부 그룹 > 이름순 스트리밍 조회
+# (서버 측 커서, idx_shop_deleted_group_name + PK 순서 그대로 읽어 filesort 없음)
+def stream_phonebooks_by_group(
+    db: Session,
+    shop_id: int,
+    yield_per: int = 500,
+) -> Iterator[Row]:
+    stmt = (
+        select(
+            Phonebook.id,
+            Phonebook.shop_id,
+            Phonebook.group_name,
+            Phonebook.name,
+            Phonebook.phone_number,
+            Phonebook.memo,
+            Phonebook.created_at,
+            Phonebook.updated_at,
+        )
+        .where(
+            Phonebook.shop_id == shop_id,
+            Phonebook.deleted_at.is_(None),
+        )
+        .order_by(Phonebook.group_name, Phonebook.name, Phonebook.id)
+        .execution_options(yield_per=yield_per)
+    )
+    yield from db.execute(stmt)
+
+
+# 자동완성 인덱스 생성용 (필요한 컬럼만 조회)
+def get_phonebook_suggest_rows(db: Session, shop_id: int) -> list[Row]:
     return (
-        db.query(Phonebook)
+        db.query(
+            Phonebook.id,
+            Phonebook.name,
+            Phonebook.phone_number,
+            Phonebook.phone_digits,
+        )
         .filter(
             Phonebook.shop_id == shop_id,
             Phonebook.deleted_at.is_(None),
         )
         .all()
     )
+
+
+# 샵에 등록된 전화번호(숫자만) 전체 조회 (가져오기 중복 판별용, 유일 인덱스만 읽음)
+def get_phone_digits_by_shop(db: Session, shop_id: int) -> set[str]:
+    rows = db.query(Phonebook.phone_digits).filter(
+        Phonebook.shop_id == shop_id,
+        Phonebook.live_marker == 1,
+    )
+    return {phone_digits for (phone_digits,) in rows}
+
+
+# 전화번호부 일괄 생성 (ORM 객체 없이 executemany 1회)
+def bulk_insert_phonebooks(db: Session, rows: list[dict]) -> None:
+    if rows:
+        db.execute(insert(Phonebook), rows)
@@ -1,8 +1,10 @@
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from app.models.shop import Shop
+from app.models.shop_user import ShopUser
 from app.schemas.shop import ShopCreate
 
 
@@ -16,9 +18,14 @@ def get_user_shop_by_id(db: Session, user_id: int, shop_id: int) -> Shop | None:
     return db.query(Shop).filter(Shop.id == shop_id, Shop.user_id == user_id).first()
 
 
-# 유저가 가진 모든 샵 조회
+# 유저가 소유하거나 소속된(shop_user) 모든 샵 조회
 def get_user_shops(db: Session, user_id: int) -> Page[Shop]:
-    query = db.query(Shop).filter(Shop.user_id == user_id).order_by(Shop.id.desc())
+    member_shop_ids = select(ShopUser.shop_id).where(ShopUser.user_id == user_id)
+    query = (
+        db.query(Shop)
+        .filter(or_(Shop.user_id == user_id, Shop.id.in_(member_shop_ids)))
+        .order_by(Shop.id.desc())
+    )
     return paginate(query)
 
 
@@ -1,5 +1,7 @@
 from sqlalchemy.orm import Session, joinedload
 
+from app.enum.role import UserRole
+from app.models.shop import Shop
 from app.models.shop_user import ShopUser
 
 
@@ -51,3 +53,28 @@ def get_shop_users_by_shop_id(db: Session, shop_id: int) -> list[ShopUser]:
         .filter(ShopUser.shop_id == shop_id)
         .all()
     )
+
+
+def get_memberships_by_user(db: Session, user_id: int) -> dict[int, dict]:
+    """유저가 속한 샵별 권한 조회 (shop_user + shop_user 행이 없는 샵 소유자).
+
+    Args:
+        db (Session): Database session.
+        user_id (int): 유저 ID
+
+    Returns:
+        dict[int, dict]: 샵 ID → {"role": 샵 내 권한, "is_primary_owner": 대표 여부}
+
+    """
+    owner = {"role": UserRole.MASTER.value, "is_primary_owner": True}
+    member = {"role": UserRole.MANAGER.value, "is_primary_owner": False}
+
+    rows = db.query(ShopUser.shop_id, ShopUser.is_primary_owner).filter(
+        ShopUser.user_id == user_id,
+    )
+    memberships = {
+        row.shop_id: owner if row.is_primary_owner else member for row in rows
+    }
+    for row in db.query(Shop.id).filter(Shop.user_id == user_id):
+        memberships[row.id] = owner
+    return memberships
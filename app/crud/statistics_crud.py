@@ -342,3 +342,92 @@ def get_staff_summary(
         )
         for row in rows
     ]
+
+
+def get_customer_summary(db: Session, shop_id: int, phonebook_id: int) -> dict:
+    """고객 1명의 전체 예약수, 노쇼/취소수, 결제/외상 금액, 첫 예약/최근 방문일 집계.
+
+    시술 항목 JOIN으로 예약 행이 늘어나므로 건수는 DISTINCT로 센다.
+    """
+    completed_status = TreatmentStatus.for_actual_sales()
+    visited_statuses = [TreatmentStatus.VISITED.value, completed_status]
+
+    stmt = (
+        select(
+            func.count(func.distinct(Treatment.id)).label("total_reservations"),
+            func.count(
+                func.distinct(
+                    case(
+                        (Treatment.status == completed_status, Treatment.id),
+                    ),
+                ),
+            ).label("completed_count"),
+            func.count(
+                func.distinct(
+                    case(
+                        (
+                            Treatment.status == TreatmentStatus.NO_SHOW.value,
+                            Treatment.id,
+                        ),
+                    ),
+                ),
+            ).label("no_show_count"),
+            func.count(
+                func.distinct(
+                    case(
+                        (
+                            Treatment.status == TreatmentStatus.CANCELLED.value,
+                            Treatment.id,
+                        ),
+                    ),
+                ),
+            ).label("cancelled_count"),
+            func.sum(
+                case(
+                    (
+                        (Treatment.status == completed_status)
+                        & (Treatment.payment_method.in_(PaymentMethod.paid_methods())),
+                        TreatmentItem.base_price,
+                    ),
+                    else_=0,
+                ),
+            ).label("total_spent"),
+            func.sum(
+                case(
+                    (
+                        (Treatment.status == completed_status)
+                        & (Treatment.payment_method == PaymentMethod.UNPAID.value),
+                        TreatmentItem.base_price,
+                    ),
+                    else_=0,
+                ),
+            ).label("unpaid_amount"),
+            func.min(Treatment.reserved_at).label("first_reserved_at"),
+            func.max(
+                case(
+                    (Treatment.status.in_(visited_statuses), Treatment.reserved_at),
+                ),
+            ).label("last_visited_at"),
+        )
+        .outerjoin(TreatmentItem, Treatment.id == TreatmentItem.treatment_id)
+        .where(Treatment.shop_id == shop_id)
+        .where(Treatment.phonebook_id == phonebook_id)
+    )
+    row = db.execute(stmt).one()
+
+    no_show_rate = (
+        (row.no_show_count / row.total_reservations) * 100
+        if row.total_reservations
+        else 0
+    )
+    return {
+        "total_reservations": row.total_reservations,
+        "completed_count": row.completed_count,
+        "no_show_count": row.no_show_count,
+        "no_show_rate": round(no_show_rate, 1),
+        "cancelled_count": row.cancelled_count,
+        "total_spent": int(row.total_spent or 0),
+        "unpaid_amount": int(row.unpaid_amount or 0),
+        "first_reserved_at": row.first_reserved_at,
+        "last_visited_at": row.last_visited_at,
+    }
@@ -1,10 +1,13 @@
+from datetime import datetime
+
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import func, or_, select
+from sqlalchemy import Row, and_, func, or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.enum.treatment_status import TreatmentStatus
 from app.models.phonebook import Phonebook
+from app.models.shop import Shop
 from app.models.treatment import Treatment
 from app.models.treatment_item import TreatmentItem
 from app.models.treatment_menu_detail import TreatmentMenuDetail
@@ -136,6 +139,7 @@ def get_treatments_to_autocomplete(
     return (
         db.query(
             Treatment.id.label("treatment_id"),
+            Treatment.shop_id,
             Treatment.reserved_at,
             func.sum(TreatmentItem.duration_min).label("total_duration_min"),
         )
@@ -144,7 +148,171 @@ def get_treatments_to_autocomplete(
             Treatment.status.in_(TreatmentStatus.unfinished_statuses()),
             Treatment.finished_at.is_(None),
         )
-        .group_by(Treatment.id, Treatment.reserved_at)
+        .group_by(Treatment.id, Treatment.shop_id, Treatment.reserved_at)
         .limit(100)
         .all()
     )
+
+
+def get_treatments_due_for_reminder(
+    db: Session,
+    window_start: datetime,
+    window_end: datetime,
+    after: tuple[datetime, int] | None = None,
+    limit: int = 500,
+) -> list[Row]:
+    """리마인더 발송 대상 예약 조회.
+
+    idx_treatment_reserved_status(reserved_at, status) 범위 스캔으로
+    [window_start, window_end) 구간의 RESERVED 예약만 가져온다.
+    after 에 직전 배치의 마지막 (reserved_at, id)를 넘기면 키셋 페이징.
+    """
+    stmt = (
+        select(
+            Treatment.id,
+            Treatment.shop_id,
+            Treatment.reserved_at,
+            Treatment.staff_user_id,
+            func.coalesce(Phonebook.name, Treatment.customer_name).label(
+                "customer_name",
+            ),
+        )
+        .outerjoin(Phonebook, Phonebook.id == Treatment.phonebook_id)
+        .where(
+            Treatment.reserved_at >= window_start,
+            Treatment.reserved_at < window_end,
+            Treatment.status == TreatmentStatus.RESERVED,
+        )
+        .order_by(Treatment.reserved_at.asc(), Treatment.id.asc())
+        .limit(limit)
+    )
+
+    if after is not None:
+        last_reserved_at, last_id = after
+        stmt = stmt.where(
+            or_(
+                Treatment.reserved_at > last_reserved_at,
+                and_(
+                    Treatment.reserved_at == last_reserved_at,
+                    Treatment.id > last_id,
+                ),
+            ),
+        )
+
+    return db.execute(stmt).all()
+
+
+# 전화번호부 미연결 예약의 고객 전화번호 조회 (idx_treatment_shop_phone 순서로 페이징)
+def get_unlinked_customer_phones(
+    db: Session,
+    shop_id: int,
+    after: str | None,
+    limit: int,
+) -> list[str]:
+    query = db.query(Treatment.customer_phone).filter(
+        Treatment.shop_id == shop_id,
+        Treatment.phonebook_id.is_(None),
+        Treatment.customer_phone.is_not(None),
+    )
+    if after is not None:
+        query = query.filter(Treatment.customer_phone > after)
+    rows = (
+        query.distinct().order_by(Treatment.customer_phone).limit(limit).all()
+    )
+    return [row.customer_phone for row in rows]
+
+
+# 전화번호부 미연결 예약이 있는 샵 ID 조회
+# 예약 테이블 전체 DISTINCT 대신 샵마다 (shop_id, phonebook_id) 인덱스로 1건만 확인
+def get_shop_ids_with_unlinked_customers(db: Session) -> list[int]:
+    has_unlinked = (
+        select(Treatment.id)
+        .where(
+            Treatment.shop_id == Shop.id,
+            Treatment.phonebook_id.is_(None),
+            Treatment.customer_phone.is_not(None),
+        )
+        .limit(1)
+        .exists()
+    )
+    rows = db.execute(select(Shop.id).where(has_unlinked).order_by(Shop.id)).all()
+    return [row.id for row in rows]
+
+
+# 고객 전화번호가 일치하는 미연결 예약에 전화번호부 연결
+def link_treatments_to_phonebook(
+    db: Session,
+    shop_id: int,
+    customer_phones: list[str],
+    phonebook_id: int,
+) -> int:
+    if not customer_phones:
+        return 0
+    return (
+        db.query(Treatment)
+        .filter(
+            Treatment.shop_id == shop_id,
+            Treatment.customer_phone.in_(customer_phones),
+            Treatment.phonebook_id.is_(None),
+        )
+        .update({Treatment.phonebook_id: phonebook_id}, synchronize_session=False)
+    )
+
+
+# 예약의 고객을 다른 전화번호부로 변경 (전화번호부 병합)
+def move_treatments_to_phonebook(
+    db: Session,
+    shop_id: int,
+    from_phonebook_ids: list[int],
+    to_phonebook_id: int,
+) -> int:
+    if not from_phonebook_ids:
+        return 0
+    return (
+        db.query(Treatment)
+        .filter(
+            Treatment.shop_id == shop_id,
+            Treatment.phonebook_id.in_(from_phonebook_ids),
+        )
+        .update(
+            {Treatment.phonebook_id: to_phonebook_id},
+            synchronize_session=False,
+        )
+    )
+
+
+# 고객 타임라인 조회 (최신순, (reserved_at, id) 키셋 페이징)
+def get_customer_timeline(
+    db: Session,
+    shop_id: int,
+    phonebook_id: int,
+    before: tuple[datetime, int] | None,
+    limit: int,
+) -> list[Treatment]:
+    stmt = (
+        select(Treatment)
+        .options(
+            joinedload(Treatment.treatment_items).joinedload(TreatmentItem.menu_detail),
+            joinedload(Treatment.phonebook),
+            joinedload(Treatment.staff_user),
+        )
+        .where(
+            Treatment.shop_id == shop_id,
+            Treatment.phonebook_id == phonebook_id,
+        )
+        .order_by(Treatment.reserved_at.desc(), Treatment.id.desc())
+        .limit(limit)
+    )
+    if before is not None:
+        # 행 생성자 비교 대신 OR 조건으로 풀어야 MySQL이 인덱스 범위 검색을 사용
+        reserved_at, treatment_id = before
+        stmt = stmt.where(
+            or_(
+                Treatment.reserved_at < reserved_at,
+                and_(
+                    Treatment.reserved_at == reserved_at,
+                    Treatment.id < treatment_id,
+                ),
+            ),
+        )
+    return list(db.execute(stmt).unique().scalars().all())
@@ -57,7 +57,8 @@ def get_treatment_menus_by_user(
             ),
         )
 
-    query.order_by(TreatmentMenu.id.desc())
+    # idx_treatment_menu_shop_deleted_id 순서 (페이지 경계 고정)
+    query = query.order_by(TreatmentMenu.id.desc())
 
     return paginate(query)
 
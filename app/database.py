@@ -11,13 +11,35 @@ from sqlalchemy.orm import Session, sessionmaker
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# 커넥션 풀 설정 (캐시로 처리되는 요청은 커넥션을 잡지 않으므로 작게 잡아도 됨)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
 # 엔진 생성
 # TODO echo=False
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False)
+pool_options = (
+    {}  # SQLite(벤치마크 스크립트)는 SQLAlchemy 기본 풀 사용
+    if DATABASE_URL.startswith("sqlite")
+    else {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+)
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False, **pool_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
+    """요청 단위 DB 세션.
+
+    Session은 첫 쿼리 실행 시점에 풀에서 커넥션을 꺼내므로(pool_pre_ping 포함),
+    사용자/샵/대시보드 캐시로만 처리되는 요청은 커넥션을 점유하지 않는다.
+    캐시 히트 경로에서 db를 건드리지 않도록 주의할 것.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -1,10 +1,9 @@
 from fastapi import Depends, status
 from fastapi.security import OAuth2PasswordBearer
 from sentry_sdk import set_user
-from sqlalchemy.orm import Session
 
 from app.core.security import TokenDecodeError, decode_jwt_token
-from app.database import get_db
+from app.database import SessionLocal
 from app.exceptions import CustomException
 from app.models.user import User
 from app.utils.redis.user import clear_user_redis, get_user_redis, set_user_redis
@@ -15,8 +14,11 @@ DOMAIN = "AUTH"
 
 def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
 ) -> User:
+    """토큰의 사용자를 로컬 캐시 → Redis → DB 순서로 조회.
+
+    캐시 적중 시에는 DB 세션을 열지 않는다.
+    """
     try:
         payload = decode_jwt_token(token)
         user_id = payload.get("sub")
@@ -34,18 +36,20 @@ def get_current_user(
             exception=e,
         ) from e
 
-    # Redis → fallback to DB
+    # 로컬 캐시/Redis → fallback to DB
     if user_redis := get_user_redis(user_id):
         user = User(**user_redis)
     else:
-        user = db.query(User).filter(User.id == user_id).first()
+        with SessionLocal() as db:
+            user = db.query(User).filter(User.id == user_id).first()
+            if user:
+                set_user_redis(user)  # ORM 객체를 캐싱
         if not user:
             raise CustomException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 domain=DOMAIN,
                 hint="사용자를 찾을 수 없습니다.",
             )
-        set_user_redis(user)  # ORM 객체를 캐싱
 
     # Sentry 사용자 식별 정보 설정
     set_user({"id": user.id, "email": user.email})
@@ -0,0 +1,86 @@
+import logging
+
+from fastapi import Request, status
+
+from app.core.config import (
+    SHOP_RATE_BULK_BURST,
+    SHOP_RATE_BULK_PER_MINUTE,
+    SHOP_RATE_DASHBOARD_REFRESH_BURST,
+    SHOP_RATE_DASHBOARD_REFRESH_PER_MINUTE,
+    SHOP_RATE_DEFAULT_BURST,
+    SHOP_RATE_DEFAULT_PER_MINUTE,
+    SHOP_RATE_SEARCH_BURST,
+    SHOP_RATE_SEARCH_PER_MINUTE,
+)
+from app.exceptions import CustomException
+from app.utils.redis.rate_limit import consume_shop_rate_token_redis
+
+logger = logging.getLogger(__name__)
+
+DOMAIN = "SHOP"
+
+# 요청 분류별 (순간 최대 요청 수, 분당 충전 수) - 비싼 요청은 별도 버킷으로 분리
+SHOP_RATE_BUDGETS: dict[str, tuple[int, float]] = {
+    "default": (SHOP_RATE_DEFAULT_BURST, SHOP_RATE_DEFAULT_PER_MINUTE),
+    "search": (SHOP_RATE_SEARCH_BURST, SHOP_RATE_SEARCH_PER_MINUTE),
+    "dashboard_refresh": (
+        SHOP_RATE_DASHBOARD_REFRESH_BURST,
+        SHOP_RATE_DASHBOARD_REFRESH_PER_MINUTE,
+    ),
+    "bulk": (SHOP_RATE_BULK_BURST, SHOP_RATE_BULK_PER_MINUTE),
+}
+
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_SEARCH_PATH_SUFFIXES = ("/suggest", "/check-duplicate", "/check-duplicates")
+
+
+def classify_shop_request(request: Request) -> str:
+    """요청을 비용 기준으로 분류 (SHOP_RATE_BUDGETS 키)."""
+    path = request.url.path.rstrip("/")
+    query = request.query_params
+    if path == "/summary/dashboard":
+        if query.get("force_refresh", "").lower() in _TRUE_VALUES:
+            return "dashboard_refresh"
+        return "default"
+    if path == "/phonebooks/import":
+        return "bulk"
+    if query.get("search") or path.endswith(_SEARCH_PATH_SUFFIXES):
+        return "search"
+    return "default"
+
+
+def enforce_shop_rate_limit(request: Request, shop_id: int) -> None:
+    """샵 단위 요청 제한 (토큰 버킷, Redis 왕복 1번).
+
+    한 샵(예: force_refresh 를 반복 호출하는 태블릿)이 DB 풀을 독점해
+    다른 샵의 응답이 느려지지 않도록, 샵 + 요청 분류별 예산을 둔다.
+
+    Raises:
+        CustomException: 예산 초과 시 429 (Retry-After 포함)
+
+    """
+    route_class = classify_shop_request(request)
+    capacity, per_minute = SHOP_RATE_BUDGETS[route_class]
+    if capacity <= 0 or per_minute <= 0:
+        return  # 0 이하면 해당 분류 제한 안 함
+
+    retry_after = consume_shop_rate_token_redis(
+        shop_id,
+        route_class,
+        capacity,
+        per_minute,
+    )
+    if retry_after:
+        logger.warning(
+            "Shop rate limited (shop_id=%s, class=%s, path=%s)",
+            shop_id,
+            route_class,
+            request.url.path,
+        )
+        raise CustomException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            domain=DOMAIN,
+            code="RATE_LIMITED",
+            hint=f"샵 요청 한도 초과({route_class}), {retry_after}초 후 재시도",
+            headers={"Retry-After": str(retry_after)},
+        )
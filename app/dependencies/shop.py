@@ -1,20 +1,34 @@
-from fastapi import Depends, status
+from fastapi import Depends, Request, status
 from sqlalchemy.orm import Session
 
-from app.crud.shop_crud import get_user_shop_by_id
+from app.crud.shop_crud import get_shop_by_id
 from app.database import get_db
 from app.dependencies.auth import get_current_user
+from app.dependencies.rate_limit import enforce_shop_rate_limit
 from app.exceptions import CustomException
 from app.models.shop import Shop
 from app.models.user import User
-from app.utils.redis.shop import get_selected_shop_redis, set_selected_shop_redis
+from app.services.shop_user_service import get_shop_membership_service
+from app.utils.redis.shop import (
+    get_selected_shop_cached,
+    get_shop_local,
+    set_shop_local,
+)
 
 
 def get_current_shop(
+    request: Request,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ) -> Shop:
-    shop_id = get_selected_shop_redis(user.id)
+    """선택된 샵 조회.
+
+    선택 샵 ID는 사용자 조회와 같은 Redis 파이프라인에서 미리 읽혀 워커 로컬
+    캐시에 있고, 샵 정보와 소속 권한(소유자 또는 shop_user)도 로컬 캐시에 있으면
+    Redis/DB 조회 없이 반환한다.
+    샵 단위 요청 제한(enforce_shop_rate_limit)도 여기서 DB 조회 전에 적용한다.
+    """
+    shop_id = get_selected_shop_cached(user.id)
     if not shop_id:
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -22,12 +36,21 @@ def get_current_shop(
             hint="redis에 만료되거나 없음.",
         )
 
-    shop = get_user_shop_by_id(db, user.id, shop_id)
+    enforce_shop_rate_limit(request, shop_id)
+
+    shop = None
+    if get_shop_membership_service(db, user.id, shop_id):
+        if shop_data := get_shop_local(shop_id):
+            shop = Shop(**shop_data)
+        else:
+            shop = get_shop_by_id(db, shop_id)
+            if shop:
+                set_shop_local(shop)
+
     if not shop:
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
             code="SHOP_NOT_FOUND",
             hint="그런 상점 없습니다.",
         )
-    set_selected_shop_redis(user.id, shop.id)
     return shop
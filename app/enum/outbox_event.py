@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class OutboxEventType(str, Enum):
+    TREATMENT_CREATED = "treatment.created"
+    TREATMENT_UPDATED = "treatment.updated"
+    PHONEBOOK_CREATED = "phonebook.created"
+    PHONEBOOK_UPDATED = "phonebook.updated"
+    PHONEBOOK_DELETED = "phonebook.deleted"
+    PHONEBOOK_IMPORTED = "phonebook.imported"
+    SHOP_CREATED = "shop.created"
+    SHOP_UPDATED = "shop.updated"
+
+    @property
+    def aggregate_type(self) -> str:
+        """이벤트가 속한 도메인 (treatment, phonebook, shop)."""
+        return self.value.split(".", 1)[0]
@@ -0,0 +1,33 @@
+from enum import Enum
+
+
+class PhonebookSearchMode(str, Enum):
+    BASIC = "basic"  # 최신 등록순
+    RANKED = "ranked"  # 이름 일치 > 이름 접두 일치 > 전문검색 점수 순
+
+    @property
+    def label(self) -> str:
+        return {
+            PhonebookSearchMode.BASIC: "기본 (최신순)",
+            PhonebookSearchMode.RANKED: "정확도순",
+        }.get(self.value, "Unknown")
+
+
+class PhonebookSort(str, Enum):
+    RECENT = "recent"  # 최신 등록순 (id 내림차순)
+    NAME = "name"  # 이름순
+    GROUP = "group"  # 그룹명 > 이름순 (그룹 없음 먼저)
+
+    @property
+    def label(self) -> str:
+        return {
+            PhonebookSort.RECENT: "최신 등록순",
+            PhonebookSort.NAME: "이름순",
+            PhonebookSort.GROUP: "그룹순",
+        }.get(self.value, "Unknown")
+
+
+class PhonebookImportStatus(str, Enum):
+    CREATED = "created"  # 등록됨
+    DUPLICATE = "duplicate"  # 이미 등록된 번호 (또는 파일 내 중복)
+    INVALID = "invalid"  # 이름/전화번호 오류
@@ -11,6 +11,10 @@ DEFAULT_MESSAGES = {
     status.HTTP_403_FORBIDDEN: ("FORBIDDEN", "접근이 금지되었습니다."),
     status.HTTP_404_NOT_FOUND: ("NOT_FOUND", "요청한 리소스를 찾을 수 없습니다."),
     status.HTTP_409_CONFLICT: ("CONFLICT", "요청이 충돌되었습니다."),
+    status.HTTP_429_TOO_MANY_REQUESTS: (
+        "TOO_MANY_REQUESTS",
+        "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+    ),
     status.HTTP_422_UNPROCESSABLE_ENTITY: (
         "UNPROCESSABLE_ENTITY",
         "요청 유효성 오류입니다.",
@@ -32,6 +36,7 @@ class CustomException(HTTPException):
         detail: str | None = None,
         hint: str | None = "놉",
         exception: Exception | None = None,
+        headers: dict[str, str] | None = None,
     ):
         # 기본 메시지 및 코드 설정
         default_code, default_detail = DEFAULT_MESSAGES.get(
@@ -85,4 +90,5 @@ class CustomException(HTTPException):
         super().__init__(
             status_code=status_code,
             detail=error_response,
+            headers=headers,
         )
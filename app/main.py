@@ -19,6 +19,7 @@ from app.api import (
 )
 from app.core.config import APP_ENV, SENTRY_DSN
 from app.core.logging import setup_logging
+from app.core.password_hasher import get_password_hasher
 from app.core.sentry import init_sentry
 from app.docs import api_change
 from app.docs.tags_metadata import tags_metadata
@@ -109,7 +110,12 @@ async def error_logger(
 # 헬스체크 엔드포인트 (서버 상태 확인)
 @app.get("/health", tags=["System"])
 async def health_check() -> dict:
-    return {"status": "ok", "message": "API 서버가 정상 동작 중입니다."}
+    return {
+        "status": "ok",
+        "message": "API 서버가 정상 동작 중입니다.",
+        # 워커별 비밀번호 해시 풀 지표 (대기/실행 시간 누적, 거절 수)
+        "password_hasher": get_password_hasher().stats(),
+    }
 
 
 # 사용자 관련 API 라우터 등록
@@ -1,4 +1,5 @@
 from .device_push_token import DevicePushToken
+from .outbox import OutboxEvent
 from .phonebook import Phonebook
 from .shop import Shop
 from .shop_invite import ShopInvite
@@ -0,0 +1,45 @@
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, Integer, String
+
+from app.models.base import Base
+from app.utils.datetime import now_utc
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # 릴레이 조회: 미발행 이벤트를 id 순서로
+        Index("idx_outbox_published_id", "published_at", "id"),
+        {"comment": "트랜잭션 아웃박스 (쓰기 부수효과 이벤트) 테이블"},
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, comment="이벤트 ID")
+    event_type = Column(
+        String(100),
+        nullable=False,
+        comment="이벤트 종류 (예: treatment.created)",
+    )
+    aggregate_type = Column(
+        String(50),
+        nullable=False,
+        comment="도메인 (treatment, phonebook, shop)",
+    )
+    aggregate_id = Column(Integer, nullable=False, comment="도메인 객체 ID")
+    shop_id = Column(Integer, nullable=True, comment="샵 ID")
+    payload = Column(JSON, nullable=False, comment="이벤트 데이터")
+    attempts = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="발행 시도 횟수",
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=now_utc,
+        comment="생성일시",
+    )
+    published_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="발행일시 (NULL이면 미발행)",
+    )
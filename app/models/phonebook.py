@@ -1,8 +1,10 @@
 from sqlalchemy import (
     Column,
+    Computed,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
 )
@@ -12,6 +14,9 @@ from app.models.base import Base
 from app.models.mixin.soft_delete import SoftDeleteMixin
 from app.models.mixin.timestamp import TimestampMixin
 
+# 샵 내 살아있는(미삭제) 전화번호 유일 인덱스 이름 (중복 에러 판별용)
+PHONEBOOK_PHONE_UNIQUE_INDEX = "uq_phonebook_shop_digits_live"
+
 
 class Phonebook(Base, SoftDeleteMixin, TimestampMixin):
     __tablename__ = "phonebook"
@@ -28,7 +33,17 @@ class Phonebook(Base, SoftDeleteMixin, TimestampMixin):
     group_name = Column(String(100), nullable=True, comment="그룹명 (선택)")
     name = Column(String(100), nullable=False, comment="이름")
     phone_number = Column(String(20), nullable=False, comment="전화번호")
+    phone_digits = Column(
+        String(20),
+        Computed("REPLACE(phone_number, '-', '')", persisted=True),
+        comment="숫자만 남긴 전화번호 (검색용, 자동 생성)",
+    )
     memo = Column(Text, nullable=True, comment="메모")
+    live_marker = Column(
+        SmallInteger,
+        Computed("IF(deleted_at IS NULL, 1, NULL)", persisted=True),
+        comment="미삭제 행 표시 (1 또는 NULL, 유일 인덱스용 자동 생성)",
+    )
 
     # 관계 정의
     shop = relationship("Shop", back_populates="phonebook_list")
@@ -39,7 +54,35 @@ class Phonebook(Base, SoftDeleteMixin, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("idx_shop_deleted_group", "shop_id", "deleted_at", "group_name"),
         Index("idx_shop_deleted_name", "shop_id", "deleted_at", "name"),
+        # 목록 정렬: 최신순 / 그룹순 (이름순은 idx_shop_deleted_name + PK)
+        # 그룹순 인덱스가 그룹별 개수 집계/필터(shop_id, deleted_at, group_name)도 처리
+        Index("idx_shop_deleted_id", "shop_id", "deleted_at", "id"),
+        Index(
+            "idx_shop_deleted_group_name",
+            "shop_id",
+            "deleted_at",
+            "group_name",
+            "name",
+        ),
         Index("idx_shop_deleted_phone", "shop_id", "deleted_at", "phone_number"),
+        # 샵 내 미삭제 전화번호 중복 방지 (삭제된 행은 NULL이라 제외됨)
+        Index(
+            PHONEBOOK_PHONE_UNIQUE_INDEX,
+            "shop_id",
+            "phone_digits",
+            "live_marker",
+            unique=True,
+        ),
+        # 숫자만 입력한 전화번호 검색 (하이픈 무시)
+        Index("idx_shop_deleted_digits", "shop_id", "deleted_at", "phone_digits"),
+        # 이름/그룹명/메모 부분 검색 (2글자 n-gram 전문 검색)
+        Index(
+            "ftx_phonebook_name_group_memo",
+            "name",
+            "group_name",
+            "memo",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
     )
@@ -24,6 +24,15 @@ class Treatment(Base, TimestampMixin):
         Index("idx_treatment_shop_status", "shop_id", "status", "reserved_at"),
         # 전화 기반 검색/백필: 샵별 + 고객 전화
         Index("idx_treatment_shop_phone", "shop_id", "customer_phone"),
+        # 고객 타임라인/인사이트: 샵별 + 고객 + 날짜
+        Index(
+            "idx_treatment_shop_phonebook_reserved",
+            "shop_id",
+            "phonebook_id",
+            "reserved_at",
+        ),
+        # 예약 리마인더: 전체 샵 대상 예약일시 범위 + 상태
+        Index("idx_treatment_reserved_status", "reserved_at", "status"),
         {"comment": "시술 예약 테이블"},
     )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -8,7 +8,11 @@ from app.models.mixin.timestamp import TimestampMixin
 
 class TreatmentMenu(Base, SoftDeleteMixin, TimestampMixin):
     __tablename__ = "treatment_menu"
-    __table_args__ = ({"comment": "시술 메뉴 대분류 테이블"},)
+    __table_args__ = (
+        # 목록 조회: 샵별 미삭제 최신순
+        Index("idx_treatment_menu_shop_deleted_id", "shop_id", "deleted_at", "id"),
+        {"comment": "시술 메뉴 대분류 테이블"},
+    )
 
     id = Column(Integer, primary_key=True, index=True, comment="시술 메뉴 대분류 ID")
 
@@ -14,7 +14,10 @@ class DashboardFilter(BaseModel):
     )
     force_refresh: bool = Field(
         default=False,
-        description="캐시 무효화 여부. True인 경우 캐시를 무시하고 DB에서 직접 조회",
+        description=(
+            "대상 일자 항목 재계산 여부. 캐시가 최소 경과 시간(기본 30초)보다 "
+            "어리거나 같은 샵의 재계산이 진행 중이면 무시 (월별 항목은 캐시 사용)"
+        ),
     )
 
 
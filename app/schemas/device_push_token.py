@@ -58,3 +58,7 @@ class FCMMessageResponse(BaseResponseModel):
     message_id: str | None = Field(None, description="FCM 메시지 ID")
     success_count: int | None = Field(None, description="성공한 메시지 수")
     failure_count: int | None = Field(None, description="실패한 메시지 수")
+    pruned_count: int | None = Field(
+        None,
+        description="만료되어 비활성화된 토큰 수",
+    )
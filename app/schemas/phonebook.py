@@ -3,6 +3,11 @@ from typing import Annotated
 
 from pydantic import Field, field_validator
 
+from app.enum.phonebook import (
+    PhonebookImportStatus,
+    PhonebookSearchMode,
+    PhonebookSort,
+)
 from app.schemas.mixin.base import BaseResponseModel
 from app.utils.phone import is_valid_korean_phone_number, normalize_korean_phone_number
 
@@ -59,11 +64,44 @@ class DuplicateCheckResponse(BaseResponseModel, PhoneNumberValidatorMixin):
     )
 
 
+# 여러 전화번호 중복 확인 요청 스키마
+class DuplicateCheckBatchRequest(BaseResponseModel):
+    phone_numbers: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="확인할 전화번호 목록 (최대 1000개, 형식 무관)",
+    )
+
+
+# 여러 전화번호 중복 확인 응답 스키마
+class DuplicateCheckBatchResponse(BaseResponseModel):
+    results: dict[str, int | None] = Field(
+        ...,
+        description="요청한 번호 → 이미 등록된 전화번호부 ID (없으면 null)",
+    )
+    invalid: list[str] = Field(
+        default=[],
+        description="유효하지 않은 전화번호 목록 (results에는 null로 포함)",
+    )
+
+
 # 전화번호부 목록 요청 (필터링용)
 class PhonebookFilter(BaseResponseModel):
     search: str | None = Field(
         default=None,
-        description="검색어 (이름, 전화번호, 그룹명, 메모 등)",
+        description=(
+            "검색어 (이름, 전화번호, 그룹명, 메모). "
+            "공백으로 구분한 단어는 모두 포함(AND), 숫자만 입력하면 전화번호 검색"
+        ),
+    )
+    search_mode: PhonebookSearchMode = Field(
+        default=PhonebookSearchMode.BASIC,
+        description="검색 정렬 방식 (basic: sort 기준, ranked: 정확도순)",
+    )
+    sort: PhonebookSort = Field(
+        default=PhonebookSort.RECENT,
+        description="정렬 기준 (recent: 최신 등록순, name: 이름순, group: 그룹순)",
     )
 
 
@@ -87,3 +125,51 @@ class PhonebookResponse(BaseResponseModel):
     updated_at: datetime = Field(..., description="수정일")
 
     model_config = {"from_attributes": True}
+
+
+# 전화번호부 자동완성 응답 스키마
+class PhonebookSuggestItem(BaseResponseModel):
+    id: int = Field(..., description="전화번호부 ID")
+    name: str = Field(..., description="이름")
+    phone_number: str = Field(..., description="전화번호")
+
+
+# 전화번호부 가져오기 행별 결과
+class PhonebookImportRowResult(BaseResponseModel):
+    row: int = Field(
+        ...,
+        description="행 번호 (CSV는 헤더 포함 줄 번호, vCard는 카드 순번)",
+    )
+    status: PhonebookImportStatus = Field(..., description="처리 결과")
+    name: str | None = Field(None, description="이름")
+    phone_number: str | None = Field(None, description="정규화된 전화번호")
+    message: str | None = Field(None, description="실패/중복 사유")
+
+
+# 전화번호부 가져오기 응답
+class PhonebookImportResponse(BaseResponseModel):
+    total: int = Field(..., description="읽은 연락처 수")
+    created: int = Field(..., description="등록된 수")
+    duplicates: int = Field(..., description="중복으로 건너뛴 수")
+    invalid: int = Field(..., description="오류로 건너뛴 수")
+    results: list[PhonebookImportRowResult] = Field(
+        default=[],
+        description="행별 결과",
+    )
+
+
+# 전화번호부 병합 요청
+class PhonebookMergeRequest(BaseResponseModel):
+    source_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="병합 후 삭제할 전화번호부 ID 목록 (최대 50개)",
+    )
+
+
+# 전화번호부 병합 응답
+class PhonebookMergeResponse(BaseResponseModel):
+    phonebook: PhonebookResponse = Field(..., description="병합 후 남은 전화번호부")
+    merged_ids: list[int] = Field(..., description="병합되어 삭제된 전화번호부 ID")
+    moved_treatments: int = Field(..., description="고객이 변경된 예약 수")
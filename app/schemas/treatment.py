@@ -133,6 +133,7 @@ class TreatmentAutoComplete(BaseResponseModel):
     """시술 자동 완료 스키마."""
 
     treatment_id: int = Field(..., description="시술 예약 ID")
+    shop_id: int = Field(..., description="샵 ID")
     reserved_at: datetime = Field(..., description="예약 일시")
     total_duration_min: int = Field(..., description="총 시술 시간 (분)")
     status: TreatmentStatus = Field(..., description="시술 상태")
@@ -145,3 +146,34 @@ class TreatmentSimpleResponse(BaseResponseModel):
     updated_at: datetime
 
     model_config: ClassVar[dict] = {"from_attributes": True}
+
+
+class CustomerTimelineSummary(BaseResponseModel):
+    """고객 누적 집계 스키마."""
+
+    total_reservations: int = Field(..., description="전체 예약 수")
+    completed_count: int = Field(..., description="시술 완료 수")
+    no_show_count: int = Field(..., description="노쇼 수")
+    no_show_rate: float = Field(..., description="노쇼율 (%)")
+    cancelled_count: int = Field(..., description="취소 수")
+    total_spent: int = Field(..., description="총 결제 금액 (카드/현금)")
+    unpaid_amount: int = Field(..., description="외상(미수금) 금액")
+    first_reserved_at: datetime | None = Field(None, description="첫 예약 일시")
+    last_visited_at: datetime | None = Field(None, description="최근 방문 일시")
+
+
+class CustomerTimelineResponse(BaseResponseModel):
+    """고객 타임라인 응답 스키마."""
+
+    summary: CustomerTimelineSummary | None = Field(
+        None,
+        description="고객 누적 집계 (첫 페이지에만 포함, cursor 요청 시 null)",
+    )
+    items: list[TreatmentResponse] = Field(
+        default_factory=list,
+        description="예약 목록 (최신순)",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="다음 페이지 커서 (마지막 페이지면 null)",
+    )
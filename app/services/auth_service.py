@@ -1,6 +1,10 @@
+import logging
+import time
+import uuid
 from datetime import timedelta
 
 from fastapi import Request, status
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
@@ -10,33 +14,81 @@ from app.core.config import (
     REFRESH_TOKEN_EXPIRE_SECONDS,
     SECRET_KEY,
 )
-from app.core.security import create_jwt_token, verify_password
+from app.core.password_hasher import (
+    BUSY_RETRY_AFTER_SECONDS,
+    PasswordHasherBusyError,
+    verify_password_async,
+)
+from app.core.security import create_jwt_token
 from app.crud.user_crud import get_user_by_email, get_user_by_id
 from app.exceptions import CustomException
 from app.models.user import User
 from app.schemas.auth import LoginResponse
 from app.utils.redis.auth import (
-    clear_refresh_token_redis,
-    get_refresh_token_redis,
-    get_refresh_token_ttl,
-    set_refresh_token_redis,
+    REFRESH_FAMILY_GRACE,
+    REFRESH_FAMILY_REUSED,
+    REFRESH_FAMILY_VALID,
+    add_refresh_family_redis,
+    revoke_refresh_family_redis,
+    rotate_refresh_family_redis,
 )
+from app.utils.redis.rate_limit import check_login_rate_limit_redis
 from app.utils.redis.user import clear_user_redis
 
+logger = logging.getLogger(__name__)
+
 DOMAIN = "AUTH"
 
 
-def authenticate_user_service(db: Session, email: str, password: str) -> User:
+async def check_login_rate_limit_service(client_ip: str, email: str) -> None:
+    """비밀번호 검증(bcrypt) 전에 IP/이메일별 로그인 시도 횟수를 제한한다.
+
+    - client_ip: 요청 IP
+    - email: 로그인 시도 이메일
+    - 예외: 윈도우 내 시도 한도 초과 시 429 CustomException (Retry-After 포함)
+    """
+    scope, retry_after = await check_login_rate_limit_redis(client_ip, email)
+    if scope:
+        logger.warning("Login rate limited (scope=%s, ip=%s)", scope, client_ip)
+        raise CustomException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            domain=DOMAIN,
+            code="LOGIN_RATE_LIMITED",
+            hint=f"로그인 시도 한도 초과({scope}), {retry_after}초 후 재시도",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+async def authenticate_user_service(db: Session, email: str, password: str) -> User:
     """이메일과 비밀번호를 사용하여 사용자를 인증한다.
 
+    사용자 조회는 API 스레드풀에서, bcrypt 검증은 해시 전용 풀에서 실행해
+    로그인이 몰려도 다른 API 요청의 스레드를 점유하지 않는다.
+
     - db: SQLAlchemy 세션 객체
     - email: 사용자 이메일
     - password: 사용자 비밀번호
     - 반환값: 인증된 사용자 객체
-    - 예외: 인증 실패 시 CustomException 발생
+    - 예외: 인증 실패 시 401, 해시 풀 포화 시 429 CustomException 발생
     """
-    user = get_user_by_email(db, email)
-    if not user or not verify_password(password, user.password):
+    user = await run_in_threadpool(get_user_by_email, db, email)
+    if not user:
+        raise CustomException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            domain=DOMAIN,
+        )
+    try:
+        verified = await verify_password_async(password, user.password)
+    except PasswordHasherBusyError as e:
+        # 예상된 과부하 응답이라 Sentry로 보내지 않음 (/health 의 rejected 로 감시)
+        raise CustomException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            domain=DOMAIN,
+            code="BUSY",
+            hint="로그인 요청이 몰려 해시 풀이 가득 참. 잠시 후 재시도",
+            headers={"Retry-After": str(BUSY_RETRY_AFTER_SECONDS)},
+        ) from e
+    if not verified:
         raise CustomException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             domain=DOMAIN,
@@ -47,12 +99,23 @@ def authenticate_user_service(db: Session, email: str, password: str) -> User:
 def generate_tokens(user: User) -> LoginResponse:
     """유저 정보를 기반으로 액세스 토큰과 리프레시 토큰을 생성해서 반환한다.
 
+    로그인마다 새 리프레시 토큰 패밀리(기기 단위 세션)를 만들어
+    여러 기기에서 동시에 로그인 상태를 유지할 수 있다.
+
     - 액세스 토큰: 만료 시간은 ACCESS_TOKEN_EXPIRE_SECONDS 초
-    - 리프레시 토큰: 만료 시간은 REFRESH_TOKEN_EXPIRE_SECONDS 일
+    - 리프레시 토큰: 만료 시간은 REFRESH_TOKEN_EXPIRE_SECONDS 초
     """
+    now = int(time.time())
+    family_id = uuid.uuid4().hex
+    token_id = uuid.uuid4().hex
     access_token = generate_access_token(user)  # 액세스 토큰 생성
-    refresh_token = generate_refresh_token(user)  # 리프레시 토큰 생성
-    set_refresh_token_redis(user.id, refresh_token)  # Redis에 리프레시 토큰 저장
+    refresh_token = generate_refresh_token(user, family_id, token_id)
+    add_refresh_family_redis(
+        user.id,
+        family_id,
+        token_id,
+        expires_at=now + REFRESH_TOKEN_EXPIRE_SECONDS,
+    )
     return access_token, refresh_token
 
 
@@ -76,24 +139,57 @@ def generate_access_token(user: User) -> str:
     )
 
 
-def generate_refresh_token(user: User) -> str:
+def generate_refresh_token(user: User, family_id: str, token_id: str) -> str:
     """유저 정보를 기반으로 리프레시 토큰(JWT)을 생성해서 반환한다.
 
     - sub: 유저 ID
     - type: 'refresh' (리프레시 토큰임을 명시)
-    - 만료 시간: REFRESH_TOKEN_EXPIRE_SECONDS 일
+    - fid: 토큰 패밀리 ID (로그인한 기기 단위, 교체해도 유지)
+    - jti: 토큰 ID (교체할 때마다 새로 발급, 재사용 감지용)
+    - 만료 시간: REFRESH_TOKEN_EXPIRE_SECONDS 초
     """
     return create_jwt_token(
-        data={"sub": str(user.id), "type": "refresh"},
-        expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_SECONDS),
+        data={
+            "sub": str(user.id),
+            "type": "refresh",
+            "fid": family_id,
+            "jti": token_id,
+        },
+        expires_delta=timedelta(seconds=REFRESH_TOKEN_EXPIRE_SECONDS),
     )
 
 
+def _decode_refresh_token(raw_token: str) -> tuple[int, str, str, int]:
+    """리프레시 토큰 검증 후 (유저 ID, 패밀리 ID, 토큰 ID, 만료 epoch) 반환."""
+    try:
+        payload = jwt.decode(raw_token, SECRET_KEY, algorithms=[ALGORITHM])
+        if payload.get("type") != "refresh":
+            message = "not a refresh token"
+            raise ValueError(message)
+        return (
+            int(payload["sub"]),
+            str(payload["fid"]),
+            str(payload["jti"]),
+            int(payload["exp"]),
+        )
+    except (JWTError, KeyError, TypeError, ValueError) as e:
+        raise CustomException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            domain=DOMAIN,
+            detail="Invalid refresh token",
+            hint="리프레시 토큰이 유효하지 않으니 로그인으로 보내도록",
+            exception=e,
+        ) from e
+
+
 def refresh_access_token(db: Session, request: Request) -> tuple[str, str]:
     """리프레시 토큰으로 액세스 토큰과(필요 시) 새로운 리프레시 토큰을 재발급한다.
 
-    리프레시 토큰 만료 TTL이 절반 이하일 때만 새로 발급하고,
+    리프레시 토큰 남은 유효시간이 절반 이하일 때만 같은 패밀리로 새로 발급(교체)하고,
     절반 이상 남아있으면 기존 토큰을 그대로 반환한다.
+    이미 교체된 토큰이 다시 들어오면 탈취로 보고 해당 패밀리(기기)를 폐기한다.
+    단, 방금 교체된 직전 토큰(동시 요청)은 유예 시간 동안 현재 토큰으로 재발급한다.
+    검증과 교체는 Redis 왕복 1번으로 처리한다.
 
     - request: FastAPI Request 객체
     - db: SQLAlchemy 세션 객체
@@ -110,21 +206,38 @@ def refresh_access_token(db: Session, request: Request) -> tuple[str, str]:
             detail="Refresh token not found",
             hint="헤더나 쿠키에 리프레시 토큰 확인해보슈",
         )
-    try:
-        payload = jwt.decode(raw_token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = int(payload.get("sub"))
-    except JWTError as e:
+    user_id, family_id, token_id, expires_at = _decode_refresh_token(raw_token)
+
+    # 리프레시 토큰 교체 여부 결정 (남은 시간이 절반 이하)
+    now = int(time.time())
+    new_token_id = None
+    new_expires_at = None
+    if expires_at - now <= REFRESH_TOKEN_EXPIRE_SECONDS / 2:
+        new_token_id = uuid.uuid4().hex
+        new_expires_at = now + REFRESH_TOKEN_EXPIRE_SECONDS
+
+    # Redis에서 패밀리 확인 + 교체
+    result, current_token_id = rotate_refresh_family_redis(
+        user_id,
+        family_id,
+        token_id,
+        new_token_id=new_token_id,
+        new_expires_at=new_expires_at,
+    )
+    if result == REFRESH_FAMILY_REUSED:
+        logger.warning(
+            "Refresh token reuse detected (user_id=%s, family=%s)",
+            user_id,
+            family_id,
+        )
         raise CustomException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             domain=DOMAIN,
-            detail="Invalid refresh token",
-            hint="리프레시 토큰이 유효하지 않으니 로그인으로 보내도록",
-            exception=e,
-        ) from e
-
-    # Redis에서 리프레시 토큰 확인
-    saved_token = get_refresh_token_redis(user_id)
-    if not saved_token or saved_token != raw_token:
+            code="REFRESH_TOKEN_REUSED",
+            detail="Refresh token was already used.",
+            hint="교체된 리프레시 토큰 재사용 → 기기 세션 폐기, 로그인으로 보내도록",
+        )
+    if result not in (REFRESH_FAMILY_VALID, REFRESH_FAMILY_GRACE):
         raise CustomException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             domain=DOMAIN,
@@ -132,10 +245,6 @@ def refresh_access_token(db: Session, request: Request) -> tuple[str, str]:
             hint="리프레시 토큰이 레디스에 없으니 로그인으로 보내도록",
         )
 
-    # 남은 TTL 확인 (초 단위)
-    ttl = get_refresh_token_ttl(user_id)
-    half_ttl = ttl / 2 if ttl > 0 else -1
-
     # 유저 정보 조회
     user = get_user_by_id(db, user_id)
     if not user or user.is_deleted():
@@ -145,21 +254,21 @@ def refresh_access_token(db: Session, request: Request) -> tuple[str, str]:
             detail="User not found",
         )
 
-    # 리프레시 토큰 재발급 여부 결정
-    if 0 < ttl <= half_ttl:
-        # 남은 시간이 절반 이하라면 새 리프레시 토큰 발급
-        new_access_token, new_refresh_token = generate_tokens(user)
-        set_refresh_token_redis(new_refresh_token)  # Redis에 새 리프레시 토큰 저장
+    new_access_token = generate_access_token(user)
+    if result == REFRESH_FAMILY_GRACE:
+        # 같은 토큰의 동시 요청이 먼저 교체함 → 교체 없이 현재 토큰 ID로 재발급
+        new_refresh_token = generate_refresh_token(user, family_id, current_token_id)
+    elif new_token_id:
+        new_refresh_token = generate_refresh_token(user, family_id, new_token_id)
     else:
         # 아직 충분히 남았으면 기존 토큰 유지
-        new_access_token = generate_access_token(user)
         new_refresh_token = raw_token
 
     return new_access_token, new_refresh_token
 
 
 def logout_user(token: str | None) -> bool:
-    """사용자 로그아웃 처리.
+    """사용자 로그아웃 처리 (이 기기의 리프레시 토큰 패밀리만 폐기).
 
     - token: 리프레시 토큰 (없으면 False 반환)
     - 반환값: 성공 여부 (True/False)
@@ -169,8 +278,10 @@ def logout_user(token: str | None) -> bool:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id = int(payload.get("sub"))
-        clear_refresh_token_redis(user_id)
-        clear_user_redis(user_id)
+        family_id = payload.get("fid")
     except JWTError:
         return False
+    if family_id:
+        revoke_refresh_family_redis(user_id, family_id)
+    clear_user_redis(user_id)
     return True
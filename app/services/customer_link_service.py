@@ -0,0 +1,89 @@
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.config import CUSTOMER_BACKFILL_BATCH_SIZE
+from app.crud.phonebook_crud import get_phonebook_ids_by_phone_numbers
+from app.crud.treatment_crud import (
+    get_unlinked_customer_phones,
+    link_treatments_to_phonebook,
+)
+from app.utils.phone import normalize_korean_phone_number, phone_to_digits
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_treatment_phonebooks_service(db: Session, shop_id: int) -> int:
+    """전화번호부 미연결 예약을 고객 전화번호로 전화번호부와 연결.
+
+    idx_treatment_shop_phone 순서로 고객 전화번호를 배치 단위로 읽고,
+    하이픈/공백을 무시한 번호가 전화번호부와 일치하면 phonebook_id를 채운다.
+    배치마다 commit 하므로 중간에 멈춰도 다음 실행에서 이어서 처리된다.
+
+    Returns:
+        int: 연결된 예약 수
+
+    """
+    linked = 0
+    after: str | None = None
+    while True:
+        customer_phones = get_unlinked_customer_phones(
+            db,
+            shop_id,
+            after=after,
+            limit=CUSTOMER_BACKFILL_BATCH_SIZE,
+        )
+        if not customer_phones:
+            break
+        after = customer_phones[-1]
+
+        phones_by_digits: dict[str, list[str]] = {}
+        for customer_phone in customer_phones:
+            digits = phone_to_digits(customer_phone)
+            if digits:
+                phones_by_digits.setdefault(digits, []).append(customer_phone)
+
+        phonebook_ids = get_phonebook_ids_by_phone_numbers(
+            db,
+            list(phones_by_digits),
+            shop_id,
+        )
+        for digits, phonebook_id in phonebook_ids.items():
+            linked += link_treatments_to_phonebook(
+                db,
+                shop_id,
+                phones_by_digits[digits],
+                phonebook_id,
+            )
+        db.commit()
+
+        if len(customer_phones) < CUSTOMER_BACKFILL_BATCH_SIZE:
+            break
+
+    if linked:
+        logger.info("Linked %s treatments to phonebook (shop_id=%s)", linked, shop_id)
+    return linked
+
+
+def link_treatments_by_phone_service(
+    db: Session,
+    shop_id: int,
+    phone_number: str,
+    phonebook_id: int,
+) -> int:
+    """전화번호부 1건이 등록/수정되었을 때 같은 번호의 미연결 예약을 연결.
+
+    숫자만/하이픈 형식 두 가지로 인덱스 조회하며,
+    그 외 형식(공백 등)은 backfill_treatment_phonebooks_service 가 처리한다.
+
+    Returns:
+        int: 연결된 예약 수
+
+    """
+    digits = phone_to_digits(phone_number)
+    if not digits:
+        return 0
+    customer_phones = list({digits, normalize_korean_phone_number(digits)})
+    linked = link_treatments_to_phonebook(db, shop_id, customer_phones, phonebook_id)
+    db.commit()
+    return linked
@@ -1,9 +1,12 @@
+import logging
+
 from fastapi import status
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.core.firebase import send_fcm_message, send_fcm_multicast
+from app.core.push import FCM_MULTICAST_LIMIT, get_push_transport
 from app.crud.device_push_token_crud import (
+    deactivate_device_tokens_by_token,
     delete_device_token,
     get_device_token_by_id,
     get_device_tokens_by_shop,
@@ -194,30 +197,47 @@ def send_fcm_notification_service(
 
         # FCM 메시지 전송
         token_strings = [t.token for t in tokens]
+        transport = get_push_transport()
 
         if len(token_strings) == 1:
             # 단일 디바이스
-            result = send_fcm_message(
+            result = transport.send(
                 token=token_strings[0],
                 title=fcm_request.title,
                 body=fcm_request.body,
                 data=fcm_request.data,
             )
-            return FCMMessageResponse(
-                success=result["success"],
-                message_id=result["message_id"],
+            if not result.success:
+                if result.should_prune:
+                    _prune_device_tokens(db, [result.token])
+                raise CustomException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    domain=DOMAIN,
+                    detail=f"Failed to send FCM notification: {result.error}",
+                )
+            return FCMMessageResponse(success=True, message_id=result.message_id)
+
+        # 여러 디바이스 (FCM 제한에 맞춰 500개씩 분할 전송)
+        success_count = 0
+        failure_count = 0
+        prunable_tokens: list[str] = []
+        for i in range(0, len(token_strings), FCM_MULTICAST_LIMIT):
+            result = transport.send_multicast(
+                tokens=token_strings[i : i + FCM_MULTICAST_LIMIT],
+                title=fcm_request.title,
+                body=fcm_request.body,
+                data=fcm_request.data,
             )
-        # 여러 디바이스
-        result = send_fcm_multicast(
-            tokens=token_strings,
-            title=fcm_request.title,
-            body=fcm_request.body,
-            data=fcm_request.data,
-        )
+            success_count += result.success_count
+            failure_count += result.failure_count
+            prunable_tokens.extend(result.prunable_tokens)
+
+        pruned_count = _prune_device_tokens(db, prunable_tokens)
         return FCMMessageResponse(
-            success=result["success"],
-            success_count=result["success_count"],
-            failure_count=result["failure_count"],
+            success=True,
+            success_count=success_count,
+            failure_count=failure_count,
+            pruned_count=pruned_count,
         )
 
     except CustomException:
@@ -229,3 +249,17 @@ def send_fcm_notification_service(
             detail=f"Failed to send FCM notification: {e!s}",
             exception=e,
         ) from e
+
+
+def _prune_device_tokens(db: Session, tokens: list[str]) -> int:
+    """FCM이 만료/무효로 응답한 토큰을 비활성화한다."""
+    if not tokens:
+        return 0
+    try:
+        pruned = deactivate_device_tokens_by_token(db, tokens)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logging.exception("Failed to deactivate %s stale push tokens", len(tokens))
+        return 0
+    return pruned
@@ -0,0 +1,120 @@
+import logging
+from collections.abc import Callable
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from app.crud.outbox_crud import add_outbox_event
+from app.enum.outbox_event import OutboxEventType
+from app.models.outbox import OutboxEvent
+from app.services.customer_link_service import (
+    backfill_treatment_phonebooks_service,
+    link_treatments_by_phone_service,
+)
+from app.utils.redis.dashboard import clear_dashboard_cache_by_dates
+
+logger = logging.getLogger(__name__)
+
+OutboxHandler = Callable[[Session, dict], None]
+
+# 이벤트 종류별 후처리 핸들러 목록
+_handlers: dict[str, list[OutboxHandler]] = {}
+
+
+def register_outbox_handler(
+    *event_types: OutboxEventType,
+) -> Callable[[OutboxHandler], OutboxHandler]:
+    """아웃박스 이벤트 핸들러 등록 데코레이터.
+
+    핸들러는 최소 1회 이상(at-least-once) 호출되므로 멱등하게 작성해야 한다.
+    """
+
+    def decorator(handler: OutboxHandler) -> OutboxHandler:
+        for event_type in event_types:
+            _handlers.setdefault(event_type.value, []).append(handler)
+        return handler
+
+    return decorator
+
+
+def record_outbox_event(
+    db: Session,
+    event_type: OutboxEventType,
+    aggregate_id: int,
+    payload: dict,
+    shop_id: int | None = None,
+) -> None:
+    """쓰기 트랜잭션에 아웃박스 이벤트를 함께 기록 (commit은 호출한 쪽에서)."""
+    add_outbox_event(
+        db,
+        event_type=event_type,
+        aggregate_id=aggregate_id,
+        payload=payload,
+        shop_id=shop_id,
+    )
+
+
+def outbox_event_to_message(event: OutboxEvent) -> dict:
+    """Celery로 넘길 수 있는 dict 형태로 변환."""
+    return {
+        "id": event.id,
+        "event_type": event.event_type,
+        "aggregate_type": event.aggregate_type,
+        "aggregate_id": event.aggregate_id,
+        "shop_id": event.shop_id,
+        "payload": event.payload,
+    }
+
+
+def handle_outbox_event(db: Session, message: dict) -> None:
+    """이벤트 종류에 등록된 핸들러를 순서대로 실행."""
+    handlers = _handlers.get(message["event_type"], [])
+    if not handlers:
+        logger.debug("No outbox handler for %s", message["event_type"])
+        return
+    for handler in handlers:
+        handler(db, message)
+
+
+@register_outbox_handler(
+    OutboxEventType.TREATMENT_CREATED,
+    OutboxEventType.TREATMENT_UPDATED,
+)
+def _clear_dashboard_cache_on_treatment(db: Session, message: dict) -> None:  # noqa: ARG001
+    """예약 변경 시 변경 전/후 예약일의 대시보드 캐시 무효화.
+
+    자동 완료처럼 여러 예약을 한 번에 바꾼 경우 reserved_dates 목록을 쓴다.
+    """
+    payload = message["payload"]
+    dates = {
+        datetime.fromisoformat(value).date()
+        for value in (
+            payload.get("reserved_at"),
+            payload.get("previous_reserved_at"),
+            *payload.get("reserved_dates", []),
+        )
+        if value
+    }
+    clear_dashboard_cache_by_dates(message["shop_id"], dates)
+
+
+@register_outbox_handler(
+    OutboxEventType.PHONEBOOK_CREATED,
+    OutboxEventType.PHONEBOOK_UPDATED,
+)
+def _link_treatments_on_phonebook(db: Session, message: dict) -> None:
+    """전화번호부 등록/수정 시 같은 번호로 예약된 미연결 고객을 연결."""
+    phone_number = message["payload"].get("phone_number")
+    if phone_number:
+        link_treatments_by_phone_service(
+            db,
+            message["shop_id"],
+            phone_number,
+            message["aggregate_id"],
+        )
+
+
+@register_outbox_handler(OutboxEventType.PHONEBOOK_IMPORTED)
+def _backfill_treatments_on_import(db: Session, message: dict) -> None:
+    """전화번호부 가져오기 후 샵 전체 미연결 예약 백필."""
+    backfill_treatment_phonebooks_service(db, message["shop_id"])
@@ -0,0 +1,238 @@
+from typing import BinaryIO
+
+from fastapi import status
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import PHONEBOOK_IMPORT_BATCH_SIZE, PHONEBOOK_IMPORT_MAX_ROWS
+from app.crud.phonebook_crud import (
+    bulk_insert_phonebooks,
+    get_phone_digits_by_shop,
+    is_duplicate_phone_error,
+    to_phone_digits,
+)
+from app.enum.outbox_event import OutboxEventType
+from app.enum.phonebook import PhonebookImportStatus
+from app.exceptions import CustomException
+from app.models.shop import Shop
+from app.schemas.phonebook import PhonebookImportResponse, PhonebookImportRowResult
+from app.services.outbox_service import record_outbox_event
+from app.utils.contact_import import ContactImportError, ContactRecord, iter_contacts
+from app.utils.datetime import now_utc
+from app.utils.phone import is_valid_korean_phone_number, normalize_korean_phone_number
+from app.utils.redis.phonebook import (
+    bump_phonebook_suggest_version,
+    clear_group_counts_redis,
+)
+
+DOMAIN = "PHONEBOOK"
+
+NAME_MAX_LENGTH = 100
+GROUP_NAME_MAX_LENGTH = 100
+DUPLICATE_MESSAGE = "이미 등록된 전화번호입니다."
+
+
+def import_phonebook_service(
+    db: Session,
+    current_shop: Shop,
+    file: BinaryIO,
+    filename: str | None,
+) -> PhonebookImportResponse:
+    """전화번호부 가져오기 서비스 (CSV/vCard).
+
+    파일을 한 건씩 읽으면서 번호를 정규화하고, 기존 번호는 한 번의 조회로
+    만든 집합으로 중복을 판별한 뒤 배치 단위로 INSERT 한다.
+    전체가 하나의 트랜잭션이므로 중간에 실패하면 아무것도 등록되지 않는다.
+    가져오는 도중 다른 요청이 같은 번호를 등록하면 유일 인덱스가 막고
+    해당 행은 duplicate로 보고한다.
+
+    Args:
+        db: 데이터베이스 세션
+        current_shop: 현재 접속한 매장 정보
+        file: 업로드 파일 (바이너리)
+        filename: 업로드 파일명 (형식 판별용)
+
+    Returns:
+        PhonebookImportResponse: 건수 요약 및 행별 결과
+
+    Raises:
+        CustomException:
+            - 400: 파일 형식 오류 또는 최대 건수 초과
+            - 500: 데이터베이스 에러
+
+    """
+    shop_id = current_shop.id
+    results: list[PhonebookImportRowResult] = []
+    created = 0
+
+    try:
+        existing_digits = get_phone_digits_by_shop(db, shop_id)
+        now = now_utc()
+        batch: list[tuple[PhonebookImportRowResult, dict]] = []
+
+        for record in iter_contacts(file, filename):
+            if len(results) >= PHONEBOOK_IMPORT_MAX_ROWS:
+                raise CustomException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    domain=DOMAIN,
+                    code="IMPORT_TOO_LARGE",
+                    detail=(
+                        f"한 번에 최대 {PHONEBOOK_IMPORT_MAX_ROWS}건까지 "
+                        "가져올 수 있습니다."
+                    ),
+                )
+
+            result, values = _check_record(record, existing_digits)
+            results.append(result)
+            if values is None:
+                continue
+
+            existing_digits.add(to_phone_digits(values["phone_number"]))
+            values.update(shop_id=shop_id, created_at=now, updated_at=now)
+            batch.append((result, values))
+            if len(batch) >= PHONEBOOK_IMPORT_BATCH_SIZE:
+                created += _insert_batch(db, batch)
+                batch = []
+
+        created += _insert_batch(db, batch)
+
+        if created:
+            record_outbox_event(
+                db,
+                event_type=OutboxEventType.PHONEBOOK_IMPORTED,
+                aggregate_id=shop_id,
+                payload={"created": created},
+                shop_id=shop_id,
+            )
+        db.commit()
+    except ContactImportError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            domain=DOMAIN,
+            code="IMPORT_INVALID_FILE",
+            detail=str(e),
+        ) from e
+    except CustomException:
+        db.rollback()
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+
+    if created:
+        bump_phonebook_suggest_version(shop_id)
+        # 대량 등록은 증감 대신 캐시를 버리고 다음 조회 때 DB에서 다시 집계
+        clear_group_counts_redis(shop_id)
+
+    return PhonebookImportResponse(
+        total=len(results),
+        created=created,
+        duplicates=_count(results, PhonebookImportStatus.DUPLICATE),
+        invalid=_count(results, PhonebookImportStatus.INVALID),
+        results=results,
+    )
+
+
+def _insert_batch(
+    db: Session,
+    batch: list[tuple[PhonebookImportRowResult, dict]],
+) -> int:
+    """배치 INSERT, 동시에 등록된 번호와 충돌하면 해당 배치만 한 건씩 재시도.
+
+    Returns:
+        int: 실제 등록된 건수
+
+    """
+    if not batch:
+        return 0
+    try:
+        with db.begin_nested():
+            bulk_insert_phonebooks(db, [values for _, values in batch])
+    except IntegrityError as e:
+        if not is_duplicate_phone_error(e):
+            raise
+    else:
+        return len(batch)
+
+    created = 0
+    for result, values in batch:
+        try:
+            with db.begin_nested():
+                bulk_insert_phonebooks(db, [values])
+        except IntegrityError as e:
+            if not is_duplicate_phone_error(e):
+                raise
+            result.status = PhonebookImportStatus.DUPLICATE
+            result.message = DUPLICATE_MESSAGE
+        else:
+            created += 1
+    return created
+
+
+def _check_record(
+    record: ContactRecord,
+    existing_digits: set[str],
+) -> tuple[PhonebookImportRowResult, dict | None]:
+    """연락처 1건 검증 → (행 결과, INSERT 값 또는 None)."""
+    name = (record.name or "").strip()
+    phone_number = _clean_phone_number(record.phone_number)
+    group_name = (record.group_name or "").strip() or None
+
+    def reject(status_: PhonebookImportStatus, message: str) -> tuple:
+        result = PhonebookImportRowResult(
+            row=record.row,
+            status=status_,
+            name=name or None,
+            phone_number=phone_number,
+            message=message,
+        )
+        return result, None
+
+    if not name:
+        return reject(PhonebookImportStatus.INVALID, "이름이 없습니다.")
+    if len(name) > NAME_MAX_LENGTH:
+        return reject(PhonebookImportStatus.INVALID, "이름이 너무 깁니다.")
+    if group_name and len(group_name) > GROUP_NAME_MAX_LENGTH:
+        return reject(PhonebookImportStatus.INVALID, "그룹명이 너무 깁니다.")
+    if not phone_number or not is_valid_korean_phone_number(phone_number):
+        return reject(PhonebookImportStatus.INVALID, "유효하지 않은 전화번호입니다.")
+
+    phone_number = normalize_korean_phone_number(phone_number)
+    if to_phone_digits(phone_number) in existing_digits:
+        return reject(PhonebookImportStatus.DUPLICATE, DUPLICATE_MESSAGE)
+
+    result = PhonebookImportRowResult(
+        row=record.row,
+        status=PhonebookImportStatus.CREATED,
+        name=name,
+        phone_number=phone_number,
+    )
+    values = {
+        "name": name,
+        "phone_number": phone_number,
+        "group_name": group_name,
+        "memo": (record.memo or "").strip() or None,
+    }
+    return result, values
+
+
+def _clean_phone_number(phone_number: str | None) -> str | None:
+    """공백/괄호/점 제거, +82 국가번호를 0으로 변환."""
+    if not phone_number:
+        return None
+    cleaned = "".join(c for c in phone_number if c.isdigit() or c in "+-")
+    if cleaned.startswith("+82"):
+        cleaned = "0" + cleaned[3:].lstrip("-").removeprefix("0")
+    return cleaned or None
+
+
+def _count(
+    results: list[PhonebookImportRowResult],
+    status_: PhonebookImportStatus,
+) -> int:
+    return sum(1 for result in results if result.status == status_)
@@ -1,35 +1,70 @@
+import json
 import logging
-from collections import defaultdict
+from collections.abc import Iterator
 
 from fastapi import status
 from fastapi_pagination import Page
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.crud.phonebook_crud import (
     create_phonebook,
-    get_all_phonebooks_by_shop,
     get_group_counts_by_groupname,
     get_phonebook_by_id,
     get_phonebook_by_phone_number,
+    get_phonebook_ids_by_phone_numbers,
+    get_phonebooks_by_ids,
     get_phonebooks_by_user,
+    is_duplicate_phone_error,
+    stream_phonebooks_by_group,
+    to_phone_digits,
     update_phonebook,
 )
+from app.crud.statistics_crud import get_customer_summary
+from app.crud.treatment_crud import get_customer_timeline, move_treatments_to_phonebook
+from app.database import SessionLocal
+from app.enum.outbox_event import OutboxEventType
 from app.exceptions import CustomException
 from app.models.phonebook import Phonebook
 from app.models.shop import Shop
 from app.schemas.phonebook import (
+    DuplicateCheckBatchRequest,
+    DuplicateCheckBatchResponse,
     DuplicateCheckResponse,
     PhonebookCreate,
     PhonebookFilter,
     PhonebookGroupedByGroupnameResponse,
+    PhonebookMergeRequest,
+    PhonebookMergeResponse,
     PhonebookResponse,
     PhonebookUpdate,
 )
+from app.schemas.treatment import (
+    CustomerTimelineResponse,
+    CustomerTimelineSummary,
+    TreatmentResponse,
+)
+from app.services.outbox_service import record_outbox_event
+from app.utils.phone import is_valid_korean_phone_number, normalize_korean_phone_number
+from app.utils.query import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.redis.phonebook import (
+    bump_phonebook_suggest_version,
+    clear_group_counts_redis,
+    get_group_counts_generation_redis,
+    get_group_counts_redis,
+    incr_group_counts_redis,
+    set_group_counts_redis,
+)
 
 # 전화번호부 관련 에러 도메인 상수
 DOMAIN = "PHONEBOOK"
 
+# 스트리밍 응답 1회 전송 크기 (바이트 근사치)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 첫 그룹 시작 전 표시 (group_name이 None인 그룹과 구분)
+_NO_GROUP = object()
+
 
 def get_phonebook_list_service(
     db: Session,
@@ -48,8 +83,13 @@ def get_phonebook_list_service(
 
     """
     # 매장별 전화번호부 목록 조회 (검색 조건 포함)
-    list = get_phonebooks_by_user(db=db, shop_id=current_shop.id, search=params.search)
-    return list
+    return get_phonebooks_by_user(
+        db=db,
+        shop_id=current_shop.id,
+        search=params.search,
+        search_mode=params.search_mode,
+        sort=params.sort,
+    )
 
 
 def get_phonebook_service(
@@ -103,23 +143,29 @@ def create_phonebook_service(
 
     """
     try:
-        # 전화번호 중복 체크
-        existing = get_phonebook_by_phone_number(db, data.phone_number, current_shop.id)
-        if existing:
-            raise CustomException(
-                status_code=status.HTTP_409_CONFLICT,
-                domain=DOMAIN,
-                hint="전화번호 중복 확인하쇼.",
-            )
-
-        # 전화번호부 생성
+        # 전화번호부 생성 (중복은 사전 조회 없이 유일 인덱스가 거부)
         phonebook = create_phonebook(db, data, current_shop.id)
+        db.flush()
+        _record_phonebook_event(db, OutboxEventType.PHONEBOOK_CREATED, phonebook)
         db.commit()
 
     except CustomException:
         # CustomException은 그대로 전파
         db.rollback()
         raise
+    except IntegrityError as e:
+        db.rollback()
+        if is_duplicate_phone_error(e):
+            raise CustomException(
+                status_code=status.HTTP_409_CONFLICT,
+                domain=DOMAIN,
+                hint="전화번호 중복 확인하쇼.",
+            ) from e
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
     except SQLAlchemyError as e:
         # 데이터베이스 관련 에러 처리
         db.rollback()
@@ -137,6 +183,9 @@ def create_phonebook_service(
             exception=e,
         )
 
+    bump_phonebook_suggest_version(current_shop.id)
+    incr_group_counts_redis(current_shop.id, {phonebook.group_name: 1})
+
     # 생성된 객체 새로고침하여 최신 정보 반환
     db.refresh(phonebook)
     return phonebook
@@ -166,20 +215,30 @@ def update_phonebook_service(
             - 500: 데이터베이스 에러 또는 예상치 못한 에러
 
     """
-    # 변경하려는 전화번호가 다른 레코드에 존재하는지 확인
-    existing = get_phonebook_by_phone_number(db, data.phone_number, current_shop.id)
-    if existing and existing.id != phonebook_id:
-        raise CustomException(status_code=status.HTTP_409_CONFLICT, domain=DOMAIN)
-
     # 수정할 전화번호부 조회
     phonebook = get_phonebook_by_id(db, phonebook_id, current_shop.id)
     if not phonebook:
         raise CustomException(status_code=status.HTTP_404_NOT_FOUND, domain=DOMAIN)
 
+    previous_group_name = phonebook.group_name
     try:
         # 전화번호부 정보 업데이트
         update_phonebook(db, phonebook, data)
+        _record_phonebook_event(db, OutboxEventType.PHONEBOOK_UPDATED, phonebook)
         db.commit()
+    except IntegrityError as e:
+        # 변경하려는 전화번호가 다른 레코드에 이미 존재 (유일 인덱스 위반)
+        db.rollback()
+        if is_duplicate_phone_error(e):
+            raise CustomException(
+                status_code=status.HTTP_409_CONFLICT,
+                domain=DOMAIN,
+            ) from e
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
     except SQLAlchemyError as e:
         # 데이터베이스 관련 에러 처리
         db.rollback()
@@ -197,6 +256,13 @@ def update_phonebook_service(
             domain=DOMAIN,
         )
 
+    bump_phonebook_suggest_version(current_shop.id)
+    if phonebook.group_name != previous_group_name:
+        incr_group_counts_redis(
+            current_shop.id,
+            {previous_group_name: -1, phonebook.group_name: 1},
+        )
+
     # 수정된 객체 새로고침하여 최신 정보 반환
     db.refresh(phonebook)
     return phonebook
@@ -224,9 +290,11 @@ def delete_phonebook_service(db: Session, phonebook_id: int, current_shop: Shop)
             domain=DOMAIN,
         )
 
+    group_name = phonebook.group_name
     try:
         # 소프트 삭제 처리 (deleted_at 필드 업데이트)
         Phonebook.soft_delete(phonebook)
+        _record_phonebook_event(db, OutboxEventType.PHONEBOOK_DELETED, phonebook)
         db.commit()
     except SQLAlchemyError as e:
         # 데이터베이스 관련 에러 처리
@@ -245,57 +313,265 @@ def delete_phonebook_service(db: Session, phonebook_id: int, current_shop: Shop)
             domain=DOMAIN,
         )
 
+    bump_phonebook_suggest_version(current_shop.id)
+    incr_group_counts_redis(current_shop.id, {group_name: -1})
+
+
+def get_customer_timeline_service(
+    db: Session,
+    phonebook_id: int,
+    current_shop: Shop,
+    cursor: str | None,
+    limit: int,
+) -> CustomerTimelineResponse:
+    """고객 타임라인 조회 서비스.
+
+    (shop_id, phonebook_id, reserved_at) 인덱스로 최신순 예약을 키셋 페이징하고,
+    첫 페이지에서는 같은 인덱스로 고객 누적 집계를 함께 반환한다.
+
+    Args:
+        db: 데이터베이스 세션
+        phonebook_id: 고객(전화번호부) ID
+        current_shop: 현재 접속한 매장 정보
+        cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+        limit: 페이지 크기
+
+    Returns:
+        CustomerTimelineResponse: 예약 목록, 누적 집계, 다음 페이지 커서
+
+    Raises:
+        CustomException:
+            - 400: 잘못된 커서
+            - 404: 전화번호부를 찾을 수 없음
+
+    """
+    before = None
+    if cursor:
+        try:
+            before = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise CustomException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                domain=DOMAIN,
+                hint="잘못된 커서입니다.",
+            ) from e
+
+    if not get_phonebook_by_id(db, phonebook_id, current_shop.id):
+        raise CustomException(status_code=status.HTTP_404_NOT_FOUND, domain=DOMAIN)
+
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    treatments = get_customer_timeline(
+        db,
+        current_shop.id,
+        phonebook_id,
+        before=before,
+        limit=limit + 1,
+    )
+    next_cursor = None
+    if len(treatments) > limit:
+        treatments = treatments[:limit]
+        last = treatments[-1]
+        next_cursor = encode_cursor(last.reserved_at, last.id)
+
+    summary = None
+    if before is None:
+        summary = CustomerTimelineSummary(
+            **get_customer_summary(db, current_shop.id, phonebook_id),
+        )
+
+    return CustomerTimelineResponse(
+        summary=summary,
+        items=[TreatmentResponse.model_validate(t) for t in treatments],
+        next_cursor=next_cursor,
+    )
+
+
+def merge_phonebooks_service(
+    db: Session,
+    phonebook_id: int,
+    data: PhonebookMergeRequest,
+    current_shop: Shop,
+) -> PhonebookMergeResponse:
+    """중복 전화번호부 병합 서비스.
+
+    병합 대상(source)의 예약을 남길 전화번호부로 옮기고 대상은 소프트 삭제한다.
+    남길 전화번호부에 그룹/메모가 비어 있으면 대상의 값으로 채운다.
+
+    Args:
+        db: 데이터베이스 세션
+        phonebook_id: 남길 전화번호부 ID
+        data: 병합 후 삭제할 전화번호부 ID 목록
+        current_shop: 현재 접속한 매장 정보
+
+    Returns:
+        PhonebookMergeResponse: 병합 결과
+
+    Raises:
+        CustomException:
+            - 400: 병합할 대상이 없음 (자기 자신만 지정)
+            - 404: 전화번호부를 찾을 수 없음
+            - 500: 데이터베이스 에러
+
+    """
+    source_ids = sorted(set(data.source_ids) - {phonebook_id})
+    if not source_ids:
+        raise CustomException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            domain=DOMAIN,
+            hint="병합할 다른 전화번호부를 선택하세요.",
+        )
+
+    phonebook = get_phonebook_by_id(db, phonebook_id, current_shop.id)
+    sources = get_phonebooks_by_ids(db, source_ids, current_shop.id)
+    if not phonebook or len(sources) != len(source_ids):
+        raise CustomException(status_code=status.HTTP_404_NOT_FOUND, domain=DOMAIN)
+
+    try:
+        for source in sorted(sources, key=lambda p: p.id):
+            if phonebook.group_name is None:
+                phonebook.group_name = source.group_name
+            if not phonebook.memo:
+                phonebook.memo = source.memo
+
+        moved = move_treatments_to_phonebook(
+            db,
+            current_shop.id,
+            source_ids,
+            phonebook.id,
+        )
+        for source in sources:
+            Phonebook.soft_delete(source)
+            _record_phonebook_event(db, OutboxEventType.PHONEBOOK_DELETED, source)
+        _record_phonebook_event(db, OutboxEventType.PHONEBOOK_UPDATED, phonebook)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+
+    bump_phonebook_suggest_version(current_shop.id)
+    clear_group_counts_redis(current_shop.id)
+
+    db.refresh(phonebook)
+    return PhonebookMergeResponse(
+        phonebook=PhonebookResponse.model_validate(phonebook),
+        merged_ids=source_ids,
+        moved_treatments=moved,
+    )
+
+
+def _record_phonebook_event(
+    db: Session,
+    event_type: OutboxEventType,
+    phonebook: Phonebook,
+) -> None:
+    """전화번호부 변경 이벤트를 같은 트랜잭션의 아웃박스에 기록."""
+    record_outbox_event(
+        db,
+        event_type=event_type,
+        aggregate_id=phonebook.id,
+        payload={
+            "phone_number": phonebook.phone_number,
+            "group_name": phonebook.group_name,
+        },
+        shop_id=phonebook.shop_id,
+    )
+
 
 def get_grouped_by_groupname_service(
     db: Session,
     current_shop: Shop,
-    with_items: bool,
 ) -> list[PhonebookGroupedByGroupnameResponse]:
-    """그룹명으로 그룹화된 전화번호부 조회 서비스.
+    """그룹명별 전화번호부 개수 조회 서비스 (항목 제외).
+
+    Redis 해시 캐시를 HGETALL 한 번으로 읽고, 없으면 DB에서 집계해 다시 만든다.
+    캐시는 생성/수정/삭제 시 증감으로 유지된다.
 
     Args:
         db: 데이터베이스 세션
         current_shop: 현재 접속한 매장 정보
-        with_items: True일 경우 각 그룹의 전화번호부 목록도 함께 반환
 
     Returns:
         list[PhonebookGroupedByGroupnameResponse]: 그룹별 전화번호부 정보
             - group_name: 그룹명
             - count: 해당 그룹의 전화번호부 개수
-            - items: 해당 그룹의 전화번호부 목록 (with_items=True일 때만)
+            - items: 빈 리스트 (항목은 stream_grouped_by_groupname_service 사용)
 
     """
-    # 그룹별 전화번호부 개수 조회
-    group_data = get_group_counts_by_groupname(db, current_shop.id)
-
-    # 그룹별 전화번호부 목록을 저장할 딕셔너리
-    group_map: dict[str | None, list[PhonebookResponse]] = defaultdict(list)
-
-    # with_items가 True일 경우에만 전체 전화번호부 조회
-    if with_items:
-        # 매장의 모든 전화번호부 조회 (삭제된 것 제외)
-        all_items = get_all_phonebooks_by_shop(db, current_shop.id)
-
-        # 그룹별로 전화번호부 분류
-        for item in all_items:
-            key = item.group_name
-            group_map[key].append(PhonebookResponse.model_validate(item))
-
-    # 결과 생성
-    result = []
-    for group_name, count in group_data:
-        # with_items가 True일 때만 items 포함, 아니면 빈 리스트
-        items = group_map[group_name] if with_items else []
-
-        result.append(
-            PhonebookGroupedByGroupnameResponse(
-                group_name=group_name,
-                count=count,
-                items=items,
-            ),
+    group_counts = get_group_counts_redis(current_shop.id)
+    if group_counts is None:
+        # 집계 중 변경이 있으면 저장을 건너뛰도록 집계 전에 세대 번호를 읽어 둔다
+        generation = get_group_counts_generation_redis(current_shop.id)
+        group_counts = dict(get_group_counts_by_groupname(db, current_shop.id))
+        set_group_counts_redis(current_shop.id, group_counts, generation)
+
+    # DB GROUP BY 결과와 같은 순서 (그룹 없음 먼저, 그룹명 순)
+    return [
+        PhonebookGroupedByGroupnameResponse(group_name=group_name, count=count)
+        for group_name, count in sorted(
+            group_counts.items(),
+            key=lambda item: (item[0] is not None, item[0] or ""),
         )
+    ]
+
+
+def stream_grouped_by_groupname_service(shop_id: int) -> Iterator[bytes]:
+    """그룹별 전화번호부(항목 포함)를 JSON 배열로 스트리밍하는 서비스.
+
+    group_name, name, id 순서로 서버 측 커서에서 행을 읽어 그룹이 바뀔 때마다
+    이전 그룹을 닫으므로, 전화번호부 크기와 관계없이 메모리 사용량이 일정하다.
+    응답 형식은 list[PhonebookGroupedByGroupnameResponse]와 같다.
+
+    요청 의존성(get_db) 세션은 응답 전송 전에 닫히므로 자체 세션을 연다.
+
+    Args:
+        shop_id: 매장 ID
+
+    Yields:
+        bytes: 약 STREAM_CHUNK_SIZE 단위로 묶은 JSON 조각
 
-    return result
+    """
+    buffer: list[str] = []
+    buffered = 0
+
+    def emit(text: str) -> Iterator[bytes]:
+        nonlocal buffered
+        buffer.append(text)
+        buffered += len(text)
+        if buffered >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            buffered = 0
+
+    db = SessionLocal()
+    try:
+        yield from emit("[")
+        current_group: object = _NO_GROUP
+        count = 0
+        for row in stream_phonebooks_by_group(db, shop_id):
+            if row.group_name != current_group:
+                if current_group is not _NO_GROUP:
+                    yield from emit(f'],"count":{count}}},')
+                current_group = row.group_name
+                count = 0
+                group_json = json.dumps(current_group, ensure_ascii=False)
+                yield from emit(f'{{"group_name":{group_json},"items":[')
+            item = PhonebookResponse.model_validate(row).model_dump_json()
+            yield from emit(item if count == 0 else f",{item}")
+            count += 1
+        if current_group is not _NO_GROUP:
+            yield from emit(f'],"count":{count}}}')
+        yield from emit("]")
+        yield "".join(buffer).encode()
+    except SQLAlchemyError:
+        # 이미 200 응답을 보내기 시작했으므로 상태 코드를 바꿀 수 없음
+        logging.exception("Phonebook group stream failed (shop_id=%s)", shop_id)
+        raise
+    finally:
+        db.close()
 
 
 def check_duplicate_phone_number_service(
@@ -336,3 +612,50 @@ def check_duplicate_phone_number_service(
             domain=DOMAIN,
             exception=e,
         )
+
+
+def check_duplicate_phone_numbers_service(
+    db: Session,
+    current_shop: Shop,
+    data: DuplicateCheckBatchRequest,
+) -> DuplicateCheckBatchResponse:
+    """여러 전화번호 중복 체크 서비스 (주소록 동기화용).
+
+    Args:
+        db: 데이터베이스 세션
+        current_shop: 현재 접속한 매장 정보
+        data: 중복 체크할 전화번호 목록
+
+    Returns:
+        DuplicateCheckBatchResponse: 요청 번호별 기존 전화번호부 ID
+
+    """
+    # 요청 번호 → 정규화 번호 (유효하지 않으면 제외)
+    normalized = {
+        phone_number: normalize_korean_phone_number(phone_number)
+        for phone_number in data.phone_numbers
+        if is_valid_korean_phone_number(phone_number)
+    }
+    invalid = [p for p in data.phone_numbers if p not in normalized]
+
+    try:
+        existing = get_phonebook_ids_by_phone_numbers(
+            db,
+            list(set(normalized.values())),
+            current_shop.id,
+        )
+    except SQLAlchemyError as e:
+        logging.exception("SQLAlchemyError during batch duplicate check")
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+
+    results = {
+        phone_number: existing.get(to_phone_digits(normalized[phone_number]))
+        if phone_number in normalized
+        else None
+        for phone_number in data.phone_numbers
+    }
+    return DuplicateCheckBatchResponse(results=results, invalid=invalid)
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import chain
+
+from fastapi import status
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    PHONEBOOK_SUGGEST_MAX_AGE_SECONDS,
+    PHONEBOOK_SUGGEST_MAX_SHOPS,
+)
+from app.crud.phonebook_crud import get_phonebook_suggest_rows
+from app.exceptions import CustomException
+from app.models.shop import Shop
+from app.schemas.phonebook import PhonebookSuggestItem
+from app.utils.hangul import (
+    HANGUL_SYLLABLE_END,
+    HANGUL_SYLLABLE_START,
+    extract_choseong,
+    is_choseong_only,
+)
+from app.utils.prefix_index import PrefixIndex
+from app.utils.redis.phonebook import get_phonebook_suggest_version
+
+DOMAIN = "PHONEBOOK"
+
+
+@dataclass(frozen=True)
+class ShopSuggestIndex:
+    """샵 1곳의 자동완성 인덱스 (생성 후 변경하지 않음)."""
+
+    version: str | None
+    built_at: float
+    entries: list[tuple[int, str, str]]  # (id, name, phone_number)
+    names: PrefixIndex  # 이름 전체
+    given_names: PrefixIndex  # 성을 뺀 이름 ("민수" → 김민수)
+    choseong: PrefixIndex  # 이름 초성 ("ㄱㅁㅅ")
+    given_choseong: PrefixIndex  # 성을 뺀 이름 초성 ("ㅁㅅ")
+    phone_prefix: PrefixIndex  # 숫자만 남긴 번호 앞자리
+    phone_suffix: PrefixIndex  # 뒤집은 번호 (뒷자리 검색)
+
+    def is_fresh(self, version: str | None) -> bool:
+        age = time.monotonic() - self.built_at
+        return self.version == version and age < PHONEBOOK_SUGGEST_MAX_AGE_SECONDS
+
+    def search(self, q: str, limit: int) -> list[PhonebookSuggestItem]:
+        seen: set[int] = set()
+        items: list[PhonebookSuggestItem] = []
+        for entry_no in self._candidates(q):
+            if entry_no in seen:
+                continue
+            seen.add(entry_no)
+            phonebook_id, name, phone_number = self.entries[entry_no]
+            items.append(
+                PhonebookSuggestItem(
+                    id=phonebook_id,
+                    name=name,
+                    phone_number=phone_number,
+                ),
+            )
+            if len(items) >= limit:
+                break
+        return items
+
+    def _candidates(self, q: str) -> Iterator[int]:
+        query = _normalize_name(q)
+        digits = query.replace("-", "")
+        if digits.isdigit():
+            if digits.startswith("0"):
+                return self.phone_prefix.search(digits)
+            return self.phone_suffix.search(digits[::-1])
+        if is_choseong_only(query):
+            return chain(
+                self.choseong.search(query),
+                self.given_choseong.search(query),
+            )
+        return chain(self.names.search(query), self.given_names.search(query))
+
+
+_indexes: OrderedDict[int, ShopSuggestIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+_build_locks: dict[int, threading.Lock] = {}
+
+
+def suggest_phonebook_service(
+    db: Session,
+    current_shop: Shop,
+    q: str,
+    limit: int,
+) -> list[PhonebookSuggestItem]:
+    """전화번호부 자동완성 서비스.
+
+    샵별 인덱스를 프로세스 메모리에 두고, Redis 버전 키가 바뀌었을 때
+    (전화번호부 생성/수정/삭제)만 DB에서 다시 만든다.
+
+    Args:
+        db: 데이터베이스 세션 (인덱스 생성 시에만 사용)
+        current_shop: 현재 접속한 매장 정보
+        q: 이름, 초성, 전화번호 앞자리(0으로 시작) 또는 뒷자리
+        limit: 최대 결과 수
+
+    Returns:
+        list[PhonebookSuggestItem]: 이름 전체 일치 → 성을 뺀 이름 일치 순
+
+    """
+    try:
+        index = _get_shop_index(db, current_shop.id)
+    except SQLAlchemyError as e:
+        raise CustomException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+    return index.search(q, limit)
+
+
+def _get_shop_index(db: Session, shop_id: int) -> ShopSuggestIndex:
+    version = get_phonebook_suggest_version(shop_id)
+    index = _indexes.get(shop_id)
+    if index is not None and index.is_fresh(version):
+        return index
+
+    # 같은 샵 인덱스를 여러 요청이 동시에 만들지 않도록 샵별 잠금
+    with _indexes_lock:
+        build_lock = _build_locks.setdefault(shop_id, threading.Lock())
+    with build_lock:
+        index = _indexes.get(shop_id)
+        if index is not None and index.is_fresh(version):
+            return index
+        index = _build_shop_index(get_phonebook_suggest_rows(db, shop_id), version)
+
+    with _indexes_lock:
+        _indexes[shop_id] = index
+        _indexes.move_to_end(shop_id)
+        while len(_indexes) > PHONEBOOK_SUGGEST_MAX_SHOPS:
+            evicted, _ = _indexes.popitem(last=False)
+            _build_locks.pop(evicted, None)
+    return index
+
+
+def _build_shop_index(rows: list, version: str | None) -> ShopSuggestIndex:
+    entries: list[tuple[int, str, str]] = []
+    names, given_names, choseong, given_choseong = [], [], [], []
+    phone_prefix, phone_suffix = [], []
+
+    for entry_no, row in enumerate(rows):
+        entries.append((row.id, row.name, row.phone_number))
+        name = _normalize_name(row.name)
+        initials = extract_choseong(name)
+        names.append((name, entry_no))
+        choseong.append((initials, entry_no))
+        if len(name) > 1 and _is_hangul_syllable(name[0]):
+            given_names.append((name[1:], entry_no))
+            given_choseong.append((initials[1:], entry_no))
+        if row.phone_digits:
+            phone_prefix.append((row.phone_digits, entry_no))
+            phone_suffix.append((row.phone_digits[::-1], entry_no))
+
+    return ShopSuggestIndex(
+        version=version,
+        built_at=time.monotonic(),
+        entries=entries,
+        names=PrefixIndex(names),
+        given_names=PrefixIndex(given_names),
+        choseong=PrefixIndex(choseong),
+        given_choseong=PrefixIndex(given_choseong),
+        phone_prefix=PrefixIndex(phone_prefix),
+        phone_suffix=PrefixIndex(phone_suffix),
+    )
+
+
+def _normalize_name(text: str) -> str:
+    return "".join(text.split()).lower()
+
+
+def _is_hangul_syllable(char: str) -> bool:
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
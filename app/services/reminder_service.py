@@ -0,0 +1,156 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    RESERVATION_REMINDER_BATCH_SIZE,
+    RESERVATION_REMINDER_MINUTES,
+)
+from app.core.push import FCM_MULTICAST_LIMIT, get_push_transport
+from app.crud.device_push_token_crud import (
+    deactivate_device_tokens_by_token,
+    get_active_tokens_by_shop_ids,
+)
+from app.crud.treatment_crud import get_treatments_due_for_reminder
+from app.utils.datetime import now_kst
+from app.utils.redis.reminder import claim_reminders_redis, release_reminders_redis
+
+DOMAIN = "REMINDER"
+
+
+def send_reservation_reminders_service(
+    db: Session,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """예약 시작 N분 전 리마인더 푸시 발송 서비스.
+
+    - (reserved_at, status) 인덱스 범위 조회를 키셋 페이징으로 배치 처리
+    - 예약별 Redis 선점 키로 중복 발송 방지 (멱등)
+    - 샵 단위로 묶어서 샵에 등록된 디바이스에 멀티캐스트 1회 발송
+
+    :param db: DB 세션
+    :param now: 기준 시각 (KST, naive - reserved_at 저장 기준과 동일). 없으면 현재 시각
+    :return: 처리 통계 (scanned, sent, skipped, no_token, failed, pruned)
+    """
+    now = now or now_kst().replace(tzinfo=None)
+    window_end = now + timedelta(minutes=RESERVATION_REMINDER_MINUTES)
+
+    stats = {
+        "scanned": 0,
+        "sent": 0,
+        "skipped": 0,
+        "no_token": 0,
+        "failed": 0,
+        "pruned": 0,
+    }
+    cursor: tuple[datetime, int] | None = None
+    prunable_tokens: list[str] = []
+
+    while True:
+        rows = get_treatments_due_for_reminder(
+            db,
+            window_start=now,
+            window_end=window_end,
+            after=cursor,
+            limit=RESERVATION_REMINDER_BATCH_SIZE,
+        )
+        if not rows:
+            break
+
+        stats["scanned"] += len(rows)
+        cursor = (rows[-1].reserved_at, rows[-1].id)
+
+        # 이미 발송된 예약은 제외
+        claimed = claim_reminders_redis([(r.id, r.reserved_at) for r in rows])
+        rows_by_shop: dict[int, list[Row]] = defaultdict(list)
+        for row, is_claimed in zip(rows, claimed, strict=True):
+            if is_claimed:
+                rows_by_shop[row.shop_id].append(row)
+            else:
+                stats["skipped"] += 1
+
+        tokens_by_shop = get_active_tokens_by_shop_ids(db, list(rows_by_shop))
+        for shop_id, shop_rows in rows_by_shop.items():
+            tokens = tokens_by_shop.get(shop_id)
+            if not tokens:
+                stats["no_token"] += len(shop_rows)
+                continue
+
+            try:
+                prunable_tokens.extend(_send_shop_reminder(tokens, shop_rows))
+                stats["sent"] += len(shop_rows)
+            except Exception:
+                # 선점 해제 후 다음 주기에 재시도
+                logging.exception("Reservation reminder failed for shop %s", shop_id)
+                release_reminders_redis([(r.id, r.reserved_at) for r in shop_rows])
+                stats["failed"] += len(shop_rows)
+
+        if len(rows) < RESERVATION_REMINDER_BATCH_SIZE:
+            break
+
+    # FCM이 만료로 응답한 토큰 정리
+    if prunable_tokens:
+        stats["pruned"] = deactivate_device_tokens_by_token(db, prunable_tokens)
+        db.commit()
+
+    logging.info("Reservation reminders processed: %s", stats)
+    return stats
+
+
+def _send_shop_reminder(tokens: list[str], rows: list[Row]) -> list[str]:
+    """샵 하나의 리마인더를 멀티캐스트로 발송 (토큰 500개 단위 분할).
+
+    첫 묶음부터 실패하면 예외를 올려 호출부가 선점을 해제하고 재시도하게 하고,
+    이미 일부 묶음이 발송된 뒤 실패하면 중복 알림을 막기 위해 선점을 유지한다.
+
+    :return: 비활성화 대상 토큰 목록
+    """
+    title, body = _build_reminder_message(rows)
+    data = {
+        "type": "RESERVATION_REMINDER",
+        "treatment_ids": ",".join(str(r.id) for r in rows),
+    }
+    transport = get_push_transport()
+    prunable_tokens: list[str] = []
+    chunks = [
+        tokens[i : i + FCM_MULTICAST_LIMIT]
+        for i in range(0, len(tokens), FCM_MULTICAST_LIMIT)
+    ]
+    for sent_chunks, chunk in enumerate(chunks):
+        try:
+            result = transport.send_multicast(
+                tokens=chunk,
+                title=title,
+                body=body,
+                data=data,
+            )
+        except Exception:
+            if not sent_chunks:
+                raise
+            logging.exception(
+                "Reservation reminder partially sent (%s/%s chunks)",
+                sent_chunks,
+                len(chunks),
+            )
+            break
+        prunable_tokens.extend(result.prunable_tokens)
+    return prunable_tokens
+
+
+def _build_reminder_message(rows: list[Row]) -> tuple[str, str]:
+    first = rows[0]
+    customer = first.customer_name or "고객"
+
+    if len(rows) == 1:
+        return (
+            "예약 알림",
+            f"{first.reserved_at:%H:%M} {customer}님 예약이 곧 시작됩니다.",
+        )
+    return (
+        "예약 알림",
+        f"{first.reserved_at:%H:%M} {customer}님 외 {len(rows) - 1}건의 "
+        "예약이 곧 시작됩니다.",
+    )
@@ -0,0 +1,45 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import Request
+
+from app.core.config import SCHEDULE_STREAM_HEARTBEAT_SECONDS
+from app.models.shop import Shop
+from app.utils.redis.schedule import schedule_event_hub
+
+# 연결이 끊겼을 때 클라이언트 재연결 대기 시간 (밀리초)
+SSE_RETRY_MS = 3000
+
+
+async def stream_schedule_events_service(
+    request: Request,
+    current_shop: Shop,
+) -> AsyncIterator[str]:
+    """샵 예약 변경 이벤트를 SSE 프레임으로 스트리밍.
+
+    - ready: 연결 직후 1회 (클라이언트는 이때 목록을 한 번 조회)
+    - treatment.created / treatment.updated / treatment.status_changed: 변경분
+    - resync: 이벤트 유실 가능성이 있으니 목록을 다시 조회
+    - 주석 프레임(": ping"): 프록시 유휴 타임아웃 방지용 하트비트
+    """
+    shop_id = current_shop.id
+    queue = schedule_event_hub.subscribe(shop_id)
+    try:
+        ready = json.dumps({"shop_id": shop_id})
+        yield f"retry: {SSE_RETRY_MS}\nevent: ready\ndata: {ready}\n\n"
+
+        while True:
+            try:
+                frame = await asyncio.wait_for(
+                    queue.get(),
+                    timeout=SCHEDULE_STREAM_HEARTBEAT_SECONDS,
+                )
+            except TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": ping\n\n"
+                continue
+            yield frame
+    finally:
+        schedule_event_hub.unsubscribe(shop_id, queue)
@@ -5,16 +5,22 @@ from sqlalchemy.orm import Session
 
 from app.crud.shop_crud import (
     create_shop,
+    get_shop_by_id,
     get_user_shop_by_id,
     get_user_shops,
 )
 from app.crud.shop_user_crud import ShopUser, create_shop_user
+from app.enum.outbox_event import OutboxEventType
 from app.exceptions import CustomException
 from app.models.shop import Shop
 from app.models.user import User
 from app.schemas.shop import ShopCreate
+from app.services.outbox_service import record_outbox_event
+from app.services.shop_user_service import get_shop_membership_service
 from app.utils.redis.shop import (
+    clear_memberships_local,
     clear_selected_shop_redis,
+    clear_shop_local,
     get_selected_shop_redis,
     set_selected_shop_redis,
 )
@@ -51,10 +57,19 @@ def upsert_shop_service(
                 is_primary_owner=1,
             )
             shop_user = create_shop_user(db, shop_user_data)
+            record_outbox_event(
+                db,
+                event_type=OutboxEventType.SHOP_CREATED,
+                aggregate_id=shop.id,
+                payload={"user_id": user.id},
+                shop_id=shop.id,
+            )
 
             db.commit()
             db.refresh(shop)
             db.refresh(shop_user)
+            # 새 샵이 소속 권한에 반영되도록 캐시 무효화
+            clear_memberships_local(user.id)
         else:
             shop = get_user_shop_by_id(db, user.id, shop_id)
             if not shop:
@@ -65,8 +80,17 @@ def upsert_shop_service(
 
             for key, value in shop_data.model_dump().items():
                 setattr(shop, key, value)
+            record_outbox_event(
+                db,
+                event_type=OutboxEventType.SHOP_UPDATED,
+                aggregate_id=shop.id,
+                payload={"user_id": user.id},
+                shop_id=shop.id,
+            )
             db.commit()
             db.refresh(shop)
+            # 모든 워커의 get_current_shop 캐시 무효화
+            clear_shop_local(shop.id)
     except SQLAlchemyError as e:
         db.rollback()
         raise CustomException(
@@ -120,7 +144,10 @@ def set_selected_shop_service(db: Session, user: User, shop_id: int) -> None:
     :return: 선택된 샵 객체
     """
     try:
-        shop = get_user_shop_by_id(db, user.id, shop_id)
+        # 소유자뿐 아니라 초대로 가입한 매니저(shop_user)도 선택 가능
+        if not get_shop_membership_service(db, user.id, shop_id):
+            raise CustomException(status_code=status.HTTP_404_NOT_FOUND, domain=DOMAIN)
+        shop = get_shop_by_id(db, shop_id)
         if not shop:
             raise CustomException(status_code=status.HTTP_404_NOT_FOUND, domain=DOMAIN)
         set_selected_shop_redis(user.id, shop.id)
@@ -184,9 +211,10 @@ def get_selected_shop_service(db: Session, user: User) -> Shop:
                 code="NOT_SELECTED",
             )
 
-        shop = get_user_shop_by_id(db, user.id, shop_id)
-        if shop:
-            return shop
+        if get_shop_membership_service(db, user.id, shop_id):
+            shop = get_shop_by_id(db, shop_id)
+            if shop:
+                return shop
 
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,10 +2,15 @@ from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.crud.shop_user_crud import get_shop_user, get_shop_users_by_shop_id
+from app.crud.shop_user_crud import (
+    get_memberships_by_user,
+    get_shop_user,
+    get_shop_users_by_shop_id,
+)
 from app.exceptions import CustomException
 from app.models.user import User
 from app.schemas.shop_user import ShopUserUserResponse
+from app.utils.redis.shop import get_memberships_local, set_memberships_local
 
 DOMAIN = "SHOP_USER"
 
@@ -47,3 +52,23 @@ def get_shop_users_service(
             domain=DOMAIN,
             exception=e,
         ) from e
+
+
+def get_shop_membership_service(
+    db: Session,
+    user_id: int,
+    shop_id: int,
+) -> dict | None:
+    """유저의 샵 소속 권한 조회 (워커 로컬 캐시 → DB).
+
+    :param db: DB 세션 (캐시에 없을 때만 사용)
+    :param user_id: 유저 ID
+    :param shop_id: 샵 ID
+    :return: {"role": 샵 내 권한, "is_primary_owner": 대표 여부}, 소속이 아니면 None
+    """
+    memberships = get_memberships_local(user_id)
+    if memberships is None:
+        loaded = get_memberships_by_user(db, user_id)
+        set_memberships_local(user_id, loaded)
+        return loaded.get(shop_id)
+    return memberships.get(str(shop_id))
@@ -6,6 +6,7 @@ from typing import TypeVar
 
 from sqlalchemy.orm import Session
 
+from app.core.config import DASHBOARD_FORCE_REFRESH_MIN_AGE_SECONDS
 from app.crud.statistics_crud import (
     get_staff_summary,
     get_today_reservation_list_with_customer_insight,
@@ -25,21 +26,37 @@ from app.schemas.dashboard import (
     TreatmentSummarySchema,
 )
 from app.utils.redis.dashboard import (
-    clear_dashboard_cache,
+    DAY_FIELDS,
+    acquire_dashboard_refresh_lock,
     get_dashboard_cache,
+    get_dashboard_cache_age,
+    get_month_period,
+    release_dashboard_refresh_lock,
     set_dashboard_cache,
 )
 
 T = TypeVar("T")
 
 
+def _start_force_refresh(shop_id: int, period: str) -> str | None:
+    """force_refresh 요청을 실제로 재계산할지 결정 (재계산 시 락 토큰 반환).
+
+    - 일별 캐시가 없으면 어차피 새로 계산하므로 재계산하지 않음
+    - 가장 최근 캐시가 최소 경과 시간보다 어리면 무시
+    - 같은 샵/일자의 재계산이 이미 진행 중이면 합류하지 않고 현재 캐시 사용
+    """
+    age = get_dashboard_cache_age(shop_id, DAY_FIELDS, period)
+    if age is None or age < DASHBOARD_FORCE_REFRESH_MIN_AGE_SECONDS:
+        return None
+    return acquire_dashboard_refresh_lock(shop_id, period)
+
+
 def get_dashboard_summary_service(
     db: Session,
     shop: Shop,
     params: DashboardFilter,
 ) -> dict:
     target_date = params.target_date
-    force_refresh = params.force_refresh
 
     month_start = target_date.replace(day=1)
     month_end = date(
@@ -49,13 +66,22 @@ def get_dashboard_summary_service(
     )
 
     # ---- 캐시 키 정의 ----
-    t_target_key = ("summary", target_date.isoformat())
-    t_month_key = ("summary", month_start.isoformat())
-    s_target_key = ("sales", target_date.isoformat())
-    s_month_key = ("sales", month_start.isoformat())
-    c_insight_key = ("customer_insight", target_date.isoformat())
-    staff_target_key = ("staff_summary", target_date.isoformat())
-    staff_month_key = ("staff_summary", month_start.isoformat())
+    day_period = target_date.isoformat()
+    month_period = get_month_period(target_date)
+    t_target_key = ("summary", day_period)
+    t_month_key = ("summary", month_period)
+    s_target_key = ("sales", day_period)
+    s_month_key = ("sales", month_period)
+    c_insight_key = ("customer_insight", day_period)
+    staff_target_key = ("staff_summary", day_period)
+    staff_month_key = ("staff_summary", month_period)
+
+    # ---- force_refresh: 대상 일자 항목만, 최소 경과 시간/중복 실행 제한 ----
+    # 월별 항목은 예약 변경 시 outbox 에서 무효화되므로 캐시를 그대로 사용
+    refresh_lock = (
+        _start_force_refresh(shop.id, day_period) if params.force_refresh else None
+    )
+    force_refresh = refresh_lock is not None
 
     # ---- 유틸: 이터러블/Row/직렬화 보조 ----
     def _is_iterable_but_not_str(x: object) -> bool:
@@ -89,11 +115,9 @@ def get_dashboard_summary_service(
         force_refresh: bool = False,
     ) -> list[T] | T:
         field, period = key_tuple
-        if force_refresh:
-            clear_dashboard_cache(shop.id, field, period)
-
-        cached = get_dashboard_cache(shop.id, field, period)
-        if cached is not None and not force_refresh:
+        # force_refresh: 캐시를 지우지 않고 재계산해 덮어씀 (그동안은 기존 캐시 사용)
+        cached = None if force_refresh else get_dashboard_cache(shop.id, field, period)
+        if cached is not None:
             # 캐시 히트: 모델로 복원
             if pydantic_model:
                 if isinstance(cached, list):
@@ -167,89 +191,90 @@ def get_dashboard_summary_service(
         return result_obj
 
     # ---- 실제 데이터 획득 ----
-    treatment_target_summary = get_or_set_cache(
-        t_target_key,
-        lambda: get_treatment_summary(
-            db,
-            shop.id,
-            start_date=target_date,
-            end_date=target_date,
-        ),
-        pydantic_model=TreatmentSummarySchema,
-        force_refresh=force_refresh,
-    )
+    try:
+        treatment_target_summary = get_or_set_cache(
+            t_target_key,
+            lambda: get_treatment_summary(
+                db,
+                shop.id,
+                start_date=target_date,
+                end_date=target_date,
+            ),
+            pydantic_model=TreatmentSummarySchema,
+            force_refresh=force_refresh,
+        )
 
-    treatment_month_summary = get_or_set_cache(
-        t_month_key,
-        lambda: get_treatment_summary(
-            db,
-            shop.id,
-            start_date=month_start,
-            end_date=month_end,
-        ),
-        pydantic_model=TreatmentSummarySchema,
-        force_refresh=force_refresh,
-    )
+        treatment_month_summary = get_or_set_cache(
+            t_month_key,
+            lambda: get_treatment_summary(
+                db,
+                shop.id,
+                start_date=month_start,
+                end_date=month_end,
+            ),
+            pydantic_model=TreatmentSummarySchema,
+        )
 
-    treatment_sales_target = get_or_set_cache(
-        s_target_key,
-        lambda: get_treatment_sales_summary(
-            db,
-            shop.id,
-            start_date=target_date,
-            end_date=target_date,
-        ),
-        pydantic_model=TreatmentSalesItem,
-        force_refresh=force_refresh,
-    )
+        treatment_sales_target = get_or_set_cache(
+            s_target_key,
+            lambda: get_treatment_sales_summary(
+                db,
+                shop.id,
+                start_date=target_date,
+                end_date=target_date,
+            ),
+            pydantic_model=TreatmentSalesItem,
+            force_refresh=force_refresh,
+        )
 
-    treatment_sales_month = get_or_set_cache(
-        s_month_key,
-        lambda: get_treatment_sales_summary(
-            db,
-            shop.id,
-            start_date=month_start,
-            end_date=month_end,
-        ),
-        pydantic_model=TreatmentSalesItem,
-        force_refresh=force_refresh,
-    )
+        treatment_sales_month = get_or_set_cache(
+            s_month_key,
+            lambda: get_treatment_sales_summary(
+                db,
+                shop.id,
+                start_date=month_start,
+                end_date=month_end,
+            ),
+            pydantic_model=TreatmentSalesItem,
+        )
 
-    customer_insight = get_or_set_cache(
-        c_insight_key,
-        lambda: get_today_reservation_list_with_customer_insight(
-            db,
-            shop.id,
-            start_date=target_date,
-            end_date=target_date,
-        ),
-        pydantic_model=DashboardCustomerInsight,
-        force_refresh=force_refresh,
-    )
+        customer_insight = get_or_set_cache(
+            c_insight_key,
+            lambda: get_today_reservation_list_with_customer_insight(
+                db,
+                shop.id,
+                start_date=target_date,
+                end_date=target_date,
+            ),
+            pydantic_model=DashboardCustomerInsight,
+            force_refresh=force_refresh,
+        )
 
-    staff_target_summary = get_or_set_cache(
-        staff_target_key,
-        lambda: get_staff_summary(
-            db,
-            shop.id,
-            start_date=target_date,
-            end_date=target_date,
-        ),
-        pydantic_model=DashboardStaffSummaryItem,
-        force_refresh=force_refresh,
-    )
+        staff_target_summary = get_or_set_cache(
+            staff_target_key,
+            lambda: get_staff_summary(
+                db,
+                shop.id,
+                start_date=target_date,
+                end_date=target_date,
+            ),
+            pydantic_model=DashboardStaffSummaryItem,
+            force_refresh=force_refresh,
+        )
 
-    staff_month_summary = get_or_set_cache(
-        staff_month_key,
-        lambda: get_staff_summary(
-            db,
-            shop.id,
-            start_date=month_start,
-            end_date=month_end,
-        ),
-        pydantic_model=DashboardStaffSummaryItem,
-        force_refresh=force_refresh,
-    )
+        staff_month_summary = get_or_set_cache(
+            staff_month_key,
+            lambda: get_staff_summary(
+                db,
+                shop.id,
+                start_date=month_start,
+                end_date=month_end,
+            ),
+            pydantic_model=DashboardStaffSummaryItem,
+        )
+    finally:
+        if refresh_lock is not None:
+            release_dashboard_refresh_lock(shop.id, day_period, refresh_lock)
 
     # ---- 최종 결과 조립 후 리턴 ----
     return DashboardSummaryResponse(
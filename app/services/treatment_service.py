@@ -1,3 +1,6 @@
+from datetime import datetime
+from enum import Enum
+
 from fastapi import status
 from fastapi_pagination import Page
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,6 +13,7 @@ from app.crud.treatment_crud import (
     get_treatment_list,
     validate_menu_detail_exists,
 )
+from app.enum.outbox_event import OutboxEventType
 from app.exceptions import CustomException
 from app.models.shop import Shop
 from app.models.treatment import Treatment
@@ -22,9 +26,23 @@ from app.schemas.treatment import (
     TreatmentUpdate,
 )
 from app.schemas.treatment_item import TreatmentItemCreate
+from app.services.outbox_service import record_outbox_event
+from app.utils.redis.schedule import publish_schedule_event
 
 DOMAIN = "TREATMENT"
 
+# 실시간 예약 보드로 전달하는 필드
+SCHEDULE_BOARD_FIELDS = (
+    "reserved_at",
+    "status",
+    "staff_user_id",
+    "phonebook_id",
+    "customer_name",
+    "customer_phone",
+    "payment_method",
+    "memo",
+)
+
 
 def get_treatment_list_service(
     db: Session,
@@ -78,13 +96,31 @@ def upsert_treatment_service(
     try:
         if treatment_id is None:
             treatment = _create_treatment(db, data, current_shop)
+            previous = None
+            event_type = OutboxEventType.TREATMENT_CREATED
         else:
-            treatment = _update_treatment(db, data, current_shop, treatment_id)
+            treatment, previous = _update_treatment(
+                db,
+                data,
+                current_shop,
+                treatment_id,
+            )
+            event_type = OutboxEventType.TREATMENT_UPDATED
 
         _upsert_treatment_items(db, treatment.id, data.treatment_items)
 
+        # 부수효과(캐시 무효화, 알림 등)는 같은 트랜잭션의 아웃박스로 위임
+        record_outbox_event(
+            db,
+            event_type=event_type,
+            aggregate_id=treatment.id,
+            payload=_treatment_event_payload(treatment, previous),
+            shop_id=treatment.shop_id,
+        )
+
         db.commit()
         db.refresh(treatment)
+        _publish_schedule_delta(treatment, previous)
         return TreatmentSimpleResponse.model_validate(treatment)
 
     except CustomException:
@@ -112,7 +148,7 @@ def _update_treatment(
     data: TreatmentUpdate,
     shop: Shop,
     treatment_id: int,
-) -> Treatment:
+) -> tuple[Treatment, dict]:
     treatment = get_treatment_by_id(db, treatment_id)
     if not treatment or treatment.shop_id != shop.id:
         raise CustomException(
@@ -120,10 +156,51 @@ def _update_treatment(
             domain=DOMAIN,
             detail="시술 예약을 찾을 수 없습니다.",
         )
+    previous = _treatment_snapshot(treatment)
     update_data = data.model_dump(exclude={"treatment_items"}, exclude_unset=True)
     for key, value in update_data.items():
         setattr(treatment, key, value)
-    return treatment
+    return treatment, previous
+
+
+def _treatment_snapshot(treatment: Treatment) -> dict:
+    """예약 보드 필드 스냅샷 (JSON 직렬화 가능한 값)."""
+    snapshot = {}
+    for field in SCHEDULE_BOARD_FIELDS:
+        value = getattr(treatment, field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Enum):
+            value = value.value
+        snapshot[field] = value
+    return snapshot
+
+
+def _publish_schedule_delta(treatment: Treatment, previous: dict | None) -> None:
+    """실시간 예약 보드에 변경분만 발행 (생성 시에는 전체 필드)."""
+    current = _treatment_snapshot(treatment)
+    if previous is None:
+        event = OutboxEventType.TREATMENT_CREATED.value
+        delta = current
+    else:
+        delta = {k: v for k, v in current.items() if previous.get(k) != v}
+        event = (
+            "treatment.status_changed"
+            if "status" in delta
+            else OutboxEventType.TREATMENT_UPDATED.value
+        )
+    publish_schedule_event(treatment.shop_id, event, {"id": treatment.id, **delta})
+
+
+def _treatment_event_payload(treatment: Treatment, previous: dict | None) -> dict:
+    """아웃박스 이벤트 payload (변경 전/후 예약일시와 상태)."""
+    current = _treatment_snapshot(treatment)
+    return {
+        "reserved_at": current["reserved_at"],
+        "status": current["status"],
+        "previous_reserved_at": previous["reserved_at"] if previous else None,
+        "previous_status": previous["status"] if previous else None,
+    }
 
 
 def _upsert_treatment_items(
@@ -1,7 +1,13 @@
 from fastapi import status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.password_hasher import (
+    BUSY_RETRY_AFTER_SECONDS,
+    PasswordHasherBusyError,
+    hash_password_async,
+)
 from app.core.security import hash_password
 from app.crud.shop_invite_curd import get_invite_by_code
 from app.crud.shop_user_crud import ShopUser, create_shop_user
@@ -23,6 +29,8 @@ from app.schemas.user import (
     UserUpdate,
 )
 from app.utils.redis.auth import clear_refresh_token_redis
+from app.utils.redis.shop import clear_memberships_local
+from app.utils.redis.user import clear_user_redis
 
 DOMAIN = "USER"
 
@@ -64,16 +72,42 @@ def validate_user_creation(data: UserCreate, db: Session) -> ShopInvite | None:
 
 
 # 회원 생성
-def create_user_service(db: Session, user_create: UserCreate) -> UserResponse:
-    role = user_create.role
+async def create_user_service(db: Session, user_create: UserCreate) -> UserResponse:
+    """회원 가입.
 
+    검증/저장은 API 스레드풀에서, bcrypt 해시는 해시 전용 풀에서 실행한다.
+    """
     # 1. 유저 생성 유효성 검사
-    invite = validate_user_creation(user_create, db)
+    invite = await run_in_threadpool(validate_user_creation, user_create, db)
 
     # 3. 유저 생성 준비
     user_data = user_create.model_dump(exclude={"invite_code"})
-    user_data["password"] = hash_password(user_create.password)
+    try:
+        user_data["password"] = await hash_password_async(user_create.password)
+    except PasswordHasherBusyError as e:
+        raise CustomException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            domain=DOMAIN,
+            code="BUSY",
+            hint="가입 요청이 몰려 해시 풀이 가득 참. 잠시 후 재시도",
+            headers={"Retry-After": str(BUSY_RETRY_AFTER_SECONDS)},
+        ) from e
+
+    return await run_in_threadpool(
+        _save_new_user,
+        db,
+        user_data,
+        user_create.role,
+        invite,
+    )
 
+
+def _save_new_user(
+    db: Session,
+    user_data: dict,
+    role: UserRole,
+    invite: ShopInvite | None,
+) -> UserResponse:
     try:
         user = create_user(db, user_data)
 
@@ -107,6 +141,10 @@ def create_user_service(db: Session, user_create: UserCreate) -> UserResponse:
             exception=e,
         ) from e
 
+    if role == UserRole.MANAGER:
+        # 초대받은 샵이 소속 권한에 반영되도록 캐시 무효화
+        clear_memberships_local(user.id)
+
     return UserResponse.model_validate(user)
 
 
@@ -134,6 +172,8 @@ def update_user_service(
 
         # 사용자 정보 업데이트
         updated_user = update_user_db(db, user, user_data)
+        # 모든 워커의 사용자 캐시 무효화 (이름/권한 변경 반영)
+        clear_user_redis(user.id)
         return UserResponse.model_validate(updated_user)
     except IntegrityError as e:
         raise CustomException(
@@ -182,6 +222,9 @@ def delete_user_service(
             exception=e,
         ) from e
 
+    clear_user_redis(user.id)
+    clear_memberships_local(user.id)
+
 
 def check_user_email_service(db: Session, email: str) -> UserEmailCheckResponse:
     """이메일 중복 체크 서비스."""
@@ -0,0 +1,204 @@
+import codecs
+import csv
+import io
+import quopri
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+# 인코딩 판별에 사용하는 앞부분 크기
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+# CSV 헤더 별칭 (소문자/공백 제거 후 비교)
+CSV_HEADER_ALIASES = {
+    "name": ("name", "이름", "성명", "고객명", "고객이름", "fullname"),
+    "phone_number": (
+        "phone",
+        "phonenumber",
+        "mobile",
+        "tel",
+        "전화번호",
+        "휴대폰",
+        "휴대폰번호",
+        "휴대전화",
+        "핸드폰",
+        "연락처",
+    ),
+    "group_name": ("group", "groupname", "그룹", "그룹명", "분류"),
+    "memo": ("memo", "note", "notes", "메모", "비고"),
+}
+
+
+class ContactImportError(ValueError):
+    """업로드 파일을 연락처로 해석할 수 없음."""
+
+
+@dataclass
+class ContactRecord:
+    """파일에서 읽은 연락처 1건 (검증 전 원본 값)."""
+
+    row: int
+    name: str | None
+    phone_number: str | None
+    group_name: str | None = None
+    memo: str | None = None
+
+
+def detect_encoding(stream: BinaryIO) -> str:
+    """UTF-8(BOM 포함) 여부를 앞부분으로 판별, 아니면 엑셀 기본값인 CP949."""
+    head = stream.read(ENCODING_SNIFF_BYTES)
+    stream.seek(0)
+    try:
+        # final=False: 잘린 멀티바이트 문자는 오류로 보지 않음
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+
+def iter_contacts(stream: BinaryIO, filename: str | None) -> Iterator[ContactRecord]:
+    """파일 형식(CSV/vCard)에 맞춰 연락처를 한 건씩 읽는다.
+
+    전체를 메모리에 올리지 않고 줄 단위로 처리한다.
+    """
+    encoding = detect_encoding(stream)
+    text = io.TextIOWrapper(stream, encoding=encoding, errors="replace", newline="")
+    try:
+        first_line = text.readline()
+        is_vcard = (filename or "").lower().endswith((".vcf", ".vcard")) or (
+            first_line.strip().upper() == "BEGIN:VCARD"
+        )
+        text.seek(0)
+        if is_vcard:
+            yield from _iter_vcard(text)
+        else:
+            yield from _iter_csv(text)
+    finally:
+        # 원본 파일 객체는 닫지 않도록 분리
+        text.detach()
+
+
+def _iter_csv(text: io.TextIOBase) -> Iterator[ContactRecord]:
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        message = "빈 파일입니다."
+        raise ContactImportError(message)
+
+    columns = _map_csv_header(header)
+    if "name" not in columns or "phone_number" not in columns:
+        message = "CSV 헤더에 이름/전화번호 컬럼이 필요합니다."
+        raise ContactImportError(message)
+
+    for row_no, row in enumerate(reader, start=2):
+        if not any(cell.strip() for cell in row):
+            continue
+        values = {
+            field: (row[index].strip() or None) if index < len(row) else None
+            for field, index in columns.items()
+        }
+        yield ContactRecord(row=row_no, **values)
+
+
+def _map_csv_header(header: list[str]) -> dict[str, int]:
+    columns: dict[str, int] = {}
+    for index, title in enumerate(header):
+        key = "".join(title.split()).lower().replace("_", "")
+        for field, aliases in CSV_HEADER_ALIASES.items():
+            if field not in columns and key in aliases:
+                columns[field] = index
+    return columns
+
+
+def _iter_vcard(text: io.TextIOBase) -> Iterator[ContactRecord]:
+    card: dict[str, str] | None = None
+    card_no = 0
+    for prop, params, value in _iter_vcard_properties(text):
+        if prop == "BEGIN" and value.upper() == "VCARD":
+            card = {}
+            card_no += 1
+        elif prop == "END" and card is not None:
+            yield ContactRecord(
+                row=card_no,
+                name=card.get("FN") or card.get("N"),
+                phone_number=card.get("TEL"),
+                group_name=card.get("CATEGORIES"),
+                memo=card.get("NOTE"),
+            )
+            card = None
+        elif card is not None:
+            _apply_vcard_property(card, prop, params, value)
+
+
+def _apply_vcard_property(
+    card: dict[str, str],
+    prop: str,
+    params: list[str],
+    value: str,
+) -> None:
+    value = value.strip()
+    if not value:
+        return
+    if prop == "TEL":
+        # 휴대폰(CELL) 번호 우선, 없으면 첫 번호
+        is_cell = any("CELL" in param.upper() for param in params)
+        if "TEL" not in card or (is_cell and not card.get("_TEL_CELL")):
+            card["TEL"] = value
+            if is_cell:
+                card["_TEL_CELL"] = "1"
+    elif prop == "N":
+        # N:성;이름;중간이름;접두;접미 → "성이름"
+        parts = value.split(";")
+        card.setdefault("N", "".join(parts[:2]).strip())
+    elif prop == "CATEGORIES":
+        card.setdefault("CATEGORIES", value.split(",")[0].strip())
+    elif prop in ("FN", "NOTE"):
+        card.setdefault(prop, value.replace("\\n", "\n").replace("\\,", ","))
+
+
+def _iter_vcard_properties(
+    text: io.TextIOBase,
+) -> Iterator[tuple[str, list[str], str]]:
+    """접힌 줄(folding)과 QUOTED-PRINTABLE 소프트 줄바꿈을 풀어 속성 단위로 반환."""
+    pending: str | None = None
+    for raw_line in text:
+        line = raw_line.rstrip("\r\n")
+        if pending is not None and line[:1] in (" ", "\t"):
+            pending += line[1:]
+            continue
+        if pending is not None and pending.endswith("=") and _is_quoted(pending):
+            pending = pending[:-1] + line
+            continue
+        if pending is not None:
+            parsed = _parse_vcard_line(pending)
+            if parsed:
+                yield parsed
+        pending = line
+    if pending is not None:
+        parsed = _parse_vcard_line(pending)
+        if parsed:
+            yield parsed
+
+
+def _is_quoted(line: str) -> bool:
+    head = line.split(":", 1)[0].upper()
+    return "QUOTED-PRINTABLE" in head
+
+
+def _parse_vcard_line(line: str) -> tuple[str, list[str], str] | None:
+    if ":" not in line:
+        return None
+    head, value = line.split(":", 1)
+    name, *params = head.split(";")
+    # item1.TEL 같은 그룹 접두어 제거
+    prop = name.rsplit(".", 1)[-1].upper()
+    if any("QUOTED-PRINTABLE" in param.upper() for param in params):
+        charset = next(
+            (p.split("=", 1)[1] for p in params if p.upper().startswith("CHARSET=")),
+            "utf-8",
+        )
+        value = quopri.decodestring(value.encode("ascii", "ignore")).decode(
+            charset,
+            errors="replace",
+        )
+    return prop, params, value
@@ -0,0 +1,29 @@
+# 한글 음절 → 초성 변환 (유니코드 한글 음절 = 0xAC00 + (초성*21 + 중성)*28 + 종성)
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+CHOSEONG = (
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+)  # fmt: skip
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+# str.translate 용 변환표 (음절 11,172자 → 초성), 대량 변환 시 문자 단위 루프보다 빠름
+_CHOSEONG_TABLE = {
+    code: CHOSEONG[(code - HANGUL_SYLLABLE_START) // SYLLABLES_PER_CHOSEONG]
+    for code in range(HANGUL_SYLLABLE_START, HANGUL_SYLLABLE_END + 1)
+}
+
+
+def extract_choseong(text: str) -> str:
+    """문자열의 한글 음절을 초성으로 변환 (그 외 문자는 그대로).
+
+    예: "김민수" → "ㄱㅁㅅ", "Amy김" → "Amyㄱ"
+    """
+    return text.translate(_CHOSEONG_TABLE)
+
+
+def is_choseong_only(text: str) -> bool:
+    """초성(자음)으로만 이루어진 문자열인지 확인 (예: "ㄱㅁㅅ")."""
+    return bool(text) and all(char in CHOSEONG_SET for char in text)
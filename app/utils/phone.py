@@ -20,3 +20,16 @@ def normalize_korean_phone_number(phone: str) -> str:
     if not match:
         return phone.strip()
     return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+
+def phone_to_digits(phone: str) -> str | None:
+    """자유 입력 전화번호를 숫자만 남긴 형식으로 변환 (유효하지 않으면 None).
+
+    예:
+    - "010 1234 5678" -> "01012345678"
+    - "+82 10-1234-5678" -> "01012345678"
+    """
+    digits = "".join(c for c in phone if c.isdigit())
+    if phone.strip().startswith("+82"):
+        digits = "0" + digits[2:].removeprefix("0")
+    return digits if PHONE_REGEX.match(digits) else None
@@ -0,0 +1,33 @@
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+
+class PrefixIndex:
+    """정렬된 (키, 값) 배열 + 이진 탐색으로 접두어 검색을 하는 읽기 전용 인덱스.
+
+    트라이보다 메모리가 작고 생성이 빠르며, 접두어 검색은
+    O(log n + 결과 수)로 끝난다. 생성 후에는 변경하지 않는다.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, items: Iterable[tuple[str, int]]) -> None:
+        keys, values = [], []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        # 튜플 비교 대신 키 문자열만 비교하도록 위치 배열을 정렬
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._values = [values[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, prefix: str) -> Iterator[int]:
+        """prefix로 시작하는 키의 값을 키 순서대로 반환."""
+        start = bisect_left(self._keys, prefix)
+        for i in range(start, len(self._keys)):
+            if not self._keys[i].startswith(prefix):
+                break
+            yield self._values[i]
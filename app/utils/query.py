@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import binascii
 from datetime import UTC, date, datetime, time, timedelta, timezone
 from typing import TypeVar
 
@@ -16,6 +18,10 @@ class UnsupportedStatementTypeError(TypeError):
     """Unsupported SQLAlchemy statement type for date range filter."""
 
 
+class InvalidCursorError(ValueError):
+    """Cursor string could not be decoded."""
+
+
 def apply_date_range_filter(
     stmt: S,
     field: ColumnElement,
@@ -48,3 +54,19 @@ def _add_condition(stmt: S, cond: ColumnElement) -> S:
         return stmt.filter(cond)  # type: ignore[return-value]
     # Ruff TRY003: 긴 메시지 대신 커스텀 예외 사용
     raise UnsupportedStatementTypeError
+
+
+def encode_cursor(at: datetime, row_id: int) -> str:
+    """(일시, ID) 키셋 페이징 위치를 URL에 안전한 불투명 문자열로 변환."""
+    raw = f"{at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """encode_cursor 로 만든 문자열을 (일시, ID)로 복원."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError from e
@@ -1,34 +1,152 @@
-from app.core.config import REFRESH_TOKEN_EXPIRE_SECONDS
+import time
+
+from app.core.config import (
+    REFRESH_TOKEN_EXPIRE_SECONDS,
+    REFRESH_TOKEN_MAX_FAMILIES,
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+)
 from app.core.redis_client import redis_client
 
-REDIS_PREFIX = "auth:refresh"
+# 유저별 Hash
+# - field: 토큰 패밀리 ID (기기/로그인 단위)
+# - value: "{현재 토큰 ID}|{직전 토큰 ID}|{직전 토큰 유예 만료 epoch}|{만료 epoch}"
+#   (필드별 만료는 값으로 관리, 직전 토큰은 동시 요청 대비 잠깐 허용)
+REDIS_PREFIX = "auth:refresh_family"
 REDIS_TTL = REFRESH_TOKEN_EXPIRE_SECONDS
 
+# rotate_refresh_family_redis 결과
+REFRESH_FAMILY_UNKNOWN = 0  # 없거나 만료/로그아웃된 패밀리
+REFRESH_FAMILY_VALID = 1
+REFRESH_FAMILY_REUSED = -1  # 이미 교체된 토큰 재사용 → 패밀리 폐기
+REFRESH_FAMILY_GRACE = 2  # 방금 교체된 직전 토큰 (동시 요청) → 교체 없이 허용
+
+# 만료된 패밀리 정리 후 새 패밀리 추가 (최대 개수 초과 시 만료가 이른 것부터 제거)
+_ADD_FAMILY_SCRIPT = redis_client.register_script(
+    """
+    -- ARGV: family_id, token_id, expires_at, now, ttl, max_families
+    local now = tonumber(ARGV[4])
+    local entries = redis.call('HGETALL', KEYS[1])
+    local live = {}
+    for i = 1, #entries, 2 do
+        local expires_at = tonumber(string.match(entries[i + 1], '|(%d+)$'))
+        if not expires_at or expires_at <= now then
+            redis.call('HDEL', KEYS[1], entries[i])
+        elseif entries[i] ~= ARGV[1] then
+            table.insert(live, {entries[i], expires_at})
+        end
+    end
+    table.sort(live, function(a, b) return a[2] < b[2] end)
+    for i = 1, #live - tonumber(ARGV[6]) + 1 do
+        redis.call('HDEL', KEYS[1], live[i][1])
+    end
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2] .. '||0|' .. ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+    """,
+)
+
+# 현재 토큰이면 (새 토큰 ID가 있을 때) 교체하고 기존 토큰은 유예 기간 동안 보관,
+# 유예 중인 직전 토큰이면 교체 없이 허용, 그 외(더 오래된 토큰)는 재사용 → 패밀리 폐기
+# 반환: {결과, 현재 토큰 ID}
+_ROTATE_FAMILY_SCRIPT = redis_client.register_script(
+    """
+    -- ARGV: family_id, token_id, now, new_token_id, new_expires_at, ttl, grace
+    local now = tonumber(ARGV[3])
+    local current = redis.call('HGET', KEYS[1], ARGV[1])
+    if not current then
+        return {0, ''}
+    end
+    local token_id, prev_id, prev_until, expires_at =
+        string.match(current, '^([^|]*)|([^|]*)|(%d+)|(%d+)$')
+    if not token_id then
+        token_id, expires_at = string.match(current, '^([^|]*)|(%d+)$')
+        prev_id, prev_until = '', '0'
+    end
+    if not expires_at or tonumber(expires_at) <= now then
+        redis.call('HDEL', KEYS[1], ARGV[1])
+        return {0, ''}
+    end
+    if token_id == ARGV[2] then
+        if ARGV[4] == '' then
+            return {1, token_id}
+        end
+        local value = ARGV[4] .. '|' .. token_id .. '|'
+            .. tostring(now + tonumber(ARGV[7])) .. '|' .. ARGV[5]
+        redis.call('HSET', KEYS[1], ARGV[1], value)
+        redis.call('EXPIRE', KEYS[1], ARGV[6])
+        return {1, ARGV[4]}
+    end
+    if prev_id ~= '' and prev_id == ARGV[2] and now < tonumber(prev_until) then
+        return {2, token_id}
+    end
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return {-1, ''}
+    """,
+)
+
 
 def _get_refresh_token_key(user_id: int) -> str:
     return f"{REDIS_PREFIX}:{user_id}"
 
 
-def set_refresh_token_redis(user_id: int, token: str) -> None:
-    """Redis에 리프레시 토큰 저장."""
-    key = _get_refresh_token_key(user_id)
-    redis_client.setex(key, REDIS_TTL, token)
+def add_refresh_family_redis(
+    user_id: int,
+    family_id: str,
+    token_id: str,
+    expires_at: int,
+) -> None:
+    """로그인 시 새 리프레시 토큰 패밀리 등록 (만료된 패밀리 정리 포함)."""
+    _ADD_FAMILY_SCRIPT(
+        keys=[_get_refresh_token_key(user_id)],
+        args=[
+            family_id,
+            token_id,
+            expires_at,
+            int(time.time()),
+            REDIS_TTL,
+            REFRESH_TOKEN_MAX_FAMILIES,
+        ],
+    )
 
 
-def get_refresh_token_redis(user_id: int) -> str | None:
-    """Redis에서 리프레시 토큰 조회."""
-    key = _get_refresh_token_key(user_id)
-    return redis_client.get(key)
+def rotate_refresh_family_redis(
+    user_id: int,
+    family_id: str,
+    token_id: str,
+    new_token_id: str | None = None,
+    new_expires_at: int | None = None,
+) -> tuple[int, str]:
+    """리프레시 토큰 검증 + (new_token_id가 있으면) 교체를 한 번의 왕복으로 처리.
 
+    같은 토큰으로 동시에 갱신을 요청하면 먼저 온 요청만 교체하고,
+    나머지는 REFRESH_TOKEN_REUSE_GRACE_SECONDS 동안 REFRESH_FAMILY_GRACE 로 허용한다.
 
-def get_refresh_token_ttl(user_id: int) -> int:
-    """Redis에서 리프레시 토큰의 TTL 조회."""
-    key = _get_refresh_token_key(user_id)
-    ttl = redis_client.ttl(key)
-    return ttl if ttl >= 0 else -1  # -1은 키가 없거나 만료된 경우를 의미합니다.
+    Returns:
+        tuple[int, str]: (REFRESH_FAMILY_VALID / REFRESH_FAMILY_GRACE /
+            REFRESH_FAMILY_UNKNOWN / REFRESH_FAMILY_REUSED, 현재 토큰 ID)
+
+    """
+    result, current_token_id = _ROTATE_FAMILY_SCRIPT(
+        keys=[_get_refresh_token_key(user_id)],
+        args=[
+            family_id,
+            token_id,
+            int(time.time()),
+            new_token_id or "",
+            new_expires_at or 0,
+            REDIS_TTL,
+            REFRESH_TOKEN_REUSE_GRACE_SECONDS,
+        ],
+    )
+    return int(result), current_token_id
+
+
+def revoke_refresh_family_redis(user_id: int, family_id: str) -> None:
+    """리프레시 토큰 패밀리 1개(기기 1대) 폐기."""
+    redis_client.hdel(_get_refresh_token_key(user_id), family_id)
 
 
 def clear_refresh_token_redis(user_id: int) -> None:
-    """Redis에서 리프레시 토큰 삭제."""
+    """Redis에서 사용자의 모든 리프레시 토큰 패밀리 삭제 (전체 기기 로그아웃)."""
     key = _get_refresh_token_key(user_id)
     redis_client.delete(key)
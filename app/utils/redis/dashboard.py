@@ -1,9 +1,36 @@
 import json
+import uuid
+from collections.abc import Iterable
+from datetime import date
 
 from app.core.redis_client import redis_client
 
 REDIS_PREFIX = "dashboard"
 REDIS_TTL = 1800  # 30분
+# force_refresh 동시 실행 방지 락 유지 시간 (재계산 최대 소요 시간보다 길게)
+REFRESH_LOCK_TTL = 30
+
+# 대상 일자 기준으로 캐시되는 항목 / 월 시작일 기준으로 캐시되는 항목
+DAY_FIELDS = ("summary", "sales", "customer_insight", "staff_summary")
+MONTH_FIELDS = ("summary", "sales", "staff_summary")
+
+# 락 값이 내 토큰일 때만 삭제 (TTL 만료 후 다른 요청이 잡은 락을 지우지 않도록)
+_RELEASE_LOCK_SCRIPT = redis_client.register_script(
+    """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('DEL', KEYS[1])
+    end
+    return 0
+    """,
+)
+
+
+def get_month_period(target_date: date) -> str:
+    """월별 항목의 캐시 기간 키 (YYYY-MM).
+
+    월 시작일(YYYY-MM-01)을 쓰면 1일 조회 시 일별 항목과 키가 겹친다.
+    """
+    return f"{target_date:%Y-%m}"
 
 
 def get_dashboard_cache_key(shop_id: int, field: str, period: str) -> str:
@@ -34,3 +61,64 @@ def get_dashboard_cache(shop_id: int, field: str, period: str) -> dict | list |
 def clear_dashboard_cache(shop_id: int, field: str, period: str) -> None:
     key = get_dashboard_cache_key(shop_id, field, period)
     redis_client.delete(key)
+
+
+def clear_dashboard_cache_by_dates(shop_id: int, dates: Iterable[date]) -> None:
+    """해당 일자들의 일별/월별 대시보드 캐시를 한 번에 삭제."""
+    keys = set()
+    for target_date in dates:
+        month_period = get_month_period(target_date)
+        keys.update(
+            get_dashboard_cache_key(shop_id, field, target_date.isoformat())
+            for field in DAY_FIELDS
+        )
+        keys.update(
+            get_dashboard_cache_key(shop_id, field, month_period)
+            for field in MONTH_FIELDS
+        )
+    if keys:
+        redis_client.delete(*keys)
+
+
+def get_dashboard_cache_age(
+    shop_id: int,
+    fields: Iterable[str],
+    period: str,
+) -> float | None:
+    """해당 항목들 중 가장 최근에 저장된 캐시의 경과 시간(초), 하나도 없으면 None.
+
+    항상 REDIS_TTL로 저장하므로 남은 TTL로 경과 시간을 계산한다 (왕복 1번).
+    """
+    pipe = redis_client.pipeline(transaction=False)
+    for field in fields:
+        pipe.pttl(get_dashboard_cache_key(shop_id, field, period))
+    remaining = [ttl_ms for ttl_ms in pipe.execute() if ttl_ms > 0]
+    if not remaining:
+        return None
+    return REDIS_TTL - max(remaining) / 1000
+
+
+def _get_refresh_lock_key(shop_id: int, period: str) -> str:
+    return f"{REDIS_PREFIX}:{shop_id}:refresh_lock:{period}"
+
+
+def acquire_dashboard_refresh_lock(shop_id: int, period: str) -> str | None:
+    """같은 샵/일자의 force_refresh 재계산은 한 번에 하나만 실행.
+
+    Returns:
+        str | None: 획득 시 락 토큰 (해제할 때 전달), 이미 진행 중이면 None
+
+    """
+    token = uuid.uuid4().hex
+    acquired = redis_client.set(
+        _get_refresh_lock_key(shop_id, period),
+        token,
+        nx=True,
+        ex=REFRESH_LOCK_TTL,
+    )
+    return token if acquired else None
+
+
+def release_dashboard_refresh_lock(shop_id: int, period: str, token: str) -> None:
+    """내가 잡은 락일 때만 해제 (compare-and-delete)."""
+    _RELEASE_LOCK_SCRIPT(keys=[_get_refresh_lock_key(shop_id, period)], args=[token])
@@ -0,0 +1,145 @@
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.core.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 로컬 캐시 무효화 채널 (메시지: "{캐시 이름}|{키}")
+INVALIDATION_CHANNEL = "cache:invalidate"
+# 구독이 끊겼을 때 재연결 대기(초) / 끊긴 연결 감지를 위한 PING 주기(초)
+RECONNECT_DELAY_SECONDS = 1.0
+PING_INTERVAL_SECONDS = 30.0
+
+_caches: dict[str, "LocalCache"] = {}
+
+
+class LocalCache:
+    """프로세스(워커)별 TTL + LRU 캐시, 다른 워커와는 Redis pub/sub으로 무효화.
+
+    무효화 구독이 연결된 동안에만 값을 돌려주므로, 구독이 끊기면
+    자동으로 Redis/DB 조회로 돌아간다. 구독이 (재)연결될 때는 놓친 메시지가
+    있을 수 있어 캐시를 모두 비운다. TTL은 그 외 경합에 대한 상한이다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches[name] = self
+
+    def get(self, key: str | int) -> Any | None:  # noqa: ANN401
+        if not _listener.ensure_running():
+            return None
+        key = str(key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str | int, value: Any) -> None:  # noqa: ANN401
+        if self.maxsize <= 0 or not _listener.ensure_running():
+            return
+        key = str(key)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: str | int) -> None:
+        """이 워커와 다른 모든 워커의 캐시에서 키 삭제."""
+        self.discard(key)
+        try:
+            redis_client.publish(INVALIDATION_CHANNEL, f"{self.name}|{key}")
+        except RedisError:
+            # 다른 워커는 TTL 만료 또는 구독 재연결 시 비워짐
+            logger.warning("Failed to publish invalidation for %s:%s", self.name, key)
+
+    def discard(self, key: str | int) -> None:
+        """이 워커의 캐시에서만 키 삭제."""
+        with self._lock:
+            self._data.pop(str(key), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _InvalidationListener:
+    """무효화 채널을 구독하는 백그라운드 스레드 (프로세스당 1개, 첫 사용 시 시작)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._ready = threading.Event()
+
+    def ensure_running(self) -> bool:
+        """구독 스레드를 (fork 이후라면 새로) 시작하고, 구독 중인지 반환."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._pid = os.getpid()
+                    self._ready = threading.Event()
+                    threading.Thread(
+                        target=self._run,
+                        name="local-cache-invalidation",
+                        daemon=True,
+                    ).start()
+        return self._ready.is_set()
+
+    def _run(self) -> None:
+        while True:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                for cache in _caches.values():
+                    cache.clear()
+                self._ready.set()
+                self._listen(pubsub)
+            except RedisError:
+                logger.warning("Local cache invalidation listener disconnected")
+            except Exception:
+                logger.exception("Local cache invalidation listener failed")
+            finally:
+                self._ready.clear()
+                with contextlib.suppress(RedisError):
+                    pubsub.close()
+            time.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _listen(self, pubsub: Any) -> None:  # noqa: ANN401
+        last_ping = time.monotonic()
+        while True:
+            message = pubsub.get_message(timeout=PING_INTERVAL_SECONDS)
+            if message and message["type"] == "message":
+                _dispatch(message["data"])
+            if time.monotonic() - last_ping >= PING_INTERVAL_SECONDS:
+                # 응답 없는 연결을 끊어 재구독하도록 PING
+                pubsub.ping()
+                last_ping = time.monotonic()
+
+
+def _dispatch(data: str) -> None:
+    name, _, key = data.partition("|")
+    cache = _caches.get(name)
+    if cache is not None:
+        cache.discard(key)
+
+
+_listener = _InvalidationListener()
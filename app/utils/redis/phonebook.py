@@ -0,0 +1,199 @@
+import time
+
+from redis.exceptions import RedisError
+
+from app.core.redis_client import redis_client
+
+REDIS_PHONEBOOK_PREFIX = "phonebook"
+REDIS_SUGGEST_VERSION_TTL = 60 * 60 * 24 * 7  # 7일
+
+
+def _get_suggest_version_key(shop_id: int) -> str:
+    return f"{REDIS_PHONEBOOK_PREFIX}:suggest:version:{shop_id}"
+
+
+def get_phonebook_suggest_version(shop_id: int) -> str | None:
+    """샵 전화번호부 자동완성 인덱스 버전 조회 (Redis 장애 시 None)."""
+    try:
+        return redis_client.get(_get_suggest_version_key(shop_id))
+    except RedisError:
+        return None
+
+
+def bump_phonebook_suggest_version(shop_id: int) -> None:
+    """전화번호부 변경 시 버전을 올려 각 프로세스의 자동완성 인덱스를 무효화."""
+    key = _get_suggest_version_key(shop_id)
+    try:
+        pipe = redis_client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, REDIS_SUGGEST_VERSION_TTL)
+        pipe.execute()
+    except RedisError:
+        # 인덱스 최대 유지 시간(PHONEBOOK_SUGGEST_MAX_AGE_SECONDS) 후에는 재생성됨
+        return
+
+
+REDIS_GROUP_COUNTS_TTL = 60 * 60 * 24  # 24시간
+# 재생성 직후 이 시간 안에 들어온 증감은 DB 집계에 이미 반영됐을 수 있어
+# (커밋 후 증감 전에 집계한 경우) 증감 대신 캐시를 버리고 다시 만든다
+REDIS_GROUP_COUNTS_SETTLE_SECONDS = 10
+
+# 해시 필드: 그룹 없음(NULL), 생성 시각(그룹이 하나도 없어도 캐시 유지),
+# 실제 그룹은 "g:{그룹명}" (그룹명이 위 예약 필드와 겹치지 않도록 접두어)
+GROUP_NONE_FIELD = "__none__"
+GROUP_BUILT_FIELD = "__built__"
+GROUP_FIELD_PREFIX = "g:"
+
+# 세대 번호를 올린 뒤(진행 중인 재생성 결과 저장 차단) 해시가 있으면 증감,
+# 0 이하가 된 그룹은 삭제. 막 재생성된 해시는 중복 반영될 수 있어 삭제한다.
+_INCR_GROUP_COUNTS_SCRIPT = redis_client.register_script(
+    """
+    -- KEYS: counts_key, generation_key
+    -- ARGV: ttl, now, settle_seconds, built_field, field1, delta1, ...
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[1])
+    local built_at = tonumber(redis.call('HGET', KEYS[1], ARGV[4]))
+    if not built_at then
+        return 0
+    end
+    if tonumber(ARGV[2]) - built_at < tonumber(ARGV[3]) then
+        redis.call('DEL', KEYS[1])
+        return 0
+    end
+    for i = 5, #ARGV - 1, 2 do
+        local count = redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+        if count <= 0 then
+            redis.call('HDEL', KEYS[1], ARGV[i])
+        end
+    end
+    return 1
+    """,
+)
+
+# 집계 시작 전에 읽은 세대 번호가 그대로일 때만 DB 집계 결과로 해시를 교체
+_SET_GROUP_COUNTS_SCRIPT = redis_client.register_script(
+    """
+    -- KEYS: counts_key, generation_key
+    -- ARGV: ttl, generation, field1, count1, ...
+    if (redis.call('GET', KEYS[2]) or '') ~= ARGV[2] then
+        return 0
+    end
+    redis.call('DEL', KEYS[1])
+    for i = 3, #ARGV - 1, 2 do
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+    """,
+)
+
+
+def _get_group_counts_key(shop_id: int) -> str:
+    return f"{REDIS_PHONEBOOK_PREFIX}:group_counts:{shop_id}"
+
+
+def _get_group_counts_generation_key(shop_id: int) -> str:
+    return f"{REDIS_PHONEBOOK_PREFIX}:group_counts:{shop_id}:gen"
+
+
+def _to_group_field(group_name: str | None) -> str:
+    if group_name is None:
+        return GROUP_NONE_FIELD
+    return f"{GROUP_FIELD_PREFIX}{group_name}"
+
+
+def get_group_counts_redis(shop_id: int) -> dict[str | None, int] | None:
+    """그룹별 전화번호부 개수 캐시 조회 (HGETALL 1회). 없거나 Redis 장애면 None."""
+    try:
+        data = redis_client.hgetall(_get_group_counts_key(shop_id))
+    except RedisError:
+        return None
+    if GROUP_BUILT_FIELD not in data:
+        return None
+    counts: dict[str | None, int] = {}
+    for field, count in data.items():
+        if field == GROUP_NONE_FIELD:
+            counts[None] = int(count)
+        elif field.startswith(GROUP_FIELD_PREFIX):
+            counts[field.removeprefix(GROUP_FIELD_PREFIX)] = int(count)
+    return counts
+
+
+def get_group_counts_generation_redis(shop_id: int) -> str | None:
+    """캐시 재생성 전 세대 번호 조회 (DB 집계 전에 호출). Redis 장애면 None."""
+    try:
+        return redis_client.get(_get_group_counts_generation_key(shop_id)) or ""
+    except RedisError:
+        return None
+
+
+def set_group_counts_redis(
+    shop_id: int,
+    counts: dict[str | None, int],
+    generation: str | None,
+) -> None:
+    """DB에서 집계한 그룹별 개수로 캐시 재생성.
+
+    집계 중 생성/수정/삭제가 있었으면(세대 번호 변경) 저장하지 않는다.
+    """
+    if generation is None:
+        return
+    args: list[str | int] = [
+        REDIS_GROUP_COUNTS_TTL,
+        generation,
+        GROUP_BUILT_FIELD,
+        int(time.time()),
+    ]
+    for group_name, count in counts.items():
+        args.extend((_to_group_field(group_name), count))
+    try:
+        _SET_GROUP_COUNTS_SCRIPT(
+            keys=[
+                _get_group_counts_key(shop_id),
+                _get_group_counts_generation_key(shop_id),
+            ],
+            args=args,
+        )
+    except RedisError:
+        return
+
+
+def incr_group_counts_redis(shop_id: int, deltas: dict[str | None, int]) -> None:
+    """전화번호부 생성/수정/삭제 후 그룹별 개수 증감 (캐시가 있을 때만)."""
+    changes: list[str | int] = []
+    for group_name, delta in deltas.items():
+        if delta:
+            changes.extend((_to_group_field(group_name), delta))
+    if not changes:
+        return
+    args = [
+        REDIS_GROUP_COUNTS_TTL,
+        int(time.time()),
+        REDIS_GROUP_COUNTS_SETTLE_SECONDS,
+        GROUP_BUILT_FIELD,
+        *changes,
+    ]
+    try:
+        _INCR_GROUP_COUNTS_SCRIPT(
+            keys=[
+                _get_group_counts_key(shop_id),
+                _get_group_counts_generation_key(shop_id),
+            ],
+            args=args,
+        )
+    except RedisError:
+        # 증감 실패 시 캐시를 버려 다음 조회 때 DB에서 다시 만든다
+        clear_group_counts_redis(shop_id)
+
+
+def clear_group_counts_redis(shop_id: int) -> None:
+    """그룹별 개수 캐시 삭제 (세대 번호를 올려 진행 중인 재생성 결과도 버림)."""
+    generation_key = _get_group_counts_generation_key(shop_id)
+    try:
+        pipe = redis_client.pipeline()
+        pipe.delete(_get_group_counts_key(shop_id))
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, REDIS_GROUP_COUNTS_TTL)
+        pipe.execute()
+    except RedisError:
+        return
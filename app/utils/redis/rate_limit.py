@@ -0,0 +1,145 @@
+import logging
+import math
+import time
+import uuid
+from datetime import UTC, datetime
+
+from redis.exceptions import RedisError
+
+from app.core.config import (
+    LOGIN_RATE_LIMIT_PER_EMAIL,
+    LOGIN_RATE_LIMIT_PER_IP,
+    LOGIN_RATE_WINDOW_SECONDS,
+)
+from app.core.redis_client import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_LOGIN_RATE_PREFIX = "rate:login"
+REDIS_SHOP_RATE_PREFIX = "rate:shop"
+# 시간별 허용/차단 카운터 (알림용, 필드: allowed / blocked_ip / blocked_email)
+REDIS_LOGIN_RATE_METRICS_PREFIX = "rate:login:metrics"
+METRICS_TTL = 60 * 60 * 48  # 48시간
+
+# IP/이메일 슬라이딩 윈도우(ZSET, score=시도 시각 ms)를 한 번에 검사하고,
+# 둘 다 한도 미만일 때만 이번 시도를 기록한다 (차단된 시도는 기록하지 않음)
+_LOGIN_SLIDING_WINDOW_SCRIPT = async_redis_client.register_script(
+    """
+    -- KEYS: ip_key, email_key, metrics_key
+    -- ARGV: now_ms, window_ms, ip_limit, email_limit, member, metrics_ttl
+    local now = tonumber(ARGV[1])
+    local window = tonumber(ARGV[2])
+    local limits = {tonumber(ARGV[3]), tonumber(ARGV[4])}
+    local blocked = {'blocked_ip', 'blocked_email'}
+    for i = 1, 2 do
+        redis.call('ZREMRANGEBYSCORE', KEYS[i], '-inf', now - window)
+        if redis.call('ZCARD', KEYS[i]) >= limits[i] then
+            local oldest = redis.call('ZRANGE', KEYS[i], 0, 0, 'WITHSCORES')
+            redis.call('HINCRBY', KEYS[3], blocked[i], 1)
+            redis.call('EXPIRE', KEYS[3], ARGV[6])
+            return {i, tonumber(oldest[2]) + window - now}
+        end
+    end
+    for i = 1, 2 do
+        redis.call('ZADD', KEYS[i], now, ARGV[5])
+        redis.call('PEXPIRE', KEYS[i], window)
+    end
+    redis.call('HINCRBY', KEYS[3], 'allowed', 1)
+    redis.call('EXPIRE', KEYS[3], ARGV[6])
+    return {0, 0}
+    """,
+)
+
+_LOGIN_LIMIT_SCOPES = {1: "ip", 2: "email"}
+
+
+def _get_login_rate_metrics_key(now: datetime) -> str:
+    return f"{REDIS_LOGIN_RATE_METRICS_PREFIX}:{now:%Y%m%d%H}"
+
+
+async def check_login_rate_limit_redis(
+    client_ip: str,
+    email: str,
+) -> tuple[str | None, int]:
+    """로그인 시도 1건을 IP/이메일 슬라이딩 윈도우에 기록 (Redis 왕복 1번).
+
+    Redis 장애 시에는 로그인을 막지 않는다 (fail-open).
+
+    Returns:
+        tuple[str | None, int]: (차단 기준 "ip"/"email" 또는 허용 시 None,
+            재시도까지 남은 초)
+
+    """
+    now_ms = int(time.time() * 1000)
+    try:
+        scope, retry_after_ms = await _LOGIN_SLIDING_WINDOW_SCRIPT(
+            keys=[
+                f"{REDIS_LOGIN_RATE_PREFIX}:ip:{client_ip}",
+                f"{REDIS_LOGIN_RATE_PREFIX}:email:{email.strip().lower()}",
+                _get_login_rate_metrics_key(datetime.now(UTC)),
+            ],
+            args=[
+                now_ms,
+                LOGIN_RATE_WINDOW_SECONDS * 1000,
+                LOGIN_RATE_LIMIT_PER_IP,
+                LOGIN_RATE_LIMIT_PER_EMAIL,
+                f"{now_ms}:{uuid.uuid4().hex[:8]}",
+                METRICS_TTL,
+            ],
+        )
+    except RedisError:
+        logger.warning("Login rate limit check failed, allowing attempt")
+        return None, 0
+    if not scope:
+        return None, 0
+    retry_after = max(1, math.ceil(int(retry_after_ms) / 1000))
+    return _LOGIN_LIMIT_SCOPES[int(scope)], retry_after
+
+
+# 샵 + 요청 분류별 토큰 버킷 (Hash: tokens, ts(ms)), 토큰이 1개 이상이면 1개 소비
+_SHOP_TOKEN_BUCKET_SCRIPT = redis_client.register_script(
+    """
+    -- ARGV: now_ms, capacity, refill_per_ms
+    local now = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local rate = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local retry_after_ms = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        retry_after_ms = math.ceil((1 - tokens) / rate)
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', ARGV[1])
+    redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + 1000)
+    return retry_after_ms
+    """,
+)
+
+
+def consume_shop_rate_token_redis(
+    shop_id: int,
+    route_class: str,
+    capacity: int,
+    per_minute: float,
+) -> int:
+    """샵의 요청 분류별 토큰 버킷에서 토큰 1개 소비 (Redis 왕복 1번).
+
+    Redis 장애 시에는 요청을 막지 않는다 (fail-open).
+
+    Returns:
+        int: 허용 시 0, 토큰이 없으면 재시도까지 남은 초
+
+    """
+    try:
+        retry_after_ms = _SHOP_TOKEN_BUCKET_SCRIPT(
+            keys=[f"{REDIS_SHOP_RATE_PREFIX}:{shop_id}:{route_class}"],
+            args=[int(time.time() * 1000), capacity, per_minute / 60_000],
+        )
+    except RedisError:
+        logger.warning("Shop rate limit check failed (shop_id=%s)", shop_id)
+        return 0
+    return math.ceil(int(retry_after_ms) / 1000)
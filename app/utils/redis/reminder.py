@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from app.core.redis_client import redis_client
+
+REDIS_PREFIX = "reminder:treatment"
+REDIS_TTL = 60 * 60 * 24  # 24시간 (예약 시각이 지나면 의미 없음)
+
+
+def _get_reminder_key(treatment_id: int, reserved_at: datetime) -> str:
+    # 예약 시각이 바뀌면 새 키가 되어 리마인더가 다시 발송된다.
+    return f"{REDIS_PREFIX}:{treatment_id}:{reserved_at:%Y%m%d%H%M%S}"
+
+
+def claim_reminders_redis(targets: list[tuple[int, datetime]]) -> list[bool]:
+    """리마인더 발송권 선점 (SET NX). 이미 발송된 예약은 False.
+
+    targets: (treatment_id, reserved_at) 목록. 파이프라인 한 번으로 처리한다.
+    """
+    if not targets:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for treatment_id, reserved_at in targets:
+        pipe.set(_get_reminder_key(treatment_id, reserved_at), 1, nx=True, ex=REDIS_TTL)
+    return [bool(result) for result in pipe.execute()]
+
+
+def release_reminders_redis(targets: list[tuple[int, datetime]]) -> None:
+    """발송 실패 시 선점 해제 (다음 주기에 재시도)."""
+    if not targets:
+        return
+
+    keys = [_get_reminder_key(tid, reserved_at) for tid, reserved_at in targets]
+    redis_client.delete(*keys)
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+
+from redis.exceptions import RedisError
+
+from app.core.config import SCHEDULE_STREAM_QUEUE_SIZE
+from app.core.redis_client import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_SCHEDULE_PREFIX = "schedule"
+
+# 이벤트 유실 가능성이 있을 때 클라이언트에 목록 재조회를 요청하는 프레임
+RESYNC_FRAME = "event: resync\ndata: {}\n\n"
+
+
+def _get_schedule_channel(shop_id: int) -> str:
+    return f"{REDIS_SCHEDULE_PREFIX}:{shop_id}"
+
+
+def publish_schedule_event(shop_id: int, event: str, data: dict) -> None:
+    """샵 예약 보드 채널에 변경 이벤트 발행.
+
+    DB commit 이후 호출되므로 실패해도 예외를 올리지 않는다 (최선 노력 전달).
+    """
+    message = json.dumps(
+        {"event": event, "data": data},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    try:
+        redis_client.publish(_get_schedule_channel(shop_id), message)
+    except RedisError:
+        logger.warning("Failed to publish schedule event for shop %s", shop_id)
+
+
+def _to_sse_frame(raw: str) -> str:
+    message = json.loads(raw)
+    data = json.dumps(message["data"], ensure_ascii=False, separators=(",", ":"))
+    return f"event: {message['event']}\ndata: {data}\n\n"
+
+
+class ScheduleEventHub:
+    """프로세스당 Redis 구독 1개를 샵별 SSE 연결(asyncio.Queue)로 나눠주는 허브.
+
+    연결마다 Redis pub/sub 커넥션을 열지 않고, 메시지는 한 번만 SSE 프레임으로
+    변환해 같은 샵의 모든 연결에 전달한다.
+    """
+
+    def __init__(self, queue_size: int = SCHEDULE_STREAM_QUEUE_SIZE) -> None:
+        self._queue_size = queue_size
+        self._queues: dict[int, set[asyncio.Queue[str]]] = defaultdict(set)
+        self._listener: asyncio.Task | None = None
+
+    def subscribe(self, shop_id: int) -> asyncio.Queue[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
+        self._queues[shop_id].add(queue)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        return queue
+
+    def unsubscribe(self, shop_id: int, queue: asyncio.Queue[str]) -> None:
+        queues = self._queues.get(shop_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[shop_id]
+
+    def _dispatch(self, shop_id: int, frame: str) -> None:
+        for queue in list(self._queues.get(shop_id, ())):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # 느린 클라이언트: 쌓인 이벤트를 버리고 재조회 요청
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_FRAME)
+
+    def _broadcast_resync(self) -> None:
+        for shop_id in list(self._queues):
+            self._dispatch(shop_id, RESYNC_FRAME)
+
+    async def _listen(self) -> None:
+        connected_once = False
+        while True:
+            pubsub = async_redis_client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{REDIS_SCHEDULE_PREFIX}:*")
+                if connected_once:
+                    # 재연결 사이에 놓친 이벤트가 있을 수 있음
+                    self._broadcast_resync()
+                connected_once = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    shop_id = int(message["channel"].rsplit(":", 1)[1])
+                    if shop_id in self._queues:
+                        self._dispatch(shop_id, _to_sse_frame(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Schedule event listener failed, reconnecting")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+
+schedule_event_hub = ScheduleEventHub()
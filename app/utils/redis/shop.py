@@ -1,8 +1,58 @@
+import time
+from typing import Any
+
+from redis.client import Pipeline
+
+from app.core.config import (
+    SHOP_LOCAL_CACHE_MAX_SIZE,
+    SHOP_LOCAL_CACHE_TTL_SECONDS,
+    USER_LOCAL_CACHE_MAX_SIZE,
+    USER_LOCAL_CACHE_TTL_SECONDS,
+)
 from app.core.redis_client import redis_client
+from app.models.shop import Shop
+from app.utils.redis.local_cache import LocalCache
 
 REDIS_SELECTED_SHOP_PREFIX = "user"
 REDIS_SELECTED_SHOP_SUFFIX = "selected_shop"
 REDIS_SELECTED_SHOP_TTL = 60 * 60 * 24 * 365  # 365일
+# 남은 TTL이 이보다 짧아질 때만 연장 (매 요청마다 쓰지 않음)
+REDIS_SELECTED_SHOP_REFRESH_BELOW = REDIS_SELECTED_SHOP_TTL // 2
+
+# 워커 로컬 캐시에 저장하는 샵 컬럼
+SHOP_CACHE_FIELDS = (
+    "id",
+    "user_id",
+    "name",
+    "address",
+    "address_detail",
+    "phone",
+    "business_number",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+)
+
+# 유저별 선택 샵: (shop_id 또는 0, Redis 키 만료 시각(epoch))
+_local_selected_shop_cache = LocalCache(
+    REDIS_SELECTED_SHOP_SUFFIX,
+    maxsize=USER_LOCAL_CACHE_MAX_SIZE,
+    ttl=USER_LOCAL_CACHE_TTL_SECONDS,
+)
+# 샵 ID별 샵 컬럼 dict
+_local_shop_cache = LocalCache(
+    "shop",
+    maxsize=SHOP_LOCAL_CACHE_MAX_SIZE,
+    ttl=SHOP_LOCAL_CACHE_TTL_SECONDS,
+)
+
+
+# 유저별 소속 샵 권한: {shop_id(str): {"role", "is_primary_owner"}}
+_local_membership_cache = LocalCache(
+    "shop_membership",
+    maxsize=USER_LOCAL_CACHE_MAX_SIZE,
+    ttl=SHOP_LOCAL_CACHE_TTL_SECONDS,
+)
 
 
 def _get_selected_shop_key(user_id: int) -> str:
@@ -13,6 +63,7 @@ def set_selected_shop_redis(user_id: int, shop_id: int) -> None:
     """Redis에 현재 선택된 shop_id 저장."""
     key = _get_selected_shop_key(user_id)
     redis_client.set(key, shop_id, ex=REDIS_SELECTED_SHOP_TTL)
+    _local_selected_shop_cache.invalidate(user_id)
 
 
 def get_selected_shop_redis(user_id: int) -> int | None:
@@ -26,3 +77,83 @@ def clear_selected_shop_redis(user_id: int) -> None:
     """Redis에 저장된 선택 shop_id 삭제."""
     key = _get_selected_shop_key(user_id)
     redis_client.delete(key)
+    _local_selected_shop_cache.invalidate(user_id)
+
+
+def queue_selected_shop_read(pipe: Pipeline, user_id: int) -> None:
+    """다른 조회와 같은 파이프라인에 선택 샵 GET/TTL 추가 (결과 2개)."""
+    key = _get_selected_shop_key(user_id)
+    pipe.get(key)
+    pipe.ttl(key)
+
+
+def remember_selected_shop(
+    user_id: int,
+    shop_id: str | None,
+    ttl: int,
+) -> tuple[int, float]:
+    """파이프라인으로 읽은 선택 샵을 워커 로컬 캐시에 저장.
+
+    Returns:
+        tuple[int, float]: (shop_id 또는 0, Redis 키 만료 시각(epoch), 만료 없음은 0)
+
+    """
+    cached = (int(shop_id) if shop_id else 0, time.time() + ttl if ttl > 0 else 0.0)
+    _local_selected_shop_cache.set(user_id, cached)
+    return cached
+
+
+def get_selected_shop_cached(user_id: int) -> int | None:
+    """워커 로컬 캐시 → Redis 순서로 선택된 shop_id 조회.
+
+    Redis 키 TTL은 남은 시간이 절반 아래로 떨어졌을 때만 연장한다.
+    """
+    cached = _local_selected_shop_cache.get(user_id)
+    if cached is None:
+        pipe = redis_client.pipeline(transaction=False)
+        queue_selected_shop_read(pipe, user_id)
+        cached = remember_selected_shop(user_id, *pipe.execute())
+
+    shop_id, expires_at = cached
+    if not shop_id:
+        return None
+    if expires_at and expires_at - time.time() < REDIS_SELECTED_SHOP_REFRESH_BELOW:
+        redis_client.expire(_get_selected_shop_key(user_id), REDIS_SELECTED_SHOP_TTL)
+        remember_selected_shop(user_id, str(shop_id), REDIS_SELECTED_SHOP_TTL)
+    return shop_id
+
+
+def get_shop_local(shop_id: int) -> dict[str, Any] | None:
+    """워커 로컬 캐시에서 샵 컬럼 조회."""
+    return _local_shop_cache.get(shop_id)
+
+
+def set_shop_local(shop: Shop) -> None:
+    """샵 컬럼을 워커 로컬 캐시에 저장."""
+    _local_shop_cache.set(
+        shop.id,
+        {field: getattr(shop, field) for field in SHOP_CACHE_FIELDS},
+    )
+
+
+def clear_shop_local(shop_id: int) -> None:
+    """샵 수정 시 모든 워커의 로컬 캐시에서 삭제."""
+    _local_shop_cache.invalidate(shop_id)
+
+
+def get_memberships_local(user_id: int) -> dict[str, dict] | None:
+    """워커 로컬 캐시에서 유저의 소속 샵 권한 조회."""
+    return _local_membership_cache.get(user_id)
+
+
+def set_memberships_local(user_id: int, memberships: dict[int, dict]) -> None:
+    """유저의 소속 샵 권한을 워커 로컬 캐시에 저장 (무효화 메시지와 같은 문자열 키)."""
+    _local_membership_cache.set(
+        user_id,
+        {str(shop_id): value for shop_id, value in memberships.items()},
+    )
+
+
+def clear_memberships_local(user_id: int) -> None:
+    """샵 생성/가입/탈퇴 시 모든 워커의 소속 샵 권한 캐시 삭제."""
+    _local_membership_cache.invalidate(user_id)
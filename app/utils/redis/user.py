@@ -1,28 +1,50 @@
 import json
 from typing import Any
 
+from app.core.config import USER_LOCAL_CACHE_MAX_SIZE, USER_LOCAL_CACHE_TTL_SECONDS
 from app.core.redis_client import redis_client
 from app.models.user import User
+from app.utils.redis.local_cache import LocalCache
+from app.utils.redis.shop import queue_selected_shop_read, remember_selected_shop
 
 REDIS_USER_PREFIX = "user"
 REDIS_USER_TTL = 60 * 60 * 24  # 24시간
 
+# Redis 앞단의 워커별 캐시 (적중 시 네트워크 왕복 없음)
+_local_user_cache = LocalCache(
+    REDIS_USER_PREFIX,
+    maxsize=USER_LOCAL_CACHE_MAX_SIZE,
+    ttl=USER_LOCAL_CACHE_TTL_SECONDS,
+)
+
 
 def _get_user_key(user_id: int) -> str:
     return f"{REDIS_USER_PREFIX}:{user_id}"
 
 
 def get_user_redis(user_id: int) -> dict[str, Any] | None:
-    """Redis에서 사용자 정보를 조회."""
-    key = _get_user_key(user_id)
-    data = redis_client.get(key)
+    """워커 로컬 캐시 → Redis 순서로 사용자 정보를 조회.
+
+    Redis 조회 시 선택 샵(get_current_shop 용)도 같은 파이프라인으로 읽어
+    로컬 캐시에 넣어 둔다.
+    """
+    if user_dict := _local_user_cache.get(user_id):
+        return user_dict
+
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.get(_get_user_key(user_id))
+    queue_selected_shop_read(pipe, user_id)
+    data, selected_shop_id, selected_shop_ttl = pipe.execute()
+    remember_selected_shop(user_id, selected_shop_id, selected_shop_ttl)
     if data:
-        return json.loads(data)
+        user_dict = json.loads(data)
+        _local_user_cache.set(user_id, user_dict)
+        return user_dict
     return None
 
 
 def set_user_redis(user: User) -> None:
-    """사용자 정보를 Redis에 저장."""
+    """사용자 정보를 Redis와 워커 로컬 캐시에 저장."""
     key = _get_user_key(user.id)
 
     user_dict = {
@@ -33,9 +55,11 @@ def set_user_redis(user: User) -> None:
     }
 
     redis_client.setex(key, REDIS_USER_TTL, json.dumps(user_dict))
+    _local_user_cache.set(user.id, user_dict)
 
 
 def clear_user_redis(user_id: int) -> None:
-    """사용자 정보를 Redis에서 삭제."""
+    """사용자 정보를 Redis와 모든 워커의 로컬 캐시에서 삭제."""
     key = _get_user_key(user_id)
     redis_client.delete(key)
+    _local_user_cache.invalidate(user_id)
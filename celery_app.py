@@ -10,7 +10,12 @@ celery_app = Celery(
     "worker",
     broker=redis_url,
     backend=redis_url,
-    include=["worker.tasks.treatment_task"],
+    include=[
+        "worker.tasks.treatment_task",
+        "worker.tasks.reminder_task",
+        "worker.tasks.outbox_task",
+        "worker.tasks.customer_task",
+    ],
 )
 
 celery_app.conf.timezone = "Asia/Seoul"
@@ -21,4 +26,20 @@ celery_app.conf.beat_schedule = {
         "task": "worker.tasks.treatment_task.auto_complete_treatment",
         "schedule": crontab(minute="*/30"),
     },
+    "send-reservation-reminders-every-minute": {
+        "task": "worker.tasks.reminder_task.send_reservation_reminders",
+        "schedule": crontab(minute="*"),
+    },
+    "relay-outbox-events-every-5sec": {
+        "task": "worker.tasks.outbox_task.relay_outbox_events",
+        "schedule": 5.0,
+    },
+    "purge-outbox-events-daily": {
+        "task": "worker.tasks.outbox_task.purge_outbox_events",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    "backfill-treatment-customers-daily": {
+        "task": "worker.tasks.customer_task.backfill_treatment_customers",
+        "schedule": crontab(hour=4, minute=30),
+    },
 }
@@ -0,0 +1,76 @@
+"""요청당 인증(JWT 검증) CPU 비용 벤치마크.
+
+클라이언트 수만큼 액세스 토큰을 발급하고, 요청을 라운드로빈으로 흉내 내어
+서명 검증 비용(python-jose, 비교용 PyJWT)과 검증 캐시 적용 후 비용을 비교합니다.
+
+실행 예::
+
+    python scripts/bench_auth.py --clients 200 --requests 50000
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+
+# 외부 인프라(MySQL, Redis) 없이 실행되도록 기본값 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-hs256-0123456789")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_SECONDS", "3600")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_SECONDS", "604800")
+os.environ.setdefault("FERNET_KEY", "4QR9D0c0Dx7tYb3e1N7H0jv0rcAT4BG2Yzq2X6bTmkE=")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import jwt as pyjwt
+from jose import jwt
+
+from app.core import security
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="JWT 검증 비용 벤치마크")
+    parser.add_argument("--clients", type=int, default=200, help="서로 다른 토큰 수")
+    parser.add_argument("--requests", type=int, default=50000, help="총 요청 수")
+    return parser.parse_args()
+
+
+def measure(decode: Callable[[str], dict], tokens: list[str], requests: int) -> float:
+    """요청 1건당 평균 소요 시간(µs)."""
+    started = time.perf_counter()
+    for i in range(requests):
+        decode(tokens[i % len(tokens)])
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main() -> None:
+    args = parse_args()
+
+    tokens = [
+        security.create_jwt_token(
+            data={"sub": str(i), "role": "MASTER", "type": "access"},
+            expires_delta=timedelta(hours=1),
+        )
+        for i in range(args.clients)
+    ]
+    print(f"clients={args.clients} requests={args.requests}")  # noqa: T201
+    print(f"{'path':<16} {'us/req':>8} {'speedup':>8}")  # noqa: T201
+
+    baseline = None
+    key, algorithm = security.SECRET_KEY, security.ALGORITHM
+    for name, decode in (
+        ("jose", lambda t: jwt.decode(t, key, algorithms=[algorithm])),
+        ("pyjwt", lambda t: pyjwt.decode(t, key, algorithms=[algorithm])),
+        ("cached", security.decode_jwt_token),
+    ):
+        security._verified_tokens.clear()  # noqa: SLF001
+        cost = measure(decode, tokens, args.requests)
+        baseline = baseline or cost
+        print(f"{name:<16} {cost:>8.1f} {baseline / cost:>7.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""API 콜드 스타트 import 시간 측정.
+
+새 인터프리터에서 ``import app.main`` 에 걸린 시간을 여러 번 측정해
+중앙값을 출력하고, Firebase SDK가 import 되었는지도 함께 표시합니다.
+
+실행 예::
+
+    python scripts/bench_import.py --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "seconds": elapsed,
+    "firebase_loaded": "firebase_admin" in sys.modules,
+    "modules": len(sys.modules),
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="app.main import 시간 측정")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--module-root", default=str(ROOT), help="측정할 소스 경로")
+    args = parser.parse_args()
+
+    results = []
+    for _ in range(args.runs):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", PROBE],
+            cwd=args.module_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip().splitlines()[-1]
+        results.append(json.loads(output))
+
+    seconds = [r["seconds"] * 1000 for r in results]
+    print(  # noqa: T201
+        f"runs={args.runs} median={statistics.median(seconds):.1f}ms "
+        f"min={min(seconds):.1f}ms max={max(seconds):.1f}ms "
+        f"modules={results[-1]['modules']} "
+        f"firebase_loaded={results[-1]['firebase_loaded']}",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""푸시 전송 경로 벤치마크.
+
+Fake 전송기(FakePushTransport)와 인메모리 SQLite를 사용해
+send_fcm_notification_service 를 수천 개 토큰으로 반복 호출하고
+처리량, 배치 효율, 만료 토큰 정리 결과를 출력합니다.
+
+실행 예::
+
+    python scripts/bench_push.py --tokens 5000 --rounds 5 --latency-ms 50 \
+        --failure-rate 0.01 --invalid-rate 0.02
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# 외부 인프라(MySQL, Firebase) 없이 실행되도록 기본값 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_SECONDS", "3600")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_SECONDS", "604800")
+os.environ["PUSH_TRANSPORT"] = "fake"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.push import (
+    FCM_MULTICAST_LIMIT,
+    FakePushTransport,
+    set_push_transport,
+)
+from app.models.device_push_token import DevicePushToken
+from app.schemas.device_push_token import FCMMessageRequest
+from app.services.device_push_token_service import (
+    send_fcm_notification_service,
+)
+
+SHOP_ID = 1
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="푸시 전송 경로 벤치마크")
+    parser.add_argument("--tokens", type=int, default=5000, help="샵 토큰 수")
+    parser.add_argument("--rounds", type=int, default=5, help="전송 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--failure-rate", type=float, default=0.01)
+    parser.add_argument("--invalid-rate", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    DevicePushToken.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    with session_factory() as db:
+        db.add_all(
+            DevicePushToken(
+                shop_id=SHOP_ID,
+                token=f"bench-token-{i:06d}",
+                platform="android",
+                is_active=True,
+            )
+            for i in range(args.tokens)
+        )
+        db.commit()
+
+    transport = FakePushTransport(
+        latency_ms=args.latency_ms,
+        failure_rate=args.failure_rate,
+        invalid_rate=args.invalid_rate,
+        seed=args.seed,
+    )
+    set_push_transport(transport)
+
+    request = FCMMessageRequest(shop_id=SHOP_ID, title="벤치마크", body="테스트")
+    print(  # noqa: T201
+        f"tokens={args.tokens} rounds={args.rounds} "
+        f"latency={args.latency_ms}ms failure={args.failure_rate} "
+        f"invalid={args.invalid_rate}",
+    )
+    print(  # noqa: T201
+        f"{'round':>5} {'active':>7} {'calls':>6} {'ok':>7} {'fail':>6} "
+        f"{'pruned':>7} {'sec':>7} {'tokens/s':>10}",
+    )
+
+    total_tokens = 0
+    total_elapsed = 0.0
+    for round_no in range(1, args.rounds + 1):
+        calls_before = transport.calls
+        with session_factory() as db:
+            active = (
+                db.query(func.count(DevicePushToken.id))
+                .filter(DevicePushToken.is_active.is_(True))
+                .scalar()
+            )
+            started = time.perf_counter()
+            result = send_fcm_notification_service(db, request, current_user=None)
+            elapsed = time.perf_counter() - started
+
+        total_tokens += active
+        total_elapsed += elapsed
+        print(  # noqa: T201
+            f"{round_no:>5} {active:>7} {transport.calls - calls_before:>6} "
+            f"{result.success_count:>7} {result.failure_count:>6} "
+            f"{result.pruned_count:>7} {elapsed:>7.3f} {active / elapsed:>10.0f}",
+        )
+
+    # 배치 효율: 실제 호출 1회당 토큰 수 / FCM 최대 허용치
+    efficiency = transport.tokens_sent / (transport.calls * FCM_MULTICAST_LIMIT)
+    print(  # noqa: T201
+        f"\nthroughput={total_tokens / total_elapsed:.0f} tokens/s "
+        f"calls={transport.calls} "
+        f"avg_tokens_per_call={transport.tokens_sent / transport.calls:.1f} "
+        f"batch_efficiency={efficiency:.1%}",
+    )
+
+
+if __name__ == "__main__":
+    main()
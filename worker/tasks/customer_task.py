@@ -0,0 +1,44 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.crud.treatment_crud import get_shop_ids_with_unlinked_customers
+from app.database import SessionLocal
+from app.exceptions import CustomException
+from app.services.customer_link_service import backfill_treatment_phonebooks_service
+from celery_app import celery_app
+
+DOMAIN = "customer_task"
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def backfill_treatment_customers(shop_id: int | None = None) -> int:
+    """전화번호부 미연결 예약(customer_phone만 있는 예약)을 전화번호부와 연결.
+
+    shop_id가 없으면 미연결 예약이 있는 모든 샵을 처리한다.
+    """
+    db: Session = SessionLocal()
+    linked = 0
+    try:
+        shop_ids = (
+            [shop_id]
+            if shop_id is not None
+            else get_shop_ids_with_unlinked_customers(db)
+        )
+        for target_shop_id in shop_ids:
+            linked += backfill_treatment_phonebooks_service(db, target_shop_id)
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=500,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+    finally:
+        db.close()
+
+    logger.info("Backfilled %s treatment customers", linked)
+    return linked
@@ -0,0 +1,113 @@
+import logging
+from datetime import timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_MAX_BATCHES,
+    OUTBOX_RETENTION_DAYS,
+)
+from app.crud.outbox_crud import (
+    delete_published_outbox_events,
+    get_unpublished_outbox_events,
+    increase_outbox_event_attempts,
+    mark_outbox_events_published,
+)
+from app.database import SessionLocal
+from app.exceptions import CustomException
+from app.services.outbox_service import handle_outbox_event, outbox_event_to_message
+from app.utils.datetime import now_utc
+from celery_app import celery_app
+
+DOMAIN = "outbox_task"
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def relay_outbox_events() -> int:
+    """미발행 아웃박스 이벤트를 배치 단위로 Celery 큐에 전달.
+
+    큐 전달 후 발행 처리(commit) 전에 죽으면 다음 실행에서 다시 전달되므로
+    소비자 입장에서는 최소 1회(at-least-once) 전달이 보장된다.
+    """
+    db: Session = SessionLocal()
+    relayed = 0
+    try:
+        for _ in range(OUTBOX_RELAY_MAX_BATCHES):
+            # SKIP LOCKED: 릴레이가 여러 개 떠 있어도 같은 행을 중복으로 잡지 않음
+            events = get_unpublished_outbox_events(db, OUTBOX_RELAY_BATCH_SIZE)
+            if not events:
+                break
+
+            published_ids: list[int] = []
+            failed_ids: list[int] = []
+            for event in events:
+                if failed_ids:
+                    failed_ids.append(event.id)
+                    continue
+                try:
+                    process_outbox_event.delay(outbox_event_to_message(event))
+                    published_ids.append(event.id)
+                except Exception:
+                    # 브로커 장애: 남은 이벤트는 다음 실행에서 재시도
+                    logger.exception("Failed to relay outbox event %s", event.id)
+                    failed_ids.append(event.id)
+
+            mark_outbox_events_published(db, published_ids, now_utc())
+            increase_outbox_event_attempts(db, failed_ids)
+            db.commit()
+            relayed += len(published_ids)
+
+            if failed_ids or len(events) < OUTBOX_RELAY_BATCH_SIZE:
+                break
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=500,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+    finally:
+        db.close()
+
+    if relayed:
+        logger.info("Relayed %s outbox events", relayed)
+    return relayed
+
+
+@celery_app.task(bind=True, acks_late=True, max_retries=5, default_retry_delay=10)
+def process_outbox_event(self, message: dict) -> None:  # noqa: ANN001
+    """아웃박스 이벤트 1건 처리 (실패 시 재시도)."""
+    db: Session = SessionLocal()
+    try:
+        handle_outbox_event(db, message)
+    except Exception as e:
+        db.rollback()
+        logger.warning("Outbox event %s failed: %s", message.get("id"), e)
+        raise self.retry(exc=e) from e
+    finally:
+        db.close()
+
+
+@celery_app.task
+def purge_outbox_events() -> int:
+    """보관 기간이 지난 발행 완료 이벤트 삭제."""
+    db: Session = SessionLocal()
+    try:
+        before = now_utc() - timedelta(days=OUTBOX_RETENTION_DAYS)
+        deleted = delete_published_outbox_events(db, before)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=500,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+    finally:
+        db.close()
+
+    return deleted
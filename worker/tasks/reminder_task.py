@@ -0,0 +1,24 @@
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.exceptions import CustomException
+from app.services.reminder_service import send_reservation_reminders_service
+from celery_app import celery_app
+
+DOMAIN = "reminder_task"
+
+
+@celery_app.task
+def send_reservation_reminders() -> dict[str, int]:
+    db: Session = SessionLocal()
+    try:
+        return send_reservation_reminders_service(db)
+    except SQLAlchemyError as e:
+        raise CustomException(
+            status_code=500,
+            domain=DOMAIN,
+            exception=e,
+        ) from e
+    finally:
+        db.close()
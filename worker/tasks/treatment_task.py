@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import timedelta
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -5,9 +6,12 @@ from sqlalchemy.orm import Session
 
 from app.crud.treatment_crud import get_treatments_to_autocomplete
 from app.database import SessionLocal
+from app.enum.outbox_event import OutboxEventType
 from app.exceptions import CustomException
 from app.models.treatment import Treatment
+from app.services.outbox_service import record_outbox_event
 from app.utils.datetime import now_kst
+from app.utils.redis.schedule import publish_schedule_event
 from celery_app import celery_app
 
 DOMAIN = "treatment_task"
@@ -22,11 +26,12 @@ def auto_complete_treatment() -> None:
         rows = get_treatments_to_autocomplete(db)
 
         # 완료 대상만 필터링
-        complete_ids = [
-            row.treatment_id
+        complete_rows = [
+            row
             for row in rows
             if now >= row.reserved_at + timedelta(minutes=float(row.total_duration_min))
         ]
+        complete_ids = [row.treatment_id for row in complete_rows]
 
         if complete_ids:
             db.query(Treatment).filter(Treatment.id.in_(complete_ids)).update(
@@ -36,8 +41,21 @@ def auto_complete_treatment() -> None:
                 },
                 synchronize_session=False,  # 중요, ORM 상태 추적없이 곧바로 sql 만 실행
             )
+            _record_completed_events(db, complete_rows)
 
         db.commit()
+
+        # 실시간 예약 보드에 상태 변경 전달
+        for row in complete_rows:
+            publish_schedule_event(
+                row.shop_id,
+                "treatment.status_changed",
+                {
+                    "id": row.treatment_id,
+                    "status": "COMPLETED",
+                    "finished_at": now.isoformat(),
+                },
+            )
     except SQLAlchemyError as e:
         db.rollback()
         raise CustomException(
@@ -54,3 +72,26 @@ def auto_complete_treatment() -> None:
         ) from e
     finally:
         db.close()
+
+
+def _record_completed_events(db: Session, rows: list) -> None:
+    """샵별 아웃박스 이벤트 1건씩 기록 (같은 트랜잭션, 대시보드 캐시 무효화용)."""
+    rows_by_shop = defaultdict(list)
+    for row in rows:
+        rows_by_shop[row.shop_id].append(row)
+
+    for shop_id, shop_rows in rows_by_shop.items():
+        treatment_ids = [row.treatment_id for row in shop_rows]
+        record_outbox_event(
+            db,
+            event_type=OutboxEventType.TREATMENT_UPDATED,
+            aggregate_id=treatment_ids[0],
+            payload={
+                "treatment_ids": treatment_ids,
+                "status": "COMPLETED",
+                "reserved_dates": sorted(
+                    {row.reserved_at.date().isoformat() for row in shop_rows},
+                ),
+            },
+            shop_id=shop_id,
+        )